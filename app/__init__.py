@@ -1,6 +1,38 @@
 from flask import Flask
 
-# __name__ is the package name - 'app', for locating templates and static files
-app = Flask(__name__)
+from app.config import Config
 
-from app import jobs
\ No newline at end of file
+
+def create_app(config=None):
+    """
+        Function to build the Flask app: default settings from app.config.Config (environment
+        variables), overridden by 'config' (a mapping), then the routes. Every app has its own
+        MongoDB client, caches and job_id allocator. Creating the app does not connect to
+        MongoDB; each process opens its own client on the first query.
+
+        Example:
+            app = create_app({"MONGO_URI": "mongodb://db:27017", "MONGO_MAX_POOL_SIZE": 50})
+        """
+    # __name__ is the package name - 'app', for locating templates and static files
+    app = Flask(__name__)
+    app.config.from_object(Config)
+    if config:
+        app.config.update(config)
+
+    if app.config['JSON_PROVIDER'] == 'orjson':
+        from app.fastjson import OrjsonProvider
+        app.json = OrjsonProvider(app)
+    elif app.config['JSON_PROVIDER'] != 'default':
+        raise ValueError(f"Unknown JSON_PROVIDER: {app.config['JSON_PROVIDER']} (allowed: orjson, default)")
+
+    # MongoDB client of this app
+    from app.db import Mongo
+    Mongo().init_app(app)
+
+    # Route modules (blueprints) and the per-app state of the job routes (caches, job_id allocator)
+    from app import jobs, bulk
+    app.register_blueprint(jobs.bp)
+    app.register_blueprint(bulk.bp)
+    jobs.init_app(app)
+
+    return app
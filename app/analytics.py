@@ -0,0 +1,434 @@
+"""This module keeps a columnar in-memory snapshot of the jobs for the salary analytics routes."""
+
+import threading
+import time
+from collections import OrderedDict
+from datetime import datetime, timezone
+
+import numpy as np
+
+from app import utils
+
+# Categorical columns: name -> (embedded document, field)
+CATEGORICAL_FIELDS = {
+    'industry': ('company', 'industry_name'),
+    'company': ('company', 'name'),
+    'company_size': ('company', 'size'),
+    'degree': ('education', 'level')
+}
+
+# Experience bands on the minimum years of experience (same ranges as the experience levels)
+EXPERIENCE_BANDS = ['Entry Level', 'Mid Level', 'Senior Level']
+
+# Dimensions the statistics can be grouped or filtered by
+DIMENSIONS = list(CATEGORICAL_FIELDS) + ['experience', 'remote']
+
+# Fields read from MongoDB to build the snapshot
+SNAPSHOT_PROJECTION = {
+    "_id": 0, "job_id": 1, "average_salary": 1, "years_min": 1, "years_max": 1, "remote": 1,
+    "company.industry_name": 1, "company.name": 1, "company.size": 1, "education.level": 1
+}
+
+DEFAULT_PERCENTILES = (10, 25, 50, 75, 90)
+
+# Results kept per snapshot version (one per distinct filters / grouping), least recently used out first
+MAX_CACHED_RESULTS = 256
+
+
+class AnalyticsError(ValueError):
+    """Raised when an analytics query names an unknown dimension or invalid parameter."""
+
+
+class Categories:
+    """
+        Dictionary encoding of one categorical column: each distinct value (compared
+        case-insensitively) gets an integer code, -1 stands for a missing value.
+        """
+
+    def __init__(self):
+        self.labels = []
+        self._codes = {}
+
+    def encode(self, value):
+        """
+            Function to get the code of a value, adding it when it is new.
+            """
+        if value is None:
+            return -1
+        key = utils.normalize_lookup(value)
+        code = self._codes.get(key)
+        if code is None:
+            code = self._codes[key] = len(self.labels)
+            self.labels.append(value)
+        return code
+
+    def lookup(self, value):
+        """
+            Function to get the code of a value without adding it (-2 matches no row).
+            """
+        return self._codes.get(utils.normalize_lookup(value), -2)
+
+
+def experience_bands(years_min):
+    """
+        Function to map minimum years of experience to band codes (-1 outside every band).
+        """
+    return np.select(
+        [(years_min >= 1) & (years_min <= 2), (years_min > 2) & (years_min < 5), years_min >= 5],
+        [0, 1, 2],
+        default=-1
+    ).astype(np.int32)
+
+
+def group_statistics(codes, values, labels, percentiles):
+    """
+        Function to compute count, mean, std, min, max and percentiles of 'values' per group
+        without a Python loop over rows: one sort by (group, value), then every statistic is
+        read from the group boundaries. Percentiles interpolate linearly like np.percentile.
+        Code -1 (missing) is reported as the group None.
+        """
+    groups = codes + 1
+    group_count = len(labels) + 1
+    order = np.lexsort((values, groups))
+    sorted_values = values[order]
+
+    counts = np.bincount(groups, minlength=group_count)
+    starts = np.concatenate(([0], np.cumsum(counts)[:-1]))
+    present = np.flatnonzero(counts)
+    counts, starts = counts[present], starts[present]
+
+    sums = np.bincount(groups, weights=values, minlength=group_count)[present]
+    squares = np.bincount(groups, weights=values * values, minlength=group_count)[present]
+    means = sums / counts
+    stds = np.sqrt(np.maximum(squares / counts - means * means, 0))
+
+    quantiles = {}
+    for percentile in percentiles:
+        position = starts + (counts - 1) * (percentile / 100)
+        lower = np.floor(position).astype(np.int64)
+        upper = np.ceil(position).astype(np.int64)
+        quantiles[percentile] = sorted_values[lower] + (
+            sorted_values[upper] - sorted_values[lower]
+        ) * (position - lower)
+
+    names = [None] + list(labels)
+    rows = []
+    for i, group in enumerate(present.tolist()):
+        rows.append({
+            "value": names[group],
+            "count": int(counts[i]),
+            "mean": round(float(means[i]), 2),
+            "std": round(float(stds[i]), 2),
+            "min": float(sorted_values[starts[i]]),
+            "max": float(sorted_values[starts[i] + counts[i] - 1]),
+            "percentiles": {f"p{p:g}": round(float(quantiles[p][i]), 2) for p in percentiles}
+        })
+    rows.sort(key=lambda row: (-row["count"], str(row["value"])))
+    return rows
+
+
+class SalarySnapshot:
+    """
+        Columnar copy of the fields the salary statistics need: NumPy arrays for the salary,
+        the experience bounds and the remote flag, and integer codes for the categorical
+        fields. Writes in this process call mark_changed(); the changed jobs are re-read in
+        one query before the next statistics, so the snapshot is never rebuilt for a write.
+        Reads pass the jobs generation of the request: when it is past the generation the
+        snapshot was loaded at plus the generations of this process's own writes, another
+        process wrote and the snapshot is reloaded. It is also reloaded after 'ttl' seconds.
+        """
+
+    def __init__(self, collection, ttl=300):
+        self.collection = collection
+        self.ttl = ttl
+        self._lock = threading.Lock()
+        self._pending = set()
+        self._loaded_at = None
+        # Jobs generation the snapshot is up to date with, and generations of pending local writes
+        self._generation = None
+        self._local_generations = set()
+        self.version = 0
+        self._results = OrderedDict()
+        self._reset(0)
+
+    def _reset(self, capacity):
+        self.size = 0
+        self.rows = {}  # job_id -> row
+        self.job_id = np.zeros(capacity, dtype=np.int64)
+        self.alive = np.zeros(capacity, dtype=bool)
+        self.salary = np.full(capacity, np.nan)
+        self.years_min = np.full(capacity, np.nan)
+        self.years_max = np.full(capacity, np.nan)
+        self.remote = np.full(capacity, -1, dtype=np.int8)
+        self.categories = {name: Categories() for name in CATEGORICAL_FIELDS}
+        self.codes = {name: np.full(capacity, -1, dtype=np.int32) for name in CATEGORICAL_FIELDS}
+
+    def _grow(self, capacity):
+        """
+            Function to enlarge every column to 'capacity' rows (amortized doubling on appends).
+            """
+        def grow(array, fill):
+            grown = np.full(capacity, fill, dtype=array.dtype)
+            grown[:len(array)] = array
+            return grown
+
+        self.job_id = grow(self.job_id, 0)
+        self.alive = grow(self.alive, False)
+        self.salary = grow(self.salary, np.nan)
+        self.years_min = grow(self.years_min, np.nan)
+        self.years_max = grow(self.years_max, np.nan)
+        self.remote = grow(self.remote, -1)
+        self.codes = {name: grow(codes, -1) for name, codes in self.codes.items()}
+
+    @staticmethod
+    def _number(value):
+        return float(value) if isinstance(value, (int, float)) and not isinstance(value, bool) else np.nan
+
+    def _write_row(self, row, job):
+        self.job_id[row] = job['job_id']
+        self.alive[row] = True
+        self.salary[row] = self._number(job.get('average_salary'))
+        self.years_min[row] = self._number(job.get('years_min'))
+        self.years_max[row] = self._number(job.get('years_max'))
+        remote = job.get('remote')
+        self.remote[row] = int(remote) if isinstance(remote, bool) else -1
+        for name, (parent, field) in CATEGORICAL_FIELDS.items():
+            embedded = job.get(parent)
+            value = embedded.get(field) if isinstance(embedded, dict) else None
+            self.codes[name][row] = self.categories[name].encode(value)
+
+    def _load(self, generation=None):
+        """
+            Function to rebuild the snapshot from the whole collection
+            ('generation' was read before, so the snapshot is at least that recent).
+            """
+        jobs = list(self.collection.find({"job_id": {"$exists": True}}, SNAPSHOT_PROJECTION))
+        self._reset(max(len(jobs), 1024))
+        for row, job in enumerate(jobs):
+            self._write_row(row, job)
+            self.rows[job['job_id']] = row
+        self.size = len(jobs)
+        self._pending.clear()
+        self._generation = generation
+        self._local_generations.clear()
+        self._loaded_at = time.monotonic()
+        self.loaded_at = datetime.now(timezone.utc)
+        self._changed()
+
+    def _apply(self, job_ids):
+        """
+            Function to re-read the given jobs in one query: new jobs are appended,
+            existing ones overwritten in place and deleted ones dropped.
+            """
+        found = set()
+        for job in self.collection.find({"job_id": {"$in": list(job_ids)}}, SNAPSHOT_PROJECTION):
+            row = self.rows.get(job['job_id'])
+            if row is None:
+                if self.size == len(self.job_id):
+                    self._grow(2 * len(self.job_id))
+                row = self.rows[job['job_id']] = self.size
+                self.size += 1
+            self._write_row(row, job)
+            found.add(job['job_id'])
+
+        for job_id in set(job_ids) - found:
+            row = self.rows.pop(job_id, None)
+            if row is not None:
+                self.alive[row] = False
+
+        # Compact once most rows are deleted ones
+        if self.size > 1024 and len(self.rows) < self.size // 2:
+            self._load(self._generation)
+        else:
+            self._changed()
+
+    def _changed(self):
+        self.version += 1
+        self._results = OrderedDict()
+
+    def mark_changed(self, job_ids, generation=None):
+        """
+            Function to record jobs written by this process (applied before the next read),
+            with the jobs generation the write bumped the collection to.
+            """
+        with self._lock:
+            self._pending.update(job_ids)
+            if generation is not None:
+                self._local_generations.add(generation)
+
+    def _is_stale(self, generation):
+        """
+            Function to tell whether a write of another process happened since the snapshot
+            was loaded: consecutive generations of this process's writes are patched in instead.
+            """
+        if generation is None:
+            return False
+        if self._generation is None:
+            return True
+        while self._generation + 1 in self._local_generations:
+            self._generation += 1
+        self._local_generations = {local for local in self._local_generations if local > self._generation}
+        return generation > self._generation
+
+    def _refresh(self, generation=None):
+        if (self._loaded_at is None or time.monotonic() - self._loaded_at > self.ttl
+                or self._is_stale(generation)):
+            self._load(generation)
+        elif self._pending:
+            pending, self._pending = self._pending, set()
+            self._apply(pending)
+
+    def _mask(self, filters):
+        """
+            Function to select the live rows with a salary that match every filter
+            ({dimension: value}, values compared case-insensitively).
+            """
+        size = self.size
+        mask = self.alive[:size] & ~np.isnan(self.salary[:size])
+        for name, value in filters.items():
+            if name in CATEGORICAL_FIELDS:
+                mask &= self.codes[name][:size] == self.categories[name].lookup(value)
+            elif name == 'experience':
+                bands = [band.lower() for band in EXPERIENCE_BANDS]
+                band = bands.index(value.lower()) if value.lower() in bands else -2
+                mask &= experience_bands(self.years_min[:size]) == band
+            elif name == 'remote':
+                mask &= self.remote[:size] == int(value)
+        return mask
+
+    def _dimension(self, name):
+        """
+            Function to get (codes, labels) of a dimension over the used rows.
+            """
+        size = self.size
+        if name in CATEGORICAL_FIELDS:
+            return self.codes[name][:size], self.categories[name].labels
+        if name == 'experience':
+            return experience_bands(self.years_min[:size]), EXPERIENCE_BANDS
+        if name == 'remote':
+            return self.remote[:size].astype(np.int32), [False, True]
+        raise AnalyticsError(f"Unknown dimension: {name} (allowed: {', '.join(DIMENSIONS)})")
+
+    def _cached(self, key, compute, generation=None):
+        """
+            Function to compute a result once per snapshot version
+            (at most MAX_CACHED_RESULTS are kept).
+            """
+        with self._lock:
+            self._refresh(generation)
+            result = self._results.get(key)
+            if result is None:
+                result = self._results[key] = compute()
+                if len(self._results) > MAX_CACHED_RESULTS:
+                    self._results.popitem(last=False)
+            else:
+                self._results.move_to_end(key)
+            return result
+
+    def info(self):
+        """
+            Function to describe the snapshot (returned with every analytics response).
+            """
+        return {
+            "jobs": len(self.rows),
+            "version": self.version,
+            "loaded_at": self.loaded_at.isoformat() if self._loaded_at is not None else None
+        }
+
+    def summary(self, filters=None, percentiles=DEFAULT_PERCENTILES, generation=None):
+        """
+            Function to compute the salary statistics of every job matching 'filters'
+            ('generation': jobs generation of the request, see _is_stale()).
+            """
+        filters = filters or {}
+
+        def compute():
+            values = self.salary[:self.size][self._mask(filters)]
+            rows = group_statistics(np.zeros(len(values), dtype=np.int32), values, ['all'], percentiles)
+            return rows[0] if rows else {"value": "all", "count": 0}
+
+        key = ('summary', tuple(sorted(filters.items())), tuple(percentiles))
+        return self._cached(key, compute, generation)
+
+    def grouped(self, dimension, filters=None, percentiles=DEFAULT_PERCENTILES, generation=None):
+        """
+            Function to compute the salary statistics per value of 'dimension'.
+            """
+        filters = filters or {}
+
+        def compute():
+            codes, labels = self._dimension(dimension)
+            mask = self._mask(filters)
+            return group_statistics(codes[mask], self.salary[:self.size][mask], labels, percentiles)
+
+        key = ('grouped', dimension, tuple(sorted(filters.items())), tuple(percentiles))
+        return self._cached(key, compute, generation)
+
+    def histogram(self, filters=None, bins=10, generation=None):
+        """
+            Function to count the salaries of the matching jobs in 'bins' equal-width bins.
+            """
+        filters = filters or {}
+
+        def compute():
+            values = self.salary[:self.size][self._mask(filters)]
+            if not len(values):
+                return []
+            counts, edges = np.histogram(values, bins=bins)
+            return [
+                {"min": float(edges[i]), "max": float(edges[i + 1]), "count": int(counts[i])}
+                for i in range(len(counts))
+            ]
+
+        key = ('histogram', tuple(sorted(filters.items())), bins)
+        return self._cached(key, compute, generation)
+
+
+def parse_filters(query_params):
+    """
+        Function to read the dimension filters of an analytics request
+        (?industry=...&degree=...&experience=...&remote=true ...).
+        """
+    filters = {}
+    for name in DIMENSIONS:
+        value = query_params.get(name, '').strip()
+        if not value:
+            continue
+        if name == 'remote':
+            if value.lower() not in ('true', 'false', '1', '0'):
+                raise AnalyticsError("Invalid remote. Please provide true or false.")
+            value = value.lower() in ('true', '1')
+        elif name == 'experience' and value.lower() not in [band.lower() for band in EXPERIENCE_BANDS]:
+            raise AnalyticsError(f"Unknown experience: {value} (allowed: {', '.join(EXPERIENCE_BANDS)})")
+        filters[name] = value
+    return filters
+
+
+def parse_percentiles(value):
+    """
+        Function to read the 'percentiles' parameter (comma-separated numbers from 0 to 100).
+        """
+    if not (value or '').strip():
+        return DEFAULT_PERCENTILES
+    try:
+        percentiles = tuple(dict.fromkeys(float(item) for item in value.split(',') if item.strip()))
+    except ValueError:
+        raise AnalyticsError("Invalid percentiles. Please provide comma-separated numbers.")
+    if not percentiles or any(not 0 <= p <= 100 for p in percentiles):
+        raise AnalyticsError("Invalid percentiles. Each one must be between 0 and 100.")
+    return percentiles
+
+
+def parse_bins(value, default=10, maximum=100):
+    """
+        Function to read the 'bins' parameter of the histogram.
+        """
+    if not (value or '').strip():
+        return default
+    try:
+        bins = int(value)
+    except ValueError:
+        raise AnalyticsError("Invalid bins. Please provide a valid integer.")
+    if not 1 <= bins <= maximum:
+        raise AnalyticsError(f"Invalid bins. Please provide a number between 1 and {maximum}.")
+    return bins
@@ -0,0 +1,390 @@
+"""This module serves the job API on ASGI, with the read routes running on the asyncio MongoDB driver.
+
+The lookup routes below are coroutines: while one waits on MongoDB the process serves other
+requests, instead of holding a thread per request for the whole round trip. Every other
+route (writes, bulk, search, aggregates, analytics, NDJSON streams) is passed unchanged to
+the Flask app in a thread pool, so URLs, status codes, headers and bodies are the same as
+the Flask app's and both can run side by side against the same database.
+
+Run with:
+    uvicorn app.asgi:asgi_app --port 5001
+"""
+
+import asyncio
+import io
+import os
+from functools import wraps
+
+from a2wsgi import WSGIMiddleware
+from a2wsgi.wsgi import build_environ
+from flask import jsonify, make_response, request
+from pymongo import AsyncMongoClient
+from werkzeug.exceptions import HTTPException
+from werkzeug.routing import Map, Rule
+
+from app import conditional, create_app, filters, jobs, pagination, projection, utils
+
+# The Flask app: its request context is used by the async views, and it answers every other route
+app = create_app()
+
+# The Flask app on ASGI, for every other route: a2wsgi runs it on a pool of ASGI_FLASK_THREADS
+# threads and sends the body chunk by chunk, so NDJSON streams stay streams
+flask_asgi = WSGIMiddleware(app, workers=int(os.environ.get('ASGI_FLASK_THREADS', 8)))
+
+# Async client (same settings as the Flask app's), opened on the first request: it belongs to the server's event loop
+mongo_async = {}
+
+# Routes answered by the coroutines of this module: endpoint -> view
+url_map = Map()
+views = {}
+
+# Lookup routes sharing one shape: rule -> (response key, lookup field, message of the 404)
+LOOKUP_ROUTES = {
+    '/jobs/industry/<value>': ('industry', 'normalized.industry', 'No jobs found for industry'),
+    '/jobs/location/<value>': ('location', 'normalized.location', 'No jobs found in location'),
+    '/jobs/skill/<value>': ('skill', 'normalized.skills', 'No jobs found requiring skill'),
+    '/jobs/company/<value>': ('company', 'normalized.company', 'No jobs found from company'),
+    '/jobs/degree/<value>': ('degree', 'normalized.degree', 'No jobs found requiring degree')
+}
+
+
+class PassToFlask(Exception):
+    """Raised by an async view to let the Flask app answer the request (e.g. NDJSON streams)."""
+
+
+def get_collection(name):
+    """
+        Function to get a collection of the async client, connecting on first use.
+        """
+    mongo = app.extensions['mongo']
+    if 'client' not in mongo_async:
+        mongo_async['client'] = AsyncMongoClient(mongo.uri, **mongo.options)
+    return mongo_async['client'][mongo.db_name][name]
+
+
+def route(rule):
+    """
+        Decorator to register an async GET view under a Flask-style rule.
+        """
+    def decorator(view):
+        url_map.add(Rule(rule, endpoint=view.__name__, methods=['GET']))
+        views[view.__name__] = view
+        return view
+    return decorator
+
+
+async def get_jobs_generation():
+    counter = await get_collection('counters').find_one({"_id": "jobs_generation"})
+    return counter['seq'] if counter else 0
+
+
+def generation_etag(view):
+    """
+        Decorator for the async list routes, same as conditional.generation_etag.
+        """
+    @wraps(view)
+    async def wrapper(*args, **kwargs):
+        etag = conditional.request_list_etag(await get_jobs_generation())
+        if request.if_none_match and request.if_none_match.contains(etag):
+            return conditional.vary_on_accept(conditional.not_modified(etag))
+
+        response = make_response(await view(*args, **kwargs))
+        if response.status_code == 200:
+            response.set_etag(etag)
+            conditional.vary_on_accept(response)
+        return response
+    return wrapper
+
+
+async def fetch_jobs_page(query, sort=jobs.JOB_ID_SORT):
+    """
+        Function to fetch one page of jobs for the current request, as jobs.fetch_jobs_page.
+        """
+    query_params = utils.parse_query_params(request.query_string)
+    limit, after = pagination.parse_page_params(query_params, sort)
+    fields = jobs.request_projection(jobs.required_fields(sort))
+
+    cursor = get_collection('jobs').find(
+        pagination.apply_cursor(query, sort, after), fields
+    ).sort(sort).limit(limit + 1)
+    jobs_list, next_cursor = pagination.take_page(await cursor.to_list(limit + 1), sort, limit)
+
+    page = {
+        "limit": limit,
+        "after": query_params.get('after'),
+        "next": next_cursor
+    }
+    return jobs.serialize_jobs(jobs_list), page
+
+
+async def fetch_facets(query, names):
+    """
+        Function to compute the facet counts of /jobs/query in one $facet aggregation.
+        """
+    cursor = await get_collection('jobs').aggregate(filters.build_facet_pipeline(query, names))
+    result = await cursor.to_list(1)
+    return filters.format_facets(result[0] if result else {})
+
+
+# Get complete job details by job_id
+@route('/jobs/<int:job_id>')
+async def get_job_by_id(job_id):
+    try:
+        fields = jobs.request_projection(["job_id", "version", "updated_at"])
+        representation = projection.projection_key(fields)
+
+        # Same job cache as the Flask routes: writes passed to Flask evict it in this process
+        use_cache = request.headers.get('X-Cache-Bypass', '').lower() not in ('1', 'true', 'yes')
+        if use_cache:
+            jobs.job_cache.observe(await get_jobs_generation())
+            entry = jobs.job_cache.get(job_id, representation)
+            if entry is not None:
+                return jobs.cached_job_response(job_id, entry)
+        generation = jobs.job_cache.generation
+
+        if request.if_none_match or request.if_modified_since:
+            current = await get_collection('jobs').find_one(
+                {"job_id": job_id}, {"_id": 0, "version": 1, "updated_at": 1}
+            )
+            if current:
+                etag = conditional.job_etag(job_id, current.get('version'), representation)
+                if conditional.is_not_modified(etag, current.get('updated_at')):
+                    return conditional.not_modified(etag, current.get('updated_at'))
+
+        result = await get_collection('jobs').find_one({"job_id": job_id}, fields)
+        if not result:
+            if use_cache and jobs.job_cache.negative:
+                jobs.job_cache.set(job_id, jobs.JOB_NOT_FOUND, representation, generation)
+            return jobs.job_not_found(job_id)
+
+        result = jobs.serialize_doc(result)
+        response = jsonify(result)
+        etag = conditional.job_etag(job_id, result.get('version'), representation)
+        response.set_etag(etag)
+        if result.get('updated_at'):
+            response.last_modified = conditional.as_utc(result['updated_at'])
+
+        if use_cache:
+            jobs.job_cache.set(
+                job_id, (response.get_data(), etag, result.get('updated_at')),
+                representation, generation
+            )
+            response.headers['X-Cache'] = 'MISS'
+        return response, 200
+
+    except jobs.QUERY_PARAM_ERRORS as e:
+        return jobs.query_param_error(e)
+
+    except Exception as e:
+        return jsonify({"error": str(e)}), 500
+
+
+# Get the jobs of an industry, location, skill, company or degree
+def lookup_view(key, field, message):
+    @generation_etag
+    async def view(value):
+        try:
+            # NDJSON streams are served by the Flask routes
+            if jobs.wants_stream():
+                raise PassToFlask()
+
+            jobs_list, page = await fetch_jobs_page({field: utils.normalize_lookup(value)})
+            if jobs_list or page["after"]:
+                return jsonify({
+                    key: value,
+                    "count": len(jobs_list),
+                    "jobs": jobs_list,
+                    "page": page
+                }), 200
+            else:
+                return jsonify({
+                    "error": f"{message}: {value}",
+                    key: value,
+                    "count": 0
+                }), 404
+
+        except jobs.QUERY_PARAM_ERRORS as e:
+            return jobs.query_param_error(e)
+
+        except PassToFlask:
+            raise
+
+        except Exception as e:
+            return jsonify({"error": str(e)}), 500
+
+    view.__name__ = f"get_jobs_by_{key}"
+    return view
+
+
+for rule, (key, field, message) in LOOKUP_ROUTES.items():
+    route(rule)(lookup_view(key, field, message))
+
+
+# Get jobs within a specific salary range
+@route('/jobs/salary')
+@generation_etag
+async def get_jobs_by_salary():
+    try:
+        query_params = utils.parse_query_params(request.query_string)
+        min_salary = int(query_params.get('min_salary', 0))
+        max_salary = int(query_params.get('max_salary', 999999999))
+        query = {"average_salary": {"$gte": min_salary, "$lte": max_salary}}
+
+        if jobs.wants_stream():
+            raise PassToFlask()
+
+        jobs_list, page = await fetch_jobs_page(query, jobs.SALARY_SORT)
+        if jobs_list or page["after"]:
+            return jsonify({
+                "salary_range": {
+                    "min": min_salary,
+                    "max": max_salary
+                },
+                "count": len(jobs_list),
+                "jobs": jobs_list,
+                "page": page
+            }), 200
+        else:
+            return jsonify({
+                "error": f"No jobs found with salary between ${min_salary} and ${max_salary}",
+                "salary_range": {
+                    "min": min_salary,
+                    "max": max_salary
+                },
+                "count": 0
+            }), 404
+
+    except jobs.QUERY_PARAM_ERRORS as e:
+        return jobs.query_param_error(e)
+
+    except ValueError:
+        return jsonify({
+            "error": "Invalid salary values. Please provide valid integers.",
+            "hint": "Example: /jobs/salary?min_salary=50000&max_salary=100000"
+        }), 400
+
+    except PassToFlask:
+        raise
+
+    except Exception as e:
+        return jsonify({"error": str(e)}), 500
+
+
+# Search jobs with any combination of filters, optionally with facet counts
+@route('/jobs/query')
+@generation_etag
+async def query_jobs():
+    try:
+        query_params = utils.parse_query_params(request.query_string)
+        query, applied = filters.build_job_filter(query_params)
+        facet_names = filters.parse_facets(query_params.get('facets'))
+        sort_name = query_params.get('sort', 'job_id').strip().lower()
+        if sort_name not in jobs.QUERY_SORTS:
+            raise filters.FilterError(
+                f"Unknown sort: {sort_name} (allowed: {', '.join(jobs.QUERY_SORTS)})"
+            )
+
+        if jobs.wants_stream():
+            raise PassToFlask()
+
+        # The page and the facet counts are independent queries: run them concurrently
+        if facet_names:
+            (jobs_list, page), facets = await asyncio.gather(
+                fetch_jobs_page(query, jobs.QUERY_SORTS[sort_name]), fetch_facets(query, facet_names)
+            )
+        else:
+            jobs_list, page = await fetch_jobs_page(query, jobs.QUERY_SORTS[sort_name])
+
+        result = {
+            "filters": applied,
+            "sort": sort_name,
+            "count": len(jobs_list),
+            "jobs": jobs_list,
+            "page": page
+        }
+        if facet_names:
+            result["facets"] = facets
+
+        if jobs_list or page["after"]:
+            return jsonify(result), 200
+        else:
+            return jsonify({
+                "error": "No jobs found matching the filters",
+                "filters": applied,
+                "count": 0,
+                **({"facets": result["facets"]} if facet_names else {})
+            }), 404
+
+    except filters.FilterError as e:
+        return jsonify({
+            "error": str(e),
+            "allowed_filters": filters.FILTER_PARAMS,
+            "hint": "Example: /jobs/query?industry=Finance&remote=true&min_salary=80000&facets=1"
+        }), 400
+
+    except jobs.QUERY_PARAM_ERRORS as e:
+        return jobs.query_param_error(e)
+
+    except PassToFlask:
+        raise
+
+    except Exception as e:
+        return jsonify({"error": str(e)}), 500
+
+
+async def call_async_view(scope, endpoint, args):
+    """
+        Function to run an async view in a Flask request context; returns the response,
+        or None when the view passes the request to the Flask app.
+        """
+    with app.request_context(build_environ(scope, io.BytesIO())):
+        try:
+            return make_response(await views[endpoint](**args))
+        except PassToFlask:
+            return None
+
+
+async def send_response(response, send):
+    await send({
+        'type': 'http.response.start',
+        'status': response.status_code,
+        'headers': [(name.lower().encode('latin-1'), value.encode('latin-1'))
+                    for name, value in response.headers.items()]
+    })
+    await send({'type': 'http.response.body', 'body': response.get_data()})
+
+
+async def lifespan(receive, send):
+    while True:
+        message = await receive()
+        if message['type'] == 'lifespan.startup':
+            await send({'type': 'lifespan.startup.complete'})
+        elif message['type'] == 'lifespan.shutdown':
+            if 'client' in mongo_async:
+                await mongo_async.pop('client').close()
+            flask_asgi.executor.shutdown(wait=False)
+            await send({'type': 'lifespan.shutdown.complete'})
+            return
+
+
+async def asgi_app(scope, receive, send):
+    """
+        ASGI entry point: GET requests for the routes of this module run as coroutines,
+        everything else goes to the Flask app.
+        """
+    if scope['type'] == 'lifespan':
+        return await lifespan(receive, send)
+
+    if scope['type'] == 'http' and scope['method'] == 'GET':
+        # Match the path below the mount point (root_path), as Flask does
+        path = scope['path'].removeprefix(scope.get('root_path', ''))
+        try:
+            endpoint, args = url_map.bind('localhost').match(path, 'GET')
+        except HTTPException:
+            pass
+        else:
+            response = await call_async_view(scope, endpoint, args)
+            if response is not None:
+                return await send_response(response, send)
+
+    await flask_asgi(scope, receive, send)
@@ -0,0 +1,322 @@
+from flask import Blueprint, request, jsonify
+import json
+from pymongo import UpdateOne
+from pymongo.errors import BulkWriteError
+
+# Job helpers shared with the single-job routes (same validation and derived fields)
+from app import jobs
+
+# Bulk routes, registered on the app by create_app()
+bp = Blueprint('bulk', __name__)
+
+# Items written to MongoDB per bulk_write / insert_many call
+BULK_BATCH_SIZE = 1000
+
+NDJSON_MIMETYPE = 'application/x-ndjson'
+
+# Parse a bulk request body: a JSON array, or NDJSON (one JSON value per line)
+# Returns a list of (item, error) pairs so a bad line only fails that item
+def parse_bulk_body():
+    if request.mimetype == NDJSON_MIMETYPE:
+        items = []
+        for line in request.get_data(as_text=True).splitlines():
+            if not line.strip():
+                continue
+            try:
+                items.append((json.loads(line), None))
+            except ValueError:
+                items.append((None, {"error": "Invalid JSON"}))
+        return items
+
+    body = request.get_json(force=True, silent=True)
+    if not isinstance(body, list):
+        return None
+    return [(item, None) for item in body]
+
+# job_ids are integers (JSON true/false are not)
+def is_job_id(value):
+    return isinstance(value, int) and not isinstance(value, bool)
+
+# Split a list into batches of BULK_BATCH_SIZE
+def batches(items):
+    for start in range(0, len(items), BULK_BATCH_SIZE):
+        yield items[start:start + BULK_BATCH_SIZE]
+
+# Summary returned by every bulk route; each result carries the item's index in the request
+# 'totals' adds route-specific counters (e.g. matched / modified for updates)
+def bulk_summary(results, **totals):
+    results = sorted(results, key=lambda result: result["index"])
+    succeeded = sum(1 for result in results if result["status"] < 400)
+    return jsonify({
+        "total": len(results),
+        "succeeded": succeeded,
+        "failed": len(results) - succeeded,
+        **totals,
+        "results": results
+    }), 200
+
+# Run the write hooks (cache invalidation) for the items that were written
+# (updates that left a job unchanged are reported with "modified": false and skipped)
+def notify_changes(results):
+    changed = [
+        result["job_id"] for result in results
+        if result["status"] < 400 and result.get("modified", True)
+    ]
+    if changed:
+        jobs.on_jobs_changed(changed)
+
+# Insert documents with one unordered insert_many; returns {position: write error} of the failed ones
+# (unordered: the other documents were still inserted)
+def insert_documents(documents):
+    try:
+        jobs.jobs_collection.insert_many(documents, ordered=False)
+    except BulkWriteError as e:
+        return {write_error["index"]: write_error for write_error in e.details.get("writeErrors", [])}
+    return {}
+
+# Duplicate key error: job_id is the only unique field set by the app (each _id is a new ObjectId)
+def is_duplicate_job_id(write_error):
+    return write_error.get("code") == 11000
+
+# Current version of each existing job among 'job_id_list' (missing jobs are left out)
+def job_versions(job_id_list):
+    return {
+        job["job_id"]: job.get("version")
+        for job in jobs.jobs_collection.find({"job_id": {"$in": job_id_list}}, {"_id": 0, "job_id": 1, "version": 1})
+    }
+
+# Invalid bulk body
+def bulk_body_error():
+    return jsonify({
+        "error": "Request body must be a JSON array or NDJSON (application/x-ndjson)",
+        "hint": "Example: [{\"title\": \"Data Analyst\", \"company\": {\"name\": \"Acme\", \"industry_name\": \"Finance\"}}]"
+    }), 400
+
+# Create many job posts at once
+@bp.route("/jobs/bulk", methods=['POST'])
+def bulk_create_jobs():
+    """
+    Create many job posts at once, with the same validation as /create/jobPost.
+    Valid jobs get consecutive job_ids and are inserted with unordered insert_many batches.
+
+    Example:
+        POST http://localhost:5000/jobs/bulk
+        Body: [{"title": "Data Analyst", "company": {"name": "Acme", "industry_name": "Finance"}}, ...]
+    """
+    try:
+        items = parse_bulk_body()
+        if items is None:
+            return bulk_body_error()
+
+        results = []
+        valid = []
+        for index, (body, error) in enumerate(items):
+            error = error or jobs.validate_new_job(body)
+            if error:
+                results.append({"index": index, "status": 400, **error})
+            else:
+                valid.append((index, body))
+
+        # Reserve every job_id with a single round trip
+        if valid:
+            new_ids = jobs.job_ids.reserve(len(valid))
+            for (index, body), job_id in zip(valid, new_ids):
+                jobs.prepare_new_job(body, job_id)
+
+        for batch in batches(valid):
+            documents = [body for _, body in batch]
+            failed = insert_documents(documents)
+
+            # job_ids taken by jobs the counter did not hand out: re-seed and retry those once,
+            # as /create/jobPost does
+            retry = [position for position, write_error in failed.items() if is_duplicate_job_id(write_error)]
+            if retry:
+                jobs.job_ids.resync()
+                for position, job_id in zip(retry, jobs.job_ids.reserve(len(retry))):
+                    documents[position].pop('_id', None)
+                    jobs.prepare_new_job(documents[position], job_id)
+                retried = insert_documents([documents[position] for position in retry])
+                for i, position in enumerate(retry):
+                    if i in retried:
+                        failed[position] = retried[i]
+                    else:
+                        del failed[position]
+
+            for position, (index, body) in enumerate(batch):
+                if position in failed:
+                    results.append({
+                        "index": index, "status": 500, "error": failed[position].get("errmsg", "Write error")
+                    })
+                else:
+                    results.append({
+                        "index": index,
+                        "status": 201,
+                        "job_id": body["job_id"],
+                        "inserted_id": str(body["_id"])
+                    })
+
+        notify_changes(results)
+        return bulk_summary(results)
+
+    except Exception as e:
+        print(e)
+        return jsonify({"error": f"Server error: {str(e)}"}), 500
+
+# Partially update many job posts at once
+@bp.route("/jobs/bulk", methods=['PUT'])
+def bulk_update_jobs():
+    """
+    Partially update many job posts at once, with the same validation as PUT /job/<job_id>.
+    Each item names its job with job_id; updates run as unordered bulk_write batches.
+
+    Example:
+        PUT http://localhost:5000/jobs/bulk
+        Body: [{"job_id": 0, "average_salary": 95000}, {"job_id": 1, "remote": false}]
+    """
+    try:
+        items = parse_bulk_body()
+        if items is None:
+            return bulk_body_error()
+
+        results = []
+        valid = []
+        seen = set()
+        for index, (body, error) in enumerate(items):
+            if not error and (not isinstance(body, dict) or not is_job_id(body.get("job_id"))):
+                error = {"error": "job_id (integer) is required"}
+            if not error and body["job_id"] in seen:
+                # A job is updated once per request: merge the fields into one item instead
+                error = {"error": f"Duplicate job_id {body['job_id']} in the request", "job_id": body["job_id"]}
+            if not error:
+                fields, error = jobs.validate_job_update(body)
+            if error:
+                results.append({"index": index, "status": 400, **error})
+            else:
+                seen.add(body["job_id"])
+                valid.append((index, body["job_id"], fields))
+
+        matched = modified = 0
+        for batch in batches(valid):
+            # One query to find which jobs exist (missing ones are reported as 404) and their
+            # versions: only a modified job gets a new version, so unchanged items can be told apart
+            job_id_list = [job_id for _, job_id, _ in batch]
+            existing = job_versions(job_id_list)
+
+            operations = []
+            positions = []
+            for index, job_id, fields in batch:
+                if job_id not in existing:
+                    results.append({
+                        "index": index,
+                        "status": 404,
+                        "error": f"Job with ID {job_id} not found",
+                        "job_id": job_id
+                    })
+                    continue
+                operations.append(UpdateOne(
+                    jobs.build_change_filter(job_id, fields), jobs.build_job_update(fields)
+                ))
+                positions.append((index, job_id, fields))
+
+            failed = {}
+            if operations:
+                try:
+                    result = jobs.jobs_collection.bulk_write(operations, ordered=False)
+                    counts = (result.matched_count, result.modified_count)
+                except BulkWriteError as e:
+                    for write_error in e.details.get("writeErrors", []):
+                        failed[write_error["index"]] = write_error.get("errmsg", "Write error")
+                    counts = (e.details.get("nMatched", 0), e.details.get("nModified", 0))
+                matched += counts[0]
+                modified += counts[1]
+
+                # The change filter only matches when a value differs: every job matched, every
+                # job modified, or else compare versions to find the ones that changed
+                if counts[1] == 0:
+                    changed = set()
+                elif counts[1] == len(operations):
+                    changed = {job_id for _, job_id, _ in positions}
+                else:
+                    after = job_versions([job_id for _, job_id, _ in positions])
+                    changed = {job_id for job_id, version in after.items() if version != existing[job_id]}
+
+            for position, (index, job_id, fields) in enumerate(positions):
+                if position in failed:
+                    results.append({"index": index, "status": 500, "error": failed[position], "job_id": job_id})
+                elif job_id in changed:
+                    results.append({
+                        "index": index,
+                        "status": 200,
+                        "job_id": job_id,
+                        "modified": True,
+                        "updated_fields": list(fields.keys())
+                    })
+                else:
+                    # Same answer as PUT /job/<job_id> when the values are unchanged
+                    results.append({
+                        "index": index,
+                        "status": 200,
+                        "job_id": job_id,
+                        "modified": False,
+                        "message": "No modifications made (values unchanged)",
+                        "fields_checked": list(fields.keys())
+                    })
+
+        notify_changes(results)
+        return bulk_summary(results, matched=matched, modified=modified)
+
+    except Exception as e:
+        print(e)
+        return jsonify({"error": f"Server error: {str(e)}"}), 500
+
+# Delete many job posts at once
+@bp.route("/jobs/bulk", methods=['DELETE'])
+def bulk_delete_jobs():
+    """
+    Delete many job posts at once. Items are job_ids or {"job_id": <id>} objects.
+
+    Example:
+        DELETE http://localhost:5000/jobs/bulk
+        Body: [379, 380, {"job_id": 381}]
+    """
+    try:
+        items = parse_bulk_body()
+        if items is None:
+            return bulk_body_error()
+
+        results = []
+        valid = []
+        for index, (body, error) in enumerate(items):
+            job_id = body.get("job_id") if isinstance(body, dict) else body
+            if not error and not is_job_id(job_id):
+                error = {"error": "job_id (integer) is required"}
+            if error:
+                results.append({"index": index, "status": 400, **error})
+            else:
+                valid.append((index, job_id))
+
+        for batch in batches(valid):
+            job_id_list = [job_id for _, job_id in batch]
+            existing = set(jobs.jobs_collection.distinct("job_id", {"job_id": {"$in": job_id_list}}))
+
+            # A single delete_many for the whole batch
+            if existing:
+                jobs.jobs_collection.delete_many({"job_id": {"$in": list(existing)}})
+
+            for index, job_id in batch:
+                if job_id in existing:
+                    results.append({"index": index, "status": 200, "job_id": job_id})
+                else:
+                    results.append({
+                        "index": index,
+                        "status": 404,
+                        "error": f"Job with ID {job_id} not found",
+                        "job_id": job_id
+                    })
+
+        notify_changes(results)
+        return bulk_summary(results)
+
+    except Exception as e:
+        print(e)
+        return jsonify({"error": f"Server error: {str(e)}"}), 500
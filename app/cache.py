@@ -0,0 +1,248 @@
+"""This module caches rendered API responses in process memory."""
+
+import threading
+import time
+from collections import OrderedDict
+from functools import wraps
+from flask import Response, make_response, request
+
+
+class ResponseCache:
+    """
+        Time-limited, size-bounded cache of rendered responses, keyed by path and the query
+        parameters the route reads; past 'capacity' entries the least recently used go first.
+        Writes to the jobs collection call invalidate(), so within a process an entry is
+        never stale. With cached_response(cache, get_generation) entries are also keyed by
+        the collection generation every write bumps, so writes made by other processes are
+        seen on the next request; otherwise the TTL bounds how long they can be missed.
+        """
+
+    def __init__(self, ttl=300, capacity=1024):
+        self.ttl = ttl
+        self.capacity = capacity
+        self._entries = OrderedDict()
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+        self.invalidations = 0
+        # Bumped by invalidate(): a response computed before a write is not stored after it
+        self.generation = 0
+        # Latest collection generation seen by observe()
+        self.source_generation = None
+
+    def get(self, key):
+        """
+            Function to get a cached entry, or None when it is missing or expired.
+            """
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None and entry[0] > time.monotonic():
+                self._entries.move_to_end(key)
+                self.hits += 1
+                return entry[1]
+            self._entries.pop(key, None)
+            self.misses += 1
+            return None
+
+    def set(self, key, value, generation=None):
+        """
+            Function to store an entry for 'ttl' seconds. When the cache is full the expired
+            entries are purged first, then the least recently used ones.
+            When 'generation' is given and a write happened since, the entry is dropped.
+            """
+        if self.capacity <= 0:
+            return
+        with self._lock:
+            if generation is not None and generation != self.generation:
+                return
+            now = time.monotonic()
+            if key not in self._entries and len(self._entries) >= self.capacity:
+                for expired in [name for name, entry in self._entries.items() if entry[0] <= now]:
+                    del self._entries[expired]
+                while len(self._entries) >= self.capacity:
+                    self._entries.popitem(last=False)
+            self._entries[key] = (now + self.ttl, value)
+            self._entries.move_to_end(key)
+
+    def observe(self, source_generation):
+        """
+            Function to drop every entry once a newer collection generation is seen
+            (a write made by any process), so entries of older generations do not pile up.
+            """
+        with self._lock:
+            if self.source_generation is None or source_generation > self.source_generation:
+                # After a write in this process the entries are already gone (invalidate())
+                if self._entries:
+                    self._entries.clear()
+                    self.invalidations += 1
+                self.source_generation = source_generation
+
+    def invalidate(self):
+        """
+            Function to drop every entry (called after writes).
+            """
+        with self._lock:
+            self._entries.clear()
+            self.invalidations += 1
+            self.generation += 1
+
+    def stats(self):
+        """
+            Function to report the hit/miss counters.
+            """
+        with self._lock:
+            lookups = self.hits + self.misses
+            return {
+                "entries": len(self._entries),
+                "capacity": self.capacity,
+                "ttl_seconds": self.ttl,
+                "hits": self.hits,
+                "misses": self.misses,
+                "hit_rate": round(self.hits / lookups, 4) if lookups else 0.0,
+                "invalidations": self.invalidations
+            }
+
+
+class LRUCache:
+    """
+        Size-bounded, least-recently-used cache of rendered job bodies, keyed by job_id.
+        Each job_id holds one entry per representation (projection), so evict(job_id)
+        drops every representation of a job at once; every representation counts toward
+        'capacity'. With observe() the cache is emptied when another process writes,
+        and entries also expire after 'ttl' seconds.
+        """
+
+    def __init__(self, capacity=1024, ttl=60, negative=True):
+        self.capacity = capacity
+        self.ttl = ttl
+        # Also remember job_ids that were not found (answered with 404)
+        self.negative = negative
+        self._entries = OrderedDict()
+        # Number of representations held, across all job_ids
+        self._size = 0
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self.invalidations = 0
+        self.generation = 0
+        self.source_generation = None
+
+    def get(self, key, variant=b''):
+        """
+            Function to get a cached entry and mark it as recently used, or None on a miss.
+            """
+        with self._lock:
+            variants = self._entries.get(key)
+            entry = variants.get(variant) if variants else None
+            if entry is not None and entry[0] > time.monotonic():
+                self._entries.move_to_end(key)
+                self.hits += 1
+                return entry[1]
+            if entry is not None:
+                del variants[variant]
+                self._size -= 1
+                if not variants:
+                    del self._entries[key]
+            self.misses += 1
+            return None
+
+    def set(self, key, value, variant=b'', generation=None):
+        """
+            Function to store an entry, evicting the least recently used job_ids over capacity.
+            When 'generation' is given and an eviction happened since, the entry is dropped.
+            """
+        if self.capacity <= 0:
+            return
+        with self._lock:
+            if generation is not None and generation != self.generation:
+                return
+            variants = self._entries.setdefault(key, {})
+            if variant not in variants:
+                self._size += 1
+            variants[variant] = (time.monotonic() + self.ttl, value)
+            self._entries.move_to_end(key)
+            while self._size > self.capacity:
+                _, evicted = self._entries.popitem(last=False)
+                self._size -= len(evicted)
+
+    def observe(self, source_generation):
+        """
+            Function to drop every entry once a newer collection generation is seen
+            (a write made by another process), as ResponseCache.observe.
+            """
+        with self._lock:
+            if self.source_generation is None or source_generation > self.source_generation:
+                if self._entries:
+                    self._entries.clear()
+                    self._size = 0
+                    self.invalidations += 1
+                # Results read before this generation must not be stored
+                self.generation += 1
+                self.source_generation = source_generation
+
+    def evict(self, key, source_generation=None):
+        """
+            Function to drop every representation of one job (called after it is written).
+            'source_generation' is the generation the write produced: when it directly follows
+            the observed one, the other jobs stay cached.
+            """
+        with self._lock:
+            self.generation += 1
+            if source_generation is not None and self.source_generation == source_generation - 1:
+                self.source_generation = source_generation
+            variants = self._entries.pop(key, None)
+            if variants is not None:
+                self._size -= len(variants)
+                self.evictions += 1
+
+    def stats(self):
+        """
+            Function to report the size and hit/miss counters.
+            """
+        with self._lock:
+            lookups = self.hits + self.misses
+            return {
+                "entries": self._size,
+                "jobs": len(self._entries),
+                "capacity": self.capacity,
+                "ttl_seconds": self.ttl,
+                "negative_caching": self.negative,
+                "hits": self.hits,
+                "misses": self.misses,
+                "hit_rate": round(self.hits / lookups, 4) if lookups else 0.0,
+                "evictions": self.evictions,
+                "invalidations": self.invalidations
+            }
+
+
+def cached_response(cache, get_generation=None, params=()):
+    """
+        Decorator to serve a route from 'cache'. Only 200 responses are stored,
+        as the rendered body, so a hit skips both MongoDB and JSON encoding.
+        'get_generation' returns the collection generation of the request: it is part of
+        the key, so a body is only served for the generation it was computed at.
+        'params' are the query parameters the route reads (first value, as
+        utils.parse_query_params): other parameters do not add entries.
+        """
+    def decorator(view):
+        @wraps(view)
+        def wrapper(*args, **kwargs):
+            key = (request.path, tuple((name, request.args[name]) for name in params if name in request.args))
+            if get_generation is not None:
+                source_generation = get_generation()
+                cache.observe(source_generation)
+                key = (source_generation,) + key
+
+            entry = cache.get(key)
+            if entry is not None:
+                body, mimetype = entry
+                return Response(body, status=200, mimetype=mimetype)
+
+            generation = cache.generation
+            response = make_response(view(*args, **kwargs))
+            if response.status_code == 200:
+                cache.set(key, (response.get_data(), response.mimetype), generation)
+            return response
+        return wrapper
+    return decorator
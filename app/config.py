@@ -0,0 +1,42 @@
+"""This module holds the default settings of the app; each one can be set with an environment variable."""
+
+import os
+
+
+def env_int(name, default=None):
+    value = os.environ.get(name)
+    return int(value) if value else default
+
+
+class Config:
+    """
+        Default configuration, read by create_app(); pass a mapping to create_app() to override it.
+        """
+    # MongoDB connection
+    MONGO_URI = os.environ.get('MONGO_URI', 'mongodb://localhost:27017')
+    MONGO_DB = os.environ.get('MONGO_DB', 'careerhub')
+    # Connection pool of each process: at most MONGO_MAX_POOL_SIZE sockets, MONGO_MIN_POOL_SIZE kept open
+    MONGO_MAX_POOL_SIZE = env_int('MONGO_MAX_POOL_SIZE', 100)
+    MONGO_MIN_POOL_SIZE = env_int('MONGO_MIN_POOL_SIZE', 0)
+    # Timeouts in milliseconds (None: the driver default)
+    MONGO_CONNECT_TIMEOUT_MS = env_int('MONGO_CONNECT_TIMEOUT_MS', 5000)
+    MONGO_SERVER_SELECTION_TIMEOUT_MS = env_int('MONGO_SERVER_SELECTION_TIMEOUT_MS', 5000)
+    MONGO_SOCKET_TIMEOUT_MS = env_int('MONGO_SOCKET_TIMEOUT_MS')
+    MONGO_WAIT_QUEUE_TIMEOUT_MS = env_int('MONGO_WAIT_QUEUE_TIMEOUT_MS')
+    # primary, primaryPreferred, secondary, secondaryPreferred or nearest
+    MONGO_READ_PREFERENCE = os.environ.get('MONGO_READ_PREFERENCE', 'primary')
+
+    # Response caches: the aggregate routes keep AGGREGATE_CACHE_SIZE responses for AGGREGATE_CACHE_TTL
+    # seconds; /jobs/<job_id> keeps JOB_CACHE_SIZE responses for JOB_CACHE_TTL seconds (JOB_CACHE_NEGATIVE: also 404s)
+    AGGREGATE_CACHE_TTL = env_int('AGGREGATE_CACHE_TTL', 300)
+    AGGREGATE_CACHE_SIZE = env_int('AGGREGATE_CACHE_SIZE', 256)
+    JOB_CACHE_SIZE = env_int('JOB_CACHE_SIZE', 1024)
+    JOB_CACHE_TTL = env_int('JOB_CACHE_TTL', 60)
+    JOB_CACHE_NEGATIVE = os.environ.get('JOB_CACHE_NEGATIVE', '1') == '1'
+    # Seconds after which the salary analytics snapshot is fully reloaded
+    ANALYTICS_TTL = env_int('ANALYTICS_TTL', 300)
+    # job_ids reserved per round trip by each process (1: one id per new job)
+    JOB_ID_BLOCK_SIZE = env_int('JOB_ID_BLOCK_SIZE', 1)
+
+    # JSON encoder of the responses: 'orjson' (fast) or 'default' (Flask's, stdlib json)
+    JSON_PROVIDER = os.environ.get('JSON_PROVIDER', 'orjson')
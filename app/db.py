@@ -0,0 +1,103 @@
+"""This module manages the MongoDB client of each app: created lazily, once per process, from the app config."""
+
+import os
+import threading
+from flask import current_app
+from pymongo import MongoClient
+from pymongo.read_preferences import read_pref_mode_from_name
+from werkzeug.local import LocalProxy
+
+# MongoClient options set from the config: config key -> MongoClient keyword
+CLIENT_OPTIONS = {
+    'MONGO_MAX_POOL_SIZE': 'maxPoolSize',
+    'MONGO_MIN_POOL_SIZE': 'minPoolSize',
+    'MONGO_CONNECT_TIMEOUT_MS': 'connectTimeoutMS',
+    'MONGO_SERVER_SELECTION_TIMEOUT_MS': 'serverSelectionTimeoutMS',
+    'MONGO_SOCKET_TIMEOUT_MS': 'socketTimeoutMS',
+    'MONGO_WAIT_QUEUE_TIMEOUT_MS': 'waitQueueTimeoutMS',
+    'MONGO_READ_PREFERENCE': 'readPreference'
+}
+
+
+class Mongo:
+    """
+        Holds the connection settings of one app and its client in the current process;
+        create_app() gives every app its own, in app.extensions['mongo']. Nothing touches the
+        network until the first query, and a process forked from one that already had a client
+        (e.g. a preforking server with the app preloaded) creates its own: a MongoClient must
+        not be shared across fork.
+        """
+
+    def __init__(self):
+        self.uri = 'mongodb://localhost:27017'
+        self.db_name = 'careerhub'
+        self.options = {}
+        self._client = None
+        self._pid = None
+        self._lock = threading.Lock()
+
+    def init_app(self, app):
+        """
+            Function to read the connection settings from the app config.
+            """
+        self.configure(app.config)
+        app.extensions['mongo'] = self
+
+    def configure(self, config):
+        """
+            Function to set the connection settings from a config mapping (MONGO_* keys).
+            """
+        self.uri = config.get('MONGO_URI', self.uri)
+        self.db_name = config.get('MONGO_DB', self.db_name)
+        self.options = {
+            option: config[key] for key, option in CLIENT_OPTIONS.items()
+            if config.get(key) is not None
+        }
+        if 'readPreference' in self.options:
+            # Fail at startup rather than on the first query
+            try:
+                read_pref_mode_from_name(self.options['readPreference'])
+            except ValueError:
+                raise ValueError(f"Unknown MONGO_READ_PREFERENCE: {self.options['readPreference']}")
+        self.reset()
+
+    def reset(self):
+        """
+            Function to drop the current client (a new one is created on next use).
+            """
+        with self._lock:
+            client, self._client = self._client, None
+            if client is not None and self._pid == os.getpid():
+                client.close()
+
+    @property
+    def client(self):
+        """
+            The MongoClient of this process, created on first use.
+            """
+        if self._client is None or self._pid != os.getpid():
+            with self._lock:
+                if self._client is None or self._pid != os.getpid():
+                    # A client inherited through fork is dropped, never used or closed here
+                    self._client = MongoClient(self.uri, **self.options)
+                    self._pid = os.getpid()
+        return self._client
+
+    @property
+    def db(self):
+        return self.client[self.db_name]
+
+
+def current_mongo():
+    """
+        Function to get the Mongo of the current app.
+        """
+    return current_app.extensions['mongo']
+
+
+def collection(name):
+    """
+        Function to get a stand-in for a collection of the current app that resolves it on
+        every use, so modules can hold collections at import time without connecting.
+        """
+    return LocalProxy(lambda: current_mongo().db[name])
@@ -0,0 +1,67 @@
+"""This module provides an orjson-based JSON provider for the app."""
+
+import dataclasses
+import decimal
+import uuid
+from datetime import date
+
+import orjson
+from bson.objectid import ObjectId
+from flask.json.provider import JSONProvider
+from werkzeug.http import http_date
+
+# Same output conventions as Flask's default provider: sorted keys, non-string keys allowed
+# and dates as HTTP dates (orjson would write RFC 3339), so responses keep their shape
+ORJSON_OPTIONS = (
+    orjson.OPT_SORT_KEYS | orjson.OPT_NON_STR_KEYS | orjson.OPT_PASSTHROUGH_DATETIME
+    | orjson.OPT_SERIALIZE_NUMPY
+)
+
+
+def default(value):
+    """
+        Function to encode the types orjson does not handle itself (as Flask's default provider does,
+        plus ObjectId, so documents need no copy with a string _id).
+        """
+    if isinstance(value, ObjectId):
+        return str(value)
+    if isinstance(value, date):
+        return http_date(value)
+    if isinstance(value, (decimal.Decimal, uuid.UUID)):
+        return str(value)
+    if dataclasses.is_dataclass(value):
+        return dataclasses.asdict(value)
+    if hasattr(value, '__html__'):
+        return str(value.__html__())
+    raise TypeError(f"Object of type {type(value).__name__} is not JSON serializable")
+
+
+def encode(obj):
+    """
+        Function to encode a value to JSON bytes.
+        """
+    return orjson.dumps(obj, default=default, option=ORJSON_OPTIONS)
+
+
+class OrjsonProvider(JSONProvider):
+    """
+        JSON provider using orjson, selected with JSON_PROVIDER = 'orjson' (the default).
+        """
+
+    mimetype = 'application/json'
+
+    def dumps_bytes(self, obj):
+        """
+            Function to encode a value to JSON bytes (responses are written without a str copy).
+            """
+        return encode(obj)
+
+    def dumps(self, obj, **kwargs):
+        return self.dumps_bytes(obj).decode('utf-8')
+
+    def loads(self, s, **kwargs):
+        return orjson.loads(s)
+
+    def response(self, *args, **kwargs):
+        obj = self._prepare_response_obj(args, kwargs)
+        return self._app.response_class(self.dumps_bytes(obj) + b'\n', mimetype=self.mimetype)
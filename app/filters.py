@@ -0,0 +1,260 @@
+"""This module compiles the /jobs/query filter parameters into one MongoDB query and facet pipeline."""
+
+from app import utils
+
+# Experience levels as ranges on the minimum years of experience
+EXPERIENCE_LEVELS = {
+    "entry level": {"$gte": 1, "$lte": 2},
+    "mid level": {"$gt": 2, "$lt": 5},
+    "senior level": {"$gte": 5}
+}
+
+# Employment types as stored in the jobs, keyed by their lowercase form
+EMPLOYMENT_TYPES = {
+    employment_type.lower(): employment_type
+    for employment_type in ['Full-time', 'Part-time', 'Contract', 'Internship']
+}
+
+# Exact-match filters on the lowercase shadow fields (each has a (field, job_id) index)
+LOOKUP_FILTERS = {
+    'industry': 'normalized.industry',
+    'location': 'normalized.location',
+    'company': 'normalized.company',
+    'degree': 'normalized.degree'
+}
+
+# Display field of each lookup filter, used to label the per-group salary rankings
+LOOKUP_LABELS = {
+    'industry': 'company.industry_name',
+    'location': 'company.headquarters',
+    'company': 'company.name',
+    'degree': 'education.level'
+}
+
+# Every filter parameter /jobs/query understands
+FILTER_PARAMS = list(LOOKUP_FILTERS) + [
+    'skill', 'min_salary', 'max_salary', 'experience_level', 'min_years', 'max_years',
+    'remote', 'employment_type'
+]
+
+# Lower bounds of the salary facet buckets; the last bucket is open-ended
+SALARY_BUCKETS = [0, 50000, 75000, 100000, 125000, 150000]
+# Upper bound of the last bucket (jobs without a numeric salary are counted as 'other')
+SALARY_CEILING = 1000000000
+
+# Facet pipelines, run side by side with $facet over the filtered jobs
+FACETS = {
+    'industry': [
+        {"$group": {"_id": "$company.industry_name", "count": {"$sum": 1}}},
+        {"$sort": {"count": -1, "_id": 1}}
+    ],
+    'degree': [
+        {"$group": {"_id": "$education.level", "count": {"$sum": 1}}},
+        {"$sort": {"count": -1, "_id": 1}}
+    ],
+    'remote': [
+        {"$group": {"_id": "$remote", "count": {"$sum": 1}}},
+        {"$sort": {"count": -1, "_id": 1}}
+    ],
+    'employment_type': [
+        {"$group": {"_id": "$employment_type", "count": {"$sum": 1}}},
+        {"$sort": {"count": -1, "_id": 1}}
+    ],
+    'salary': [
+        {"$bucket": {
+            "groupBy": "$average_salary",
+            "boundaries": SALARY_BUCKETS + [SALARY_CEILING],
+            "default": "other",
+            "output": {"count": {"$sum": 1}}
+        }}
+    ]
+}
+
+
+class FilterError(ValueError):
+    """Raised when a /jobs/query filter or facet parameter is invalid."""
+
+
+def parse_int(query_params, name):
+    """
+        Function to read an optional integer parameter (None when absent).
+        """
+    value = query_params.get(name, '').strip()
+    if not value:
+        return None
+    try:
+        return int(value)
+    except ValueError:
+        raise FilterError(f"Invalid {name}. Please provide a valid integer.")
+
+
+def parse_list(value):
+    """
+        Function to split a comma-separated parameter into its non-empty values.
+        """
+    return [item.strip() for item in value.split(',') if item.strip()]
+
+
+def build_job_filter(query_params):
+    """
+        Function to compile the filter parameters into a single query: every filter given
+        must hold (AND), and each one is an equality or range on an indexed field.
+        Returns (query, applied) where 'applied' echoes the filters that were used.
+        """
+    conditions = []
+    applied = {}
+
+    # industry, location, company, degree: exact, case-insensitive
+    for name, field in LOOKUP_FILTERS.items():
+        value = query_params.get(name, '').strip()
+        if value:
+            conditions.append({field: utils.normalize_lookup(value)})
+            applied[name] = value
+
+    # skill: comma-separated, the job must list all of them
+    skills = parse_list(query_params.get('skill', ''))
+    if skills:
+        wanted = list(dict.fromkeys(utils.normalize_lookup(skill) for skill in skills))
+        conditions.append({"normalized.skills": wanted[0] if len(wanted) == 1 else {"$all": wanted}})
+        applied['skill'] = skills
+
+    # Salary range on average_salary
+    min_salary = parse_int(query_params, 'min_salary')
+    max_salary = parse_int(query_params, 'max_salary')
+    salary = {}
+    if min_salary is not None:
+        salary["$gte"] = min_salary
+    if max_salary is not None:
+        salary["$lte"] = max_salary
+    if salary:
+        conditions.append({"average_salary": salary})
+        applied['salary_range'] = {"min": min_salary, "max": max_salary}
+
+    # Experience: a level and/or an explicit range of years, as in /jobs/experience
+    experience_level = query_params.get('experience_level', '').strip().lower()
+    if experience_level:
+        if experience_level not in EXPERIENCE_LEVELS:
+            raise FilterError(f"Unknown experience level: {experience_level.title()} "
+                              f"(allowed: {', '.join(level.title() for level in EXPERIENCE_LEVELS)})")
+        conditions.append({"years_min": EXPERIENCE_LEVELS[experience_level]})
+        applied['experience_level'] = experience_level.title()
+    min_years = parse_int(query_params, 'min_years')
+    max_years = parse_int(query_params, 'max_years')
+    if min_years is not None:
+        conditions.append({"years_min": {"$gte": min_years}})
+    if max_years is not None:
+        conditions.append({"years_max": {"$lte": max_years}})
+    if min_years is not None or max_years is not None:
+        applied['years_range'] = {"min": min_years, "max": max_years}
+
+    # remote: true / false
+    remote = query_params.get('remote', '').strip().lower()
+    if remote:
+        if remote not in ('true', 'false', '1', '0'):
+            raise FilterError("Invalid remote. Please provide true or false.")
+        conditions.append({"remote": remote in ('true', '1')})
+        applied['remote'] = remote in ('true', '1')
+
+    # employment_type: comma-separated, any of them
+    employment_types = parse_list(query_params.get('employment_type', ''))
+    if employment_types:
+        unknown = [value for value in employment_types if value.lower() not in EMPLOYMENT_TYPES]
+        if unknown:
+            raise FilterError(f"Unknown employment type: {', '.join(unknown)} "
+                              f"(allowed: {', '.join(EMPLOYMENT_TYPES.values())})")
+        stored = list(dict.fromkeys(EMPLOYMENT_TYPES[value.lower()] for value in employment_types))
+        conditions.append({"employment_type": stored[0] if len(stored) == 1 else {"$in": stored}})
+        applied['employment_type'] = stored
+
+    if not conditions:
+        query = {}
+    elif len(conditions) == 1:
+        query = conditions[0]
+    else:
+        query = {"$and": conditions}
+    return query, applied
+
+
+def parse_facets(value):
+    """
+        Function to read the 'facets' parameter: '1' / 'true' / 'all' for every facet,
+        or a comma-separated list of facet names. Returns the facet names (possibly none).
+        """
+    value = (value or '').strip().lower()
+    if value in ('', '0', 'false'):
+        return []
+    if value in ('1', 'true', 'all'):
+        return list(FACETS)
+
+    names = parse_list(value)
+    unknown = [name for name in names if name not in FACETS]
+    if unknown:
+        raise FilterError(f"Unknown facet: {', '.join(unknown)} (allowed: {', '.join(FACETS)})")
+    return list(dict.fromkeys(names))
+
+
+def build_facet_pipeline(query, names):
+    """
+        Function to build the aggregation computing the requested facets over every
+        job matching 'query' (not only the current page) in one $facet stage.
+        """
+    return [
+        {"$match": query},
+        {"$facet": {name: FACETS[name] for name in names}}
+    ]
+
+
+def format_facets(result):
+    """
+        Function to turn the $facet output into {facet: [{"value", "count"}, ...]};
+        salary buckets are returned as {"min", "max", "count"} (max is None for the last
+        bucket, min and max are None for jobs without a salary).
+        """
+    facets = {}
+    for name, buckets in result.items():
+        if name == 'salary':
+            upper = dict(zip(SALARY_BUCKETS, SALARY_BUCKETS[1:]))
+            facets[name] = [
+                {"min": None, "max": None, "count": bucket["count"]} if bucket["_id"] == "other" else
+                {"min": bucket["_id"], "max": upper.get(bucket["_id"]), "count": bucket["count"]}
+                for bucket in buckets
+            ]
+        else:
+            facets[name] = [{"value": bucket["_id"], "count": bucket["count"]} for bucket in buckets]
+    return facets
+
+
+def build_top_salary_pipeline(query, group_by, n, groups, projection):
+    """
+        Function to build the aggregation ranking the n best-paid jobs of each 'group_by'
+        value among the jobs matching 'query'. The matches are read in ranking order from the
+        (average_salary desc, job_id asc) index and $firstN keeps the first n of each group,
+        so memory is bounded by groups x n; every matching job is still read once (to count
+        the group's jobs), so the cost grows with the number of matches. Groups come back in
+        name order (at most 'groups' of them), each job carries its 'rank' in its group,
+        '_group' and the group's '_total' jobs.
+        """
+    label = LOOKUP_LABELS[group_by]
+    ranked = {"rank": 1, "_group": 1, "_total": 1, "_label": 1}
+    # An inclusion projection must list the ranking fields, an exclusion one keeps them anyway
+    if any(value for value in projection.values()):
+        projection = dict(projection, **ranked)
+
+    return [
+        {"$match": query},
+        {"$sort": {"average_salary": -1, "job_id": 1}},
+        {"$group": {
+            "_id": f"${LOOKUP_FILTERS[group_by]}",
+            "label": {"$first": f"${label}"},
+            "total": {"$sum": 1},
+            "top": {"$firstN": {"n": n, "input": "$$ROOT"}}
+        }},
+        {"$sort": {"_id": 1}},
+        {"$limit": groups},
+        {"$unwind": {"path": "$top", "includeArrayIndex": "rank"}},
+        {"$replaceRoot": {"newRoot": {"$mergeObjects": [
+            "$top",
+            {"rank": {"$add": ["$rank", 1]}, "_group": "$_id", "_label": "$label", "_total": "$total"}
+        ]}}},
+        {"$project": projection}
+    ]
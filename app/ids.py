@@ -0,0 +1,85 @@
+"""This module allocates job_ids atomically from a counters collection."""
+
+import os
+import threading
+from pymongo import ReturnDocument
+
+
+class JobIdAllocator:
+    """
+        Hands out job_ids from a counter document: {"_id": "job_id", "seq": <last id reserved>}.
+        Each reservation is a single findOneAndUpdate with $inc, so concurrent workers never
+        receive the same id. With block_size > 1 a process reserves a range of ids at once
+        and hands them out locally; ids left in a block when the process exits are skipped.
+        """
+
+    def __init__(self, counters_collection, jobs_collection, name='job_id', block_size=1):
+        self.counters_collection = counters_collection
+        self.jobs_collection = jobs_collection
+        self.name = name
+        self.block_size = max(1, int(block_size))
+
+        self._lock = threading.Lock()
+        self._next = 0
+        self._end = -1  # empty block
+        self._seeded = False
+        self._pid = os.getpid()
+
+    def seed(self):
+        """
+            Function to start the counter at the current highest job_id.
+            $max only ever raises the counter, so this is safe to run concurrently and repeatedly.
+            """
+        max_job = self.jobs_collection.find_one(
+            {}, {"job_id": 1}, sort=[("job_id", -1)]
+        )
+        max_job_id = max_job['job_id'] if max_job else 0
+        self.counters_collection.update_one(
+            {"_id": self.name},
+            {"$max": {"seq": max_job_id}},
+            upsert=True
+        )
+        self._seeded = True
+
+    def resync(self):
+        """
+            Function to re-seed the counter and drop the local block,
+            e.g. after a job was inserted with an id the counter did not hand out.
+            """
+        with self._lock:
+            self._end = -1
+            self.seed()
+
+    def reserve(self, count):
+        """
+            Function to reserve 'count' consecutive ids with one round trip.
+            Returns the reserved ids as a range.
+            """
+        if not self._seeded:
+            self.seed()
+        counter = self.counters_collection.find_one_and_update(
+            {"_id": self.name},
+            {"$inc": {"seq": count}},
+            upsert=True,
+            return_document=ReturnDocument.AFTER
+        )
+        last = counter['seq']
+        return range(last - count + 1, last + 1)
+
+    def next_id(self):
+        """
+            Function to get the next job_id, reserving a new block when the local one is used up.
+            """
+        with self._lock:
+            # A block reserved before a fork belongs to the parent process
+            if self._pid != os.getpid():
+                self._pid = os.getpid()
+                self._end = -1
+
+            if self._next > self._end:
+                block = self.reserve(self.block_size)
+                self._next, self._end = block.start, block.stop - 1
+
+            job_id = self._next
+            self._next += 1
+            return job_id
@@ -0,0 +1,108 @@
+"""This module creates the MongoDB indexes used by the job routes and backfills the derived fields."""
+
+from datetime import datetime, timezone
+from pymongo import ASCENDING, DESCENDING, TEXT, UpdateOne
+
+from app import utils
+
+# Relevance weights of the searchable fields: a word in the title counts ten times one in the description
+TEXT_WEIGHTS = {"title": 10, "skills": 5, "responsibilities": 2, "description": 1}
+
+# Indexes on the jobs collection: (keys, options)
+# The lookup routes match exactly on the lowercase shadow fields under 'normalized',
+# job_id is appended so keyset pages come back in job_id order straight from the index
+JOB_INDEXES = [
+    ([("job_id", ASCENDING)], {"name": "job_id_unique", "unique": True}),
+    ([("normalized.industry", ASCENDING), ("job_id", ASCENDING)], {"name": "industry_job_id"}),
+    ([("normalized.location", ASCENDING), ("job_id", ASCENDING)], {"name": "location_job_id"}),
+    ([("normalized.company", ASCENDING), ("job_id", ASCENDING)], {"name": "company_job_id"}),
+    ([("normalized.skills", ASCENDING), ("job_id", ASCENDING)], {"name": "skills_job_id"}),  # multikey
+    ([("normalized.degree", ASCENDING), ("job_id", ASCENDING)], {"name": "degree_job_id"}),
+    # Salary range queries page in (average_salary, job_id) order
+    ([("average_salary", ASCENDING), ("job_id", ASCENDING)], {"name": "salary_job_id"}),
+    # Salary rankings (/jobs/top-salary) read the best-paid jobs first, ties in job_id order
+    ([("average_salary", DESCENDING), ("job_id", ASCENDING)], {"name": "salary_desc_job_id"}),
+    # Experience queries are ranges on the parsed minimum years
+    ([("years_min", ASCENDING), ("job_id", ASCENDING)], {"name": "years_min_job_id"}),
+    # Keyword search (/jobs/search); a collection has at most one text index
+    ([("title", TEXT), ("skills", TEXT), ("responsibilities", TEXT), ("description", TEXT)], {
+        "name": "job_text",
+        "weights": TEXT_WEIGHTS,
+        "default_language": "english"
+    }),
+]
+
+
+def ensure_indexes(jobs_collection):
+    """
+        Function to create the indexes on the jobs collection.
+        create_index is idempotent, so it is safe to call on every startup.
+        """
+    created = []
+    for keys, options in JOB_INDEXES:
+        created.append(jobs_collection.create_index(keys, **options))
+    return created
+
+
+def derived_fields(job):
+    """
+        Function to compute every field derived from a job's own data:
+        the lowercase lookup fields and the numeric experience bounds.
+        """
+    fields = {"normalized": utils.build_normalized_fields(job)}
+    fields.update(utils.build_experience_fields(job))
+    return fields
+
+
+def backfill_derived_fields(jobs_collection, batch_size=1000, force=False):
+    """
+        Function to populate the derived fields ('normalized', 'years_min', 'years_max')
+        on documents that were imported without them (e.g. an older jobs.json).
+        With force=True every document is rewritten.
+        """
+    query = {} if force else {"$or": [
+        {"normalized": {"$exists": False}},
+        {"years_min": {"$exists": False}}
+    ]}
+    projection = {"company": 1, "education": 1, "skills": 1, "years_of_experience": 1}
+
+    updated = 0
+    batch = []
+    for job in jobs_collection.find(query, projection):
+        batch.append(UpdateOne(
+            {"_id": job["_id"]},
+            {"$set": derived_fields(job)}
+        ))
+        # Flush a full batch
+        if len(batch) >= batch_size:
+            updated += jobs_collection.bulk_write(batch, ordered=False).modified_count
+            batch = []
+
+    # Flush the remaining updates
+    if batch:
+        updated += jobs_collection.bulk_write(batch, ordered=False).modified_count
+
+    return updated
+
+
+def backfill_versions(jobs_collection):
+    """
+        Function to give documents imported without them a first version and updated_at
+        (used for the ETag / Last-Modified headers).
+        """
+    result = jobs_collection.update_many(
+        {"version": {"$exists": False}},
+        {"$set": {"version": 1, "updated_at": datetime.now(timezone.utc)}}
+    )
+    return result.modified_count
+
+
+def bootstrap(jobs_collection):
+    """
+        Function to prepare the jobs collection: backfill the derived fields, then build the indexes.
+        """
+    updated = backfill_derived_fields(jobs_collection)
+    backfill_versions(jobs_collection)
+    created = ensure_indexes(jobs_collection)
+    print(f"✓ Backfilled {updated} jobs, ensured indexes: {', '.join(created)}")
+    return created
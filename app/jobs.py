@@ -1,25 +1,95 @@
-from app import app
 from bson.json_util import dumps, loads
-from flask import request, jsonify
+from flask import Blueprint, current_app, g, request, jsonify, make_response, Response
+from werkzeug.local import LocalProxy
 import json
 import ast # helper library for parsing data from string
-from importlib.machinery import SourceFileLoader
-from pymongo import MongoClient
+from pymongo import ASCENDING, DESCENDING, ReturnDocument
+from pymongo.errors import DuplicateKeyError
 from bson.objectid import ObjectId
-from datetime import datetime
-import re
+from datetime import datetime, timezone
 
-# 1. Connect to the client 
-client = MongoClient(host="localhost", port=27017)
+# Import the utils and helper modules
+from app import analytics, cache, conditional, fastjson, filters, ids, indexes, pagination, projection, streaming, utils
+from app.db import collection, current_mongo
 
-# Import the utils module
-utils = SourceFileLoader('*', './app/utils.py').load_module()
+# Job routes, registered on the app by create_app(); init-db stays a top-level CLI command
+bp = Blueprint('jobs', __name__, cli_group=None)
 
-# 2. Select the database
-db = client.careerhub # 'use mydb'
-# Select the collection
-jobs_collection = db.jobs  # Collection: jobs
-industries_collection = db.industries
+# 1. Database and collections: stand-ins resolved on each use through the current app, so
+# importing this module does not connect; each app opens its client on its first query (app/db.py)
+db = LocalProxy(lambda: current_mongo().db)
+jobs_collection = collection('jobs')  # Collection: jobs
+industries_collection = collection('industries')
+counters_collection = collection('counters')  # Collection: counters (job_id sequence)
+
+# State of the job routes kept per app (see init_app()), also resolved through the current app
+def app_state(name):
+    return LocalProxy(lambda: current_app.extensions['jobs'][name])
+
+# Atomic job_id allocator; JOB_ID_BLOCK_SIZE > 1 lets each process reserve ids in blocks
+job_ids = app_state('job_ids')
+
+# Cache for the aggregate routes (count-by-industry, top-salary, companies/hiring), cleared by
+# every write; entries are keyed by the jobs generation, so writes of other processes are seen too
+aggregate_cache = app_state('aggregate_cache')
+
+# Read-through cache of rendered /jobs/<job_id> bodies, evicted on every write to a job
+job_cache = app_state('job_cache')
+
+# Columnar snapshot behind the /analytics/salary routes, patched for every write in this process
+# and reloaded when the jobs generation shows a write of another process (or after ANALYTICS_TTL seconds)
+salary_snapshot = app_state('salary_snapshot')
+
+# Create the state of the job routes for 'app' from its config (called by create_app())
+def init_app(app):
+    config = app.config
+    app.extensions['jobs'] = {
+        'job_ids': ids.JobIdAllocator(
+            counters_collection, jobs_collection, block_size=config['JOB_ID_BLOCK_SIZE']
+        ),
+        'aggregate_cache': cache.ResponseCache(
+            ttl=config['AGGREGATE_CACHE_TTL'], capacity=config['AGGREGATE_CACHE_SIZE']
+        ),
+        'job_cache': cache.LRUCache(
+            capacity=config['JOB_CACHE_SIZE'],
+            ttl=config['JOB_CACHE_TTL'],
+            negative=config['JOB_CACHE_NEGATIVE']
+        ),
+        'salary_snapshot': analytics.SalarySnapshot(jobs_collection, ttl=config['ANALYTICS_TTL'])
+    }
+
+# Marker stored in job_cache for job_ids that do not exist
+JOB_NOT_FOUND = 'not-found'
+
+# Hide the internal lowercase lookup fields from API responses
+DEFAULT_PROJECTION = projection.FULL_PROJECTION
+
+# Invalid query parameters (answered with 400)
+QUERY_PARAM_ERRORS = (pagination.PaginationError, projection.ProjectionError)
+
+# Sort orders for keyset pagination (job_id last so every position is unique)
+JOB_ID_SORT = [("job_id", ASCENDING)]
+SALARY_SORT = [("average_salary", ASCENDING), ("job_id", ASCENDING)]
+EXPERIENCE_SORT = [("years_min", ASCENDING), ("job_id", ASCENDING)]
+SKILL_MATCH_SORT = [("match_count", DESCENDING), ("job_id", ASCENDING)]
+SEARCH_SORT = [("score", DESCENDING), ("job_id", ASCENDING)]
+# Salary rankings, served by the (average_salary desc, job_id asc) index
+TOP_SALARY_SORT = [("average_salary", DESCENDING), ("job_id", ASCENDING)]
+
+# /jobs/top-salary: jobs per ranking (default, maximum) and groups per response (default, maximum)
+TOP_SALARY_N = (5, 100)
+TOP_SALARY_GROUPS = (20, 100)
+# Query parameters of /jobs/top-salary (its cache key)
+TOP_SALARY_PARAMS = filters.FILTER_PARAMS + ['n', 'group_by', 'groups', 'fields']
+
+# Longest search query accepted by /jobs/search
+MAX_SEARCH_LENGTH = 200
+
+# Experience levels as ranges on the minimum years of experience (shared with /jobs/query)
+EXPERIENCE_LEVELS = filters.EXPERIENCE_LEVELS
+
+# Sort orders /jobs/query accepts in 'sort'
+QUERY_SORTS = {"job_id": JOB_ID_SORT, "salary": SALARY_SORT, "experience": EXPERIENCE_SORT}
 
 # Convert MongoDB ObjectId to string for JSON serialization
 def serialize_doc(doc):
@@ -27,8 +97,228 @@ def serialize_doc(doc):
         doc['_id'] = str(doc['_id'])  
     return doc
 
+# Prepare a page of jobs for the response: the orjson provider encodes ObjectIds itself,
+# so the documents are returned as they are; Flask's default provider needs serialize_doc
+def serialize_jobs(jobs_list):
+    if isinstance(current_app.json, fastjson.OrjsonProvider):
+        return jobs_list
+    return [serialize_doc(job) for job in jobs_list]
+
+# Projection for the 'fields' query parameter of the current request
+# 'required' fields are always returned (sort keys for the cursor, computed fields)
+def request_projection(required=()):
+    query_params = utils.parse_query_params(request.query_string)
+    return projection.build_projection(query_params.get('fields'), required)
+
+# Fields a list query must return: the sort keys plus any fields computed by its pipeline
+def required_fields(sort, computed=()):
+    return [field for field, _ in sort] + list(computed)
+
+# Fetch one page of jobs using the 'limit', 'after' and 'fields' query parameters of the current request
+# With 'stages' the query runs as an aggregation: $match on query, then the stages, then the page
+def fetch_jobs_page(query, sort=JOB_ID_SORT, stages=None, computed=()):
+    query_params = utils.parse_query_params(request.query_string)
+    limit, after = pagination.parse_page_params(query_params, sort)
+    fields = request_projection(required_fields(sort, computed))
+
+    if stages is None:
+        jobs_list, next_cursor = pagination.fetch_page(
+            jobs_collection, query, sort, limit, after, fields
+        )
+    else:
+        jobs_list, next_cursor = pagination.aggregate_page(
+            jobs_collection, [{"$match": query}] + stages, sort, limit, after, fields
+        )
+
+    # Serialize all jobs
+    jobs_list = serialize_jobs(jobs_list)
+
+    # Page info returned to the client: pass 'next' as 'after' to get the following page
+    page = {
+        "limit": limit,
+        "after": query_params.get('after'),
+        "next": next_cursor
+    }
+    return jobs_list, page
+
+# Stream every matching job as NDJSON (from 'after' on, up to 'limit' if one is given)
+def stream_jobs(query, sort=JOB_ID_SORT, stages=None, computed=()):
+    query_params = utils.parse_query_params(request.query_string)
+    limit, after = pagination.parse_stream_params(query_params, sort)
+    fields = request_projection(required_fields(sort, computed))
+
+    # Live cursor fetched in batches; each document is serialized as it is written
+    if stages is None:
+        cursor = jobs_collection.find(
+            pagination.apply_cursor(query, sort, after), fields
+        ).sort(sort).batch_size(streaming.STREAM_BATCH_SIZE)
+        if limit:
+            cursor = cursor.limit(limit)
+    else:
+        pipeline = pagination.build_pipeline(
+            [{"$match": query}] + stages, sort, after, fields, limit
+        )
+        cursor = jobs_collection.aggregate(pipeline, batchSize=streaming.STREAM_BATCH_SIZE)
+
+    return streaming.ndjson_response(cursor, serialize_doc)
+
+# Check whether the current request asked for an NDJSON stream
+def wants_stream():
+    query_params = utils.parse_query_params(request.query_string)
+    return streaming.wants_stream(request, query_params)
+
+# Response for a job not found
+def job_not_found(job_id):
+    return jsonify({
+        "error": f"Job with ID {job_id} not found",
+        "job_id": job_id
+    }), 404
+
+# Build a /jobs/<job_id> response from a job_cache entry (no MongoDB round trip)
+def cached_job_response(job_id, entry):
+    if entry == JOB_NOT_FOUND:
+        response = make_response(job_not_found(job_id))
+    else:
+        body, etag, last_modified = entry
+        if conditional.is_not_modified(etag, last_modified):
+            response = conditional.not_modified(etag, last_modified)
+        else:
+            response = Response(body, status=200, mimetype='application/json')
+            response.set_etag(etag)
+            if last_modified is not None:
+                response.last_modified = conditional.as_utc(last_modified)
+    response.headers['X-Cache'] = 'HIT'
+    return response
+
+# Invalid 'limit', 'after' or 'fields' parameters
+def query_param_error(e):
+    return jsonify({
+        "error": str(e),
+        "hint": "Use 'limit' for the page size, pass the 'next' value of a response as 'after', "
+                "and 'fields' as a preset (summary, full) or a comma-separated field list"
+    }), 400
+
+# Collection-level generation number, bumped by every write: the list ETags are derived from it
+def get_jobs_generation():
+    counter = counters_collection.find_one({"_id": "jobs_generation"})
+    return counter['seq'] if counter else 0
+
+# Generation of the current request, read once: the list ETag and the cached body
+# (aggregate_cache, salary_snapshot) of a response always come from the same generation
+def request_jobs_generation():
+    if 'jobs_generation' not in g:
+        g.jobs_generation = get_jobs_generation()
+    return g.jobs_generation
+
+# Returns the new generation
+def bump_jobs_generation():
+    counter = counters_collection.find_one_and_update(
+        {"_id": "jobs_generation"}, {"$inc": {"seq": 1}},
+        upsert=True, return_document=ReturnDocument.AFTER
+    )
+    return counter['seq']
+
+# Called after every write that changed the jobs collection
+def on_jobs_changed(changed_job_ids=()):
+    generation = bump_jobs_generation()
+    aggregate_cache.invalidate()
+    salary_snapshot.mark_changed(changed_job_ids, generation)
+    for job_id in changed_job_ids:
+        job_cache.evict(job_id, generation)
+
+# Fields that can be set on an existing job
+UPDATABLE_FIELDS = [
+    'title', 'years_of_experience', 'description', 'responsibilities',
+    'company', 'education', 'skills', 'employment_type', 'average_salary',
+    'benefits', 'remote', 'job_posting_url', 'posting_date', 'closing_date'
+]
+
+# Validate a new job posting: returns an error payload, or None when the job is valid
+def validate_new_job(body):
+    if not isinstance(body, dict):
+        return {"error": "No data provided"}
+
+    # Validate title
+    if 'title' not in body or not body['title']:
+        return {"error": "Title is required"}
+
+    # Validate company
+    if not isinstance(body.get('company'), dict) or 'name' not in body['company']:
+        return {"error": "Company name is required"}
+
+    # Validate industry
+    if 'industry_name' not in body['company']:
+        return {"error": "Industry is required"}
+
+    return None
+
+# Give a validated job its job_id, derived fields (lookup fields, experience bounds)
+# and its first version / updated_at (used for ETag and Last-Modified)
+def prepare_new_job(body, job_id):
+    body['job_id'] = job_id
+    body['normalized'] = utils.build_normalized_fields(body)
+    body.update(utils.build_experience_fields(body))
+    body['version'] = 1
+    body['updated_at'] = datetime.now(timezone.utc)
+    return body
+
+# Validate a partial update (job_id is ignored): returns (fields, error payload)
+def validate_job_update(body):
+    if not isinstance(body, dict) or not body:
+        return None, {"error": "No data provided or invalid JSON"}
+
+    # Remove job_id from body if present
+    fields = {key: value for key, value in body.items() if key != 'job_id'}
+
+    # If body is now empty after removing job_id, return error
+    if not fields:
+        return None, {
+            "error": "No valid fields to update",
+            "hint": "job_id cannot be updated. Provide other fields."
+        }
+
+    # Check for unknown fields
+    unknown_fields = [field for field in fields.keys() if field not in UPDATABLE_FIELDS]
+    if unknown_fields:
+        return None, {
+            "error": f"Unknown fields: {', '.join(unknown_fields)}",
+            "allowed_fields": UPDATABLE_FIELDS
+        }
+
+    return fields, None
+
+# Build the update for validated fields, keeping the derived fields in sync
+# and bumping the job's version / updated_at
+def build_job_update(fields):
+    set_fields = dict(fields)
+    for key, value in utils.build_normalized_fields(fields).items():
+        set_fields[f"normalized.{key}"] = value
+    set_fields.update(utils.build_experience_fields(fields))
+    set_fields['updated_at'] = datetime.now(timezone.utc)
+    return {"$set": set_fields, "$inc": {"version": 1}}
+
+# Filter matching the job only if at least one field would change,
+# so an update with unchanged values does not bump the version
+def build_change_filter(job_id, fields):
+    return {
+        "job_id": job_id,
+        "$or": [{key: {"$ne": value}} for key, value in fields.items()]
+    }
+
+# Backfill the derived fields, create the indexes on the jobs collection and seed the job_id counter
+def init_db():
+    created = indexes.bootstrap(jobs_collection)
+    job_ids.seed()
+    return created
+
+# Flask CLI command to prepare the database on demand: flask --app app init-db
+@bp.cli.command("init-db")
+def init_db_command():
+    """Backfill the derived fields, create the indexes and seed the job_id counter"""
+    init_db()
+
 # route decorator that defines which routes should be navigated to this function
-@app.route("/") # '/' for directing all default traffic to this function get_initial_response()
+@bp.route("/") # '/' for directing all default traffic to this function get_initial_response()
 def get_initial_response():
 
     # Message to the user
@@ -42,7 +332,7 @@ def get_initial_response():
     return resp
 
 # Create a new job post
-@app.route("/create/jobPost", methods=['POST'])
+@bp.route("/create/jobPost", methods=['POST'])
 def create_job():
     """Function to create new job posting"""
     try:
@@ -52,27 +342,29 @@ def create_job():
         except:
             return jsonify({"error": "No data provided"}), 400
         
-        # Validate title
-        if 'title' not in body or not body['title']:
-            return jsonify({"error": "Title is required"}), 400
-        
-        # Validate company
-        if 'company' not in body or 'name' not in body['company']:
-            return jsonify({"error": "Company name is required"}), 400
+        # Validate title, company and industry
+        error = validate_new_job(body)
+        if error:
+            return jsonify(error), 400
         
-        # Validate industry
-        if 'industry_name' not in body.get('company', {}):
-            return jsonify({"error": "Industry is required"}), 400
+        # Generate job_id atomically from the counters collection,
+        # then populate the lowercase lookup fields and the numeric experience bounds
+        new_job_id = job_ids.next_id()
+        prepare_new_job(body, new_job_id)
         
-        # Generate job_id
-        max_job = jobs_collection.find_one(sort=[("job_id", -1)])
-        new_job_id = (max_job['job_id'] + 1) if max_job else 1
-        body['job_id'] = new_job_id
-        
-        # Insert
-        record_created = jobs_collection.insert_one(body)
+        # Insert (the unique job_id index rejects duplicates)
+        try:
+            record_created = jobs_collection.insert_one(body)
+        except DuplicateKeyError:
+            # The id was taken by a job the counter did not hand out: re-seed and retry once
+            job_ids.resync()
+            body.pop('_id', None)
+            new_job_id = job_ids.next_id()
+            prepare_new_job(body, new_job_id)
+            record_created = jobs_collection.insert_one(body)
         
         if record_created:
+            on_jobs_changed([new_job_id])
             return jsonify({
                 "message": "Job post created successfully",
                 "job_id": new_job_id,
@@ -84,38 +376,83 @@ def create_job():
         return jsonify({"error": "Server error"}), 500
 
 # Get complete job details by job_id 
-@app.route('/jobs/<int:job_id>', methods=['GET'])
+@bp.route('/jobs/<int:job_id>', methods=['GET'])
 def get_job_by_id(job_id):
     """
     Get complete job details by job_id 
+    Served from the in-process job cache when possible;
+    send 'X-Cache-Bypass: 1' to always read from MongoDB.
 
     Example:
         GET http://localhost:5000/jobs/0
         Returns job with job_id = 0
     """
     try:
-        # Query MongoDB for job with matching job_id
-        result = jobs_collection.find_one({"job_id": job_id})
+        # The validators are always returned with the requested 'fields'
+        fields = request_projection(["job_id", "version", "updated_at"])
+        # One cache entry and ETag per projection, however 'fields' is written
+        representation = projection.projection_key(fields)
+
+        # Serve from the job cache unless the client asks to bypass it;
+        # a write made by any process since the last request empties it
+        use_cache = request.headers.get('X-Cache-Bypass', '').lower() not in ('1', 'true', 'yes')
+        if use_cache:
+            job_cache.observe(request_jobs_generation())
+            entry = job_cache.get(job_id, representation)
+            if entry is not None:
+                return cached_job_response(job_id, entry)
+        # Remember the cache generation: a write during this request makes the result uncacheable
+        generation = job_cache.generation
+
+        # Conditional GET: check the client's validators against the job's version first,
+        # with a tiny projection, so an unchanged job is answered without fetching the body
+        if request.if_none_match or request.if_modified_since:
+            current = jobs_collection.find_one(
+                {"job_id": job_id}, {"_id": 0, "version": 1, "updated_at": 1}
+            )
+            if current:
+                etag = conditional.job_etag(job_id, current.get('version'), representation)
+                if conditional.is_not_modified(etag, current.get('updated_at')):
+                    return conditional.not_modified(etag, current.get('updated_at'))
+
+        # Query MongoDB for job with matching job_id (only the requested 'fields')
+        result = jobs_collection.find_one({"job_id": job_id}, fields)
         
         # If document not found
         if not result:
-            return jsonify({
-                "error": f"Job with ID {job_id} not found",
-                "job_id": job_id
-            }), 404
+            if use_cache and job_cache.negative:
+                job_cache.set(job_id, JOB_NOT_FOUND, representation, generation)
+            return job_not_found(job_id)
         
         # Convert ObjectId to string for JSON serialization
         result = serialize_doc(result)
         
-        # Return the job document
-        return jsonify(result), 200
+        # Return the job document with its validators
+        response = jsonify(result)
+        etag = conditional.job_etag(job_id, result.get('version'), representation)
+        response.set_etag(etag)
+        if result.get('updated_at'):
+            response.last_modified = conditional.as_utc(result['updated_at'])
+
+        # Keep the rendered body for the next request
+        if use_cache:
+            job_cache.set(
+                job_id, (response.get_data(), etag, result.get('updated_at')),
+                representation, generation
+            )
+            response.headers['X-Cache'] = 'MISS'
+        return response, 200
     
+    except QUERY_PARAM_ERRORS as e:
+        return query_param_error(e)
+
     except Exception as e:
         # Error while trying to fetch the job
         return jsonify({"error": str(e)}), 500
 
 # Get all jobs in a specific industry 
-@app.route('/jobs/industry/<industry_name>', methods=['GET'])
+@bp.route('/jobs/industry/<industry_name>', methods=['GET'])
+@conditional.generation_etag(get_jobs_generation)
 def get_jobs_by_industry(industry_name):
     """
     Get all jobs in a specific industry 
@@ -126,27 +463,23 @@ def get_jobs_by_industry(industry_name):
         GET http://localhost:5000/jobs/industry/FINANCE  
     """
     try:
-        # Query MongoDB using regex for case-insensitive match
-        jobs = jobs_collection.find({
-            "company.industry_name": {
-                "$regex": f"^{industry_name}$",
-                "$options": "i"  
-            }
-        })
-        
-        # Convert cursor to list
-        jobs_list = list(jobs)
+        # Case-insensitive exact match on the indexed lowercase lookup field
+        query = {"normalized.industry": utils.normalize_lookup(industry_name)}
+
+        # Stream all matches as NDJSON when requested
+        if wants_stream():
+            return stream_jobs(query)
+
+        jobs_list, page = fetch_jobs_page(query)
         
-        # Check if any jobs were found
-        if jobs_list:
-            # Serialize all jobs 
-            jobs_list = [serialize_doc(job) for job in jobs_list]
-            
+        # Check if any jobs were found (an empty page past the first one is not an error)
+        if jobs_list or page["after"]:
             # Return jobs with count
             return jsonify({
                 "industry": industry_name,
                 "count": len(jobs_list),
-                "jobs": jobs_list
+                "jobs": jobs_list,
+                "page": page
             }), 200
         else:
             # No jobs found for this industry
@@ -156,12 +489,16 @@ def get_jobs_by_industry(industry_name):
                 "count": 0
             }), 404
     
+    except QUERY_PARAM_ERRORS as e:
+        return query_param_error(e)
+
     except Exception as e:
         # Error while trying to fetch jobs
         return jsonify({"error": str(e)}), 500
     
 # Get jobs within a specific salary range
-@app.route('/jobs/salary', methods=['GET'])
+@bp.route('/jobs/salary', methods=['GET'])
+@conditional.generation_etag(get_jobs_generation)
 def get_jobs_by_salary():
     """
     Get jobs within a specific salary range
@@ -179,22 +516,22 @@ def get_jobs_by_salary():
         min_salary = int(query_params.get('min_salary', 0))
         max_salary = int(query_params.get('max_salary', 999999999))
         
-        # Query MongoDB for jobs within the salary range
-        jobs = jobs_collection.find({
+        # Query MongoDB for jobs within the salary range, ordered by salary
+        query = {
             "average_salary": {
                 "$gte": min_salary,
                 "$lte": max_salary
             }
-        })
-        
-        # Convert cursor to list
-        jobs_list = list(jobs)
+        }
+
+        # Stream all matches as NDJSON when requested
+        if wants_stream():
+            return stream_jobs(query, SALARY_SORT)
+
+        jobs_list, page = fetch_jobs_page(query, SALARY_SORT)
         
-        # Check if any jobs were found
-        if jobs_list:
-            # Serialize all jobs 
-            jobs_list = [serialize_doc(job) for job in jobs_list]
-            
+        # Check if any jobs were found (an empty page past the first one is not an error)
+        if jobs_list or page["after"]:
             # Return jobs with salary range info and count
             return jsonify({
                 "salary_range": {
@@ -202,7 +539,8 @@ def get_jobs_by_salary():
                     "max": max_salary
                 },
                 "count": len(jobs_list),
-                "jobs": jobs_list
+                "jobs": jobs_list,
+                "page": page
             }), 200
         else:
             # No jobs found in this salary range
@@ -215,6 +553,9 @@ def get_jobs_by_salary():
                 "count": 0
             }), 404
     
+    except QUERY_PARAM_ERRORS as e:
+        return query_param_error(e)
+
     except ValueError:
         # Error if salary values cannot be converted to integers
         return jsonify({
@@ -227,7 +568,8 @@ def get_jobs_by_salary():
         return jsonify({"error": str(e)}), 500
     
 # Get all jobs in a specific location 
-@app.route('/jobs/location/<location>', methods=['GET'])
+@bp.route('/jobs/location/<location>', methods=['GET'])
+@conditional.generation_etag(get_jobs_generation)
 def get_jobs_by_location(location):
     """
     Get all jobs in a specific location 
@@ -238,27 +580,23 @@ def get_jobs_by_location(location):
         GET http://localhost:5000/jobs/location/london, uk  
     """
     try:
-        # Query MongoDB using regex for case-insensitive match
-        jobs = jobs_collection.find({
-            "company.headquarters": {
-                "$regex": f"^{location}$",
-                "$options": "i"  
-            }
-        })
-        
-        # Convert cursor to list
-        jobs_list = list(jobs)
+        # Case-insensitive exact match on the indexed lowercase lookup field
+        query = {"normalized.location": utils.normalize_lookup(location)}
+
+        # Stream all matches as NDJSON when requested
+        if wants_stream():
+            return stream_jobs(query)
+
+        jobs_list, page = fetch_jobs_page(query)
         
-        # Check if any jobs were found
-        if jobs_list:
-            # Serialize all jobs 
-            jobs_list = [serialize_doc(job) for job in jobs_list]
-            
+        # Check if any jobs were found (an empty page past the first one is not an error)
+        if jobs_list or page["after"]:
             # Return jobs with location info and count
             return jsonify({
                 "location": location,
                 "count": len(jobs_list),
-                "jobs": jobs_list
+                "jobs": jobs_list,
+                "page": page
             }), 200
         else:
             # No jobs found in this location
@@ -268,12 +606,16 @@ def get_jobs_by_location(location):
                 "count": 0
             }), 404
     
+    except QUERY_PARAM_ERRORS as e:
+        return query_param_error(e)
+
     except Exception as e:
         # Error while trying to fetch jobs
         return jsonify({"error": str(e)}), 500
     
 #  Get all jobs that require a specific skill 
-@app.route('/jobs/skill/<skill_name>', methods=['GET'])
+@bp.route('/jobs/skill/<skill_name>', methods=['GET'])
+@conditional.generation_etag(get_jobs_generation)
 def get_jobs_by_skill(skill_name):
     """
     Get all jobs that require a specific skill 
@@ -285,27 +627,23 @@ def get_jobs_by_skill(skill_name):
         GET http://localhost:5000/jobs/skill/Machine Learning
     """
     try:
-        # Query MongoDB for jobs where skills array contains the skill
-        jobs = jobs_collection.find({
-            "skills": {
-                "$regex": f"^{skill_name}$",
-                "$options": "i"  
-            }
-        })
-        
-        # Convert cursor to list
-        jobs_list = list(jobs)
+        # Query MongoDB for jobs where the lowercase skills array contains the skill
+        query = {"normalized.skills": utils.normalize_lookup(skill_name)}
+
+        # Stream all matches as NDJSON when requested
+        if wants_stream():
+            return stream_jobs(query)
+
+        jobs_list, page = fetch_jobs_page(query)
         
-        # Check if any jobs were found
-        if jobs_list:
-            # Serialize all jobs 
-            jobs_list = [serialize_doc(job) for job in jobs_list]
-            
+        # Check if any jobs were found (an empty page past the first one is not an error)
+        if jobs_list or page["after"]:
             # Return jobs with skill info and count
             return jsonify({
                 "skill": skill_name,
                 "count": len(jobs_list),
-                "jobs": jobs_list
+                "jobs": jobs_list,
+                "page": page
             }), 200
         else:
             # No jobs found requiring this skill
@@ -315,71 +653,224 @@ def get_jobs_by_skill(skill_name):
                 "count": 0
             }), 404
     
+    except QUERY_PARAM_ERRORS as e:
+        return query_param_error(e)
+
     except Exception as e:
         # Error while trying to fetch jobs
         return jsonify({"error": str(e)}), 500
     
 # Get all jobs that require ALL of the specified skills
-@app.route('/jobs/skills/<skill_names>', methods=['GET'])
+@bp.route('/jobs/skills/<skill_names>', methods=['GET'])
+@conditional.generation_etag(get_jobs_generation)
 def get_jobs_by_multiple_skills(skill_names):
     """
-    Get all jobs that require AT LEAST 2 of the specified skills.
+    Get all jobs that require AT LEAST min_match (default 2) of the specified skills,
+    ranked by how many of the skills they match. Each job lists its matched_skills.
 
     Example:
         GET /jobs/skills/Python&SQL&JAVA
         GET /jobs/skills/Excel&Communication
-        GET /jobs/skills/Python&Machine%20Learning&SQL
+        GET /jobs/skills/Python&Machine%20Learning&SQL?min_match=3
     """
     try:
         # Split the skill_names string by '&' delimiter
         skills_list = skill_names.split('&')
         skills_list = [skill.strip() for skill in skills_list if skill.strip()]
 
-        if len(skills_list) < 2:
+        # Minimum number of the skills a job has to match
+        query_params = utils.parse_query_params(request.query_string)
+        try:
+            min_match = int(query_params.get('min_match', 2))
+        except ValueError:
+            min_match = 0
+        if min_match < 1:
+            return jsonify({
+                "error": "Invalid min_match. Please provide a positive integer.",
+                "hint": "Example: /jobs/skills/Python&SQL&Excel?min_match=2"
+            }), 400
+
+        if len(skills_list) < min_match:
             return jsonify({
-                "error": "Please provide at least two skills to match.",
+                "error": f"Please provide at least {min_match} skills to match.",
                 "skills_provided": skills_list
             }), 400
 
-        # Build $or query for MongoDB
-        skill_conditions = [
-            {"skills": {"$regex": f"^{re.escape(skill)}$", "$options": "i"}}
-            for skill in skills_list
+        # Lowercase skills, matched against the normalized skills array (multikey index)
+        wanted = list(dict.fromkeys(utils.normalize_lookup(skill) for skill in skills_list))
+
+        # Count the overlap on the server and keep the jobs with enough matches
+        stages = [
+            {"$addFields": {
+                "match_count": {"$size": {"$setIntersection": ["$normalized.skills", wanted]}},
+                "matched_skills": {"$filter": {
+                    "input": "$skills",
+                    "as": "skill",
+                    "cond": {"$in": [{"$toLower": "$$skill"}, wanted]}
+                }}
+            }},
+            {"$match": {"match_count": {"$gte": min_match}}}
         ]
+        query = {"normalized.skills": {"$in": wanted}}
+        computed = ["matched_skills"]
 
-        # Query jobs that match ANY of the skills
-        jobs_cursor = jobs_collection.find({"$or": skill_conditions})
+        # Stream all matches as NDJSON when requested
+        if wants_stream():
+            return stream_jobs(query, SKILL_MATCH_SORT, stages, computed)
 
-        # Filter jobs that match AT LEAST 2 of the skills
-        matched_jobs = []
-        for job in jobs_cursor:
-            job_skills = job.get("skills", [])
-            match_count = sum(
-                any(re.fullmatch(skill, s, re.IGNORECASE) for s in job_skills)
-                for skill in skills_list
-            )
-            if match_count >= 2:
-                matched_jobs.append(serialize_doc(job))
+        # Query one page of matching jobs, best matches first
+        matched_jobs, page = fetch_jobs_page(query, SKILL_MATCH_SORT, stages, computed)
 
-        # Return results
-        if matched_jobs:
+        # Return results (an empty page past the first one is not an error)
+        if matched_jobs or page["after"]:
             return jsonify({
                 "skills_required": skills_list,
+                "min_match": min_match,
                 "count": len(matched_jobs),
-                "jobs": matched_jobs
+                "jobs": matched_jobs,
+                "page": page
             }), 200
         else:
             return jsonify({
-                "error": f"No jobs found requiring at least 2 of: {', '.join(skills_list)}",
+                "error": f"No jobs found requiring at least {min_match} of: {', '.join(skills_list)}",
                 "skills_required": skills_list,
+                "min_match": min_match,
                 "count": 0
             }), 404
 
+    except QUERY_PARAM_ERRORS as e:
+        return query_param_error(e)
+
+    except Exception as e:
+        return jsonify({"error": str(e)}), 500
+
+# Keyword search across title, skills, responsibilities and description
+@bp.route('/jobs/search', methods=['GET'])
+@conditional.generation_etag(get_jobs_generation)
+def search_jobs():
+    """
+    Search jobs by keywords in their title, skills, responsibilities and description,
+    most relevant first (each job carries its relevance 'score'). Words are stemmed and
+    any of them can match; "quoted phrases" must appear as such and -words exclude jobs.
+
+    Example:
+        GET /jobs/search?q=data analyst
+        GET /jobs/search?q="machine learning" python -intern
+        GET /jobs/search?q=financial reports&fields=summary&limit=20
+    """
+    try:
+        query_params = utils.parse_query_params(request.query_string)
+        search = query_params.get('q', '').strip()
+        if not search or len(search) > MAX_SEARCH_LENGTH:
+            return jsonify({
+                "error": f"Please provide a search query 'q' of at most {MAX_SEARCH_LENGTH} characters.",
+                "hint": "Example: /jobs/search?q=\"data analysis\" python -intern"
+            }), 400
+
+        # Served by the job_text index; the relevance score is the first sort key
+        query = {"$text": {"$search": search}}
+        stages = [{"$addFields": {"score": {"$meta": "textScore"}}}]
+        computed = ["score"]
+
+        # Stream all matches as NDJSON when requested
+        if wants_stream():
+            return stream_jobs(query, SEARCH_SORT, stages, computed)
+
+        # Query one page of matching jobs, most relevant first
+        jobs_list, page = fetch_jobs_page(query, SEARCH_SORT, stages, computed)
+
+        # Return results (an empty page past the first one is not an error)
+        if jobs_list or page["after"]:
+            return jsonify({
+                "query": search,
+                "count": len(jobs_list),
+                "jobs": jobs_list,
+                "page": page
+            }), 200
+        else:
+            return jsonify({
+                "error": f"No jobs found for: {search}",
+                "query": search,
+                "count": 0
+            }), 404
+
+    except QUERY_PARAM_ERRORS as e:
+        return query_param_error(e)
+
+    except Exception as e:
+        return jsonify({"error": str(e)}), 500
+
+# Combined filters (any of the lookup, salary, experience, remote and employment type filters)
+@bp.route('/jobs/query', methods=['GET'])
+@conditional.generation_etag(get_jobs_generation)
+def query_jobs():
+    """
+    Get the jobs matching every filter given, in one request: industry, location, company,
+    degree, skill (comma-separated, all required), min_salary / max_salary, experience_level,
+    min_years / max_years, remote (true/false) and employment_type (comma-separated, any).
+    With facets=1 (or facets=industry,degree,remote,employment_type,salary) the response
+    also counts all matching jobs per industry, degree, remote, employment type and salary range.
+
+    Example:
+        GET /jobs/query?industry=Finance&remote=true&min_salary=80000
+        GET /jobs/query?skill=Python,SQL&experience_level=Mid Level&facets=1
+        GET /jobs/query?location=London, UK&employment_type=Full-time,Contract&sort=salary
+    """
+    try:
+        query_params = utils.parse_query_params(request.query_string)
+
+        # One query for all the filters, plus the requested facets
+        query, applied = filters.build_job_filter(query_params)
+        facet_names = filters.parse_facets(query_params.get('facets'))
+        sort_name = query_params.get('sort', 'job_id').strip().lower()
+        if sort_name not in QUERY_SORTS:
+            raise filters.FilterError(f"Unknown sort: {sort_name} (allowed: {', '.join(QUERY_SORTS)})")
+
+        # Stream all matches as NDJSON when requested
+        if wants_stream():
+            return stream_jobs(query, QUERY_SORTS[sort_name])
+
+        jobs_list, page = fetch_jobs_page(query, QUERY_SORTS[sort_name])
+        result = {
+            "filters": applied,
+            "sort": sort_name,
+            "count": len(jobs_list),
+            "jobs": jobs_list,
+            "page": page
+        }
+
+        # Facet counts over every matching job, computed in a single $facet aggregation
+        if facet_names:
+            pipeline = filters.build_facet_pipeline(query, facet_names)
+            result["facets"] = filters.format_facets(next(jobs_collection.aggregate(pipeline), {}))
+
+        # Return results (an empty page past the first one is not an error)
+        if jobs_list or page["after"]:
+            return jsonify(result), 200
+        else:
+            return jsonify({
+                "error": "No jobs found matching the filters",
+                "filters": applied,
+                "count": 0,
+                **({"facets": result["facets"]} if facet_names else {})
+            }), 404
+
+    except filters.FilterError as e:
+        return jsonify({
+            "error": str(e),
+            "allowed_filters": filters.FILTER_PARAMS,
+            "hint": "Example: /jobs/query?industry=Finance&remote=true&min_salary=80000&facets=1"
+        }), 400
+
+    except QUERY_PARAM_ERRORS as e:
+        return query_param_error(e)
+
     except Exception as e:
         return jsonify({"error": str(e)}), 500
 
 # Get all jobs posted by a specific company 
-@app.route('/jobs/company/<company_name>', methods=['GET'])
+@bp.route('/jobs/company/<company_name>', methods=['GET'])
+@conditional.generation_etag(get_jobs_generation)
 def get_jobs_by_company(company_name):
     """
     Get all jobs posted by a specific company 
@@ -391,27 +882,23 @@ def get_jobs_by_company(company_name):
         GET http://localhost:5000/jobs/company/Microsoft
     """
     try:
-        # Query MongoDB for jobs where company name matches
-        jobs = jobs_collection.find({
-            "company.name": {
-                "$regex": f"^{company_name}$",
-                "$options": "i"  
-            }
-        })
-        
-        # Convert cursor to list
-        jobs_list = list(jobs)
+        # Query MongoDB for jobs where the lowercase company name matches
+        query = {"normalized.company": utils.normalize_lookup(company_name)}
+
+        # Stream all matches as NDJSON when requested
+        if wants_stream():
+            return stream_jobs(query)
+
+        jobs_list, page = fetch_jobs_page(query)
         
-        # Check if any jobs were found
-        if jobs_list:
-            # Serialize all jobs 
-            jobs_list = [serialize_doc(job) for job in jobs_list]
-            
+        # Check if any jobs were found (an empty page past the first one is not an error)
+        if jobs_list or page["after"]:
             # Return jobs with company info and count
             return jsonify({
                 "company": company_name,
                 "count": len(jobs_list),
-                "jobs": jobs_list
+                "jobs": jobs_list,
+                "page": page
             }), 200
         else:
             # No jobs found from this company
@@ -421,12 +908,17 @@ def get_jobs_by_company(company_name):
                 "count": 0
             }), 404
     
+    except QUERY_PARAM_ERRORS as e:
+        return query_param_error(e)
+
     except Exception as e:
         # Error while trying to fetch jobs
         return jsonify({"error": str(e)}), 500
 
 # Get count of jobs per industry, sorted by count (descending)
-@app.route('/jobs/count-by-industry', methods=['GET'])
+@bp.route('/jobs/count-by-industry', methods=['GET'])
+@conditional.generation_etag(request_jobs_generation)
+@cache.cached_response(aggregate_cache, request_jobs_generation)
 def count_jobs_by_industry():
     """
     Get count of jobs per industry, sorted by count (descending)
@@ -471,41 +963,194 @@ def count_jobs_by_industry():
         # Error while trying to aggregate
         return jsonify({"error": str(e)}), 500
     
-# Get the top 5 highest-paying jobs
-@app.route('/jobs/top-salary', methods=['GET'])
+# Read a bounded integer parameter of /jobs/top-salary
+def parse_top_param(query_params, name, limits):
+    default, maximum = limits
+    value = filters.parse_int(query_params, name)
+    if value is None:
+        return default
+    if not 1 <= value <= maximum:
+        raise filters.FilterError(f"Invalid {name}. Please provide a number between 1 and {maximum}.")
+    return value
+
+# Get the highest-paying jobs, overall or per industry / company / location / degree
+@bp.route('/jobs/top-salary', methods=['GET'])
+@conditional.generation_etag(request_jobs_generation)
+@cache.cached_response(aggregate_cache, request_jobs_generation, TOP_SALARY_PARAMS)
 def get_top_salary_jobs():
     """
-    Get the top 5 highest-paying jobs
+    Get the n highest-paying jobs (default 5, at most 100) among the jobs matching the
+    /jobs/query filters. With group_by (industry, company, location, degree) the n best-paid
+    jobs of each group are returned instead, for at most 'groups' groups (default 20)
     
     Example:
         GET http://localhost:5000/jobs/top-salary
+        GET http://localhost:5000/jobs/top-salary?n=10&remote=true
+        GET http://localhost:5000/jobs/top-salary?group_by=industry&n=3&groups=10
     """
     try:
-        # Query MongoDB with sort and limit
-        # Sort by average_salary descending (-1), then by job_id ascending (1) for deterministic ties
-        jobs = jobs_collection.find().sort([
-            ("average_salary", -1), 
-            ("job_id", 1)            
-        ]).limit(5)                 
-        
-        # Convert cursor to list
-        jobs_list = list(jobs)
-        
-        # Serialize all jobs 
-        jobs_list = [serialize_doc(job) for job in jobs_list]
-        
-        # Return top 5 jobs
+        query_params = utils.parse_query_params(request.query_string)
+        query, applied = filters.build_job_filter(query_params)
+        n = parse_top_param(query_params, 'n', TOP_SALARY_N)
+        groups = parse_top_param(query_params, 'groups', TOP_SALARY_GROUPS)
+        fields = request_projection(["job_id", "average_salary"])
+
+        group_by = query_params.get('group_by', '').strip().lower()
+        if not group_by:
+            # Ties on average_salary are broken by job_id, so the ranking is deterministic;
+            # the index returns the first n matches already in order
+            jobs = jobs_collection.find(query, fields).sort(TOP_SALARY_SORT).limit(n)
+            jobs_list = serialize_jobs(list(jobs))
+            return jsonify({
+                "filters": applied,
+                "count": len(jobs_list),
+                "top_jobs": jobs_list
+            }), 200
+
+        if group_by not in filters.LOOKUP_LABELS:
+            raise filters.FilterError(
+                f"Unknown group_by: {group_by} (allowed: {', '.join(filters.LOOKUP_LABELS)})"
+            )
+        pipeline = filters.build_top_salary_pipeline(query, group_by, n, groups, fields)
+
+        # The ranked jobs arrive group by group, best-paid first
+        rankings = []
+        for job in jobs_collection.aggregate(pipeline):
+            group, label, total = job.pop('_group'), job.pop('_label'), job.pop('_total')
+            if not rankings or rankings[-1]["key"] != group:
+                rankings.append({"key": group, "value": label, "total_jobs": total, "top_jobs": []})
+            rankings[-1]["top_jobs"].append(serialize_doc(job))
+        for ranking in rankings:
+            del ranking["key"]
+
         return jsonify({
-            "count": len(jobs_list),
-            "top_jobs": jobs_list
+            "group_by": group_by,
+            "n": n,
+            "filters": applied,
+            "count": len(rankings),
+            "groups": rankings
         }), 200
-    
+
+    except filters.FilterError as e:
+        return jsonify({
+            "error": str(e),
+            "allowed_filters": filters.FILTER_PARAMS + ['n', 'group_by', 'groups'],
+            "hint": "Example: /jobs/top-salary?group_by=industry&n=10"
+        }), 400
+
+    except QUERY_PARAM_ERRORS as e:
+        return query_param_error(e)
+
     except Exception as e:
         # Error while trying to fetch jobs
         return jsonify({"error": str(e)}), 500
     
+# Hit/miss counters of the response caches
+@bp.route('/cache/stats', methods=['GET'])
+def get_cache_stats():
+    """
+    Get the hit/miss counters of the response caches
+    
+    Example:
+        GET http://localhost:5000/cache/stats
+    """
+    return jsonify({
+        "aggregate_cache": aggregate_cache.stats(),
+        "job_cache": job_cache.stats()
+    }), 200
+
+# Salary statistics of the jobs matching the filters
+@bp.route('/analytics/salary', methods=['GET'])
+@conditional.generation_etag(request_jobs_generation)
+def get_salary_analytics():
+    """
+    Get count, mean, std, min, max and percentiles of average_salary over the jobs matching
+    the optional filters (industry, degree, company, company_size, experience, remote)
+    
+    Example:
+        GET http://localhost:5000/analytics/salary?industry=Finance&remote=true&percentiles=50,90
+    """
+    try:
+        filters = analytics.parse_filters(request.args)
+        percentiles = analytics.parse_percentiles(request.args.get('percentiles'))
+        return jsonify({
+            "filters": filters,
+            "salary": salary_snapshot.summary(filters, percentiles, request_jobs_generation()),
+            "snapshot": salary_snapshot.info()
+        }), 200
+
+    except analytics.AnalyticsError as e:
+        return jsonify({"error": str(e)}), 400
+
+    except Exception as e:
+        # Error while trying to compute the statistics
+        return jsonify({"error": str(e)}), 500
+
+# Salary statistics per value of one dimension
+@bp.route('/analytics/salary/by/<dimension>', methods=['GET'])
+@conditional.generation_etag(request_jobs_generation)
+def get_salary_analytics_by(dimension):
+    """
+    Get the salary statistics grouped by industry, degree, company, company_size,
+    experience or remote (largest groups first), with the same filters as /analytics/salary
+    
+    Example:
+        GET http://localhost:5000/analytics/salary/by/industry?experience=Senior Level
+    """
+    try:
+        if dimension not in analytics.DIMENSIONS:
+            raise analytics.AnalyticsError(
+                f"Unknown dimension: {dimension} (allowed: {', '.join(analytics.DIMENSIONS)})"
+            )
+        filters = analytics.parse_filters(request.args)
+        percentiles = analytics.parse_percentiles(request.args.get('percentiles'))
+        groups = salary_snapshot.grouped(dimension, filters, percentiles, request_jobs_generation())
+        return jsonify({
+            "dimension": dimension,
+            "filters": filters,
+            "count": len(groups),
+            "groups": groups,
+            "snapshot": salary_snapshot.info()
+        }), 200
+
+    except analytics.AnalyticsError as e:
+        return jsonify({"error": str(e)}), 400
+
+    except Exception as e:
+        # Error while trying to compute the statistics
+        return jsonify({"error": str(e)}), 500
+
+# Salary distribution of the jobs matching the filters
+@bp.route('/analytics/salary/histogram', methods=['GET'])
+@conditional.generation_etag(request_jobs_generation)
+def get_salary_histogram():
+    """
+    Get the number of jobs per equal-width salary bin (bins: 1 to 100, default 10),
+    with the same filters as /analytics/salary
+    
+    Example:
+        GET http://localhost:5000/analytics/salary/histogram?bins=20&degree=Master's Degree
+    """
+    try:
+        filters = analytics.parse_filters(request.args)
+        bins = analytics.parse_bins(request.args.get('bins'))
+        return jsonify({
+            "filters": filters,
+            "bins": salary_snapshot.histogram(filters, bins, request_jobs_generation()),
+            "snapshot": salary_snapshot.info()
+        }), 200
+
+    except analytics.AnalyticsError as e:
+        return jsonify({"error": str(e)}), 400
+
+    except Exception as e:
+        # Error while trying to compute the histogram
+        return jsonify({"error": str(e)}), 500
+    
 # Get a unique list of companies that currently have at least one open job
-@app.route('/companies/hiring', methods=['GET'])
+@bp.route('/companies/hiring', methods=['GET'])
+@conditional.generation_etag(request_jobs_generation)
+@cache.cached_response(aggregate_cache, request_jobs_generation)
 def get_companies_hiring():
     """
     Get a unique list of companies that currently have at least one open job
@@ -531,7 +1176,8 @@ def get_companies_hiring():
         return jsonify({"error": str(e)}), 500
     
 # Get all jobs that require a specific degree level
-@app.route('/jobs/degree/<degree_name>', methods=['GET'])
+@bp.route('/jobs/degree/<degree_name>', methods=['GET'])
+@conditional.generation_etag(get_jobs_generation)
 def get_jobs_by_degree(degree_name):
     """
     Get all jobs that require a specific degree level 
@@ -544,27 +1190,23 @@ def get_jobs_by_degree(degree_name):
         GET http://localhost:5000/jobs/degree/Diploma
     """
     try:
-        # Query MongoDB for jobs where education level matches
-        jobs = jobs_collection.find({
-            "education.level": {
-                "$regex": f"^{degree_name}$",
-                "$options": "i"  
-            }
-        })
-        
-        # Convert cursor to list
-        jobs_list = list(jobs)
+        # Query MongoDB for jobs where the lowercase education level matches
+        query = {"normalized.degree": utils.normalize_lookup(degree_name)}
+
+        # Stream all matches as NDJSON when requested
+        if wants_stream():
+            return stream_jobs(query)
+
+        jobs_list, page = fetch_jobs_page(query)
         
-        # Check if any jobs were found
-        if jobs_list:
-            # Serialize all jobs 
-            jobs_list = [serialize_doc(job) for job in jobs_list]
-            
+        # Check if any jobs were found (an empty page past the first one is not an error)
+        if jobs_list or page["after"]:
             # Return jobs with degree info and count
             return jsonify({
                 "degree": degree_name,
                 "count": len(jobs_list),
-                "jobs": jobs_list
+                "jobs": jobs_list,
+                "page": page
             }), 200
         else:
             # No jobs found requiring this degree
@@ -574,73 +1216,104 @@ def get_jobs_by_degree(degree_name):
                 "count": 0
             }), 404
     
+    except QUERY_PARAM_ERRORS as e:
+        return query_param_error(e)
+
     except Exception as e:
         # Error while trying to fetch jobs
         return jsonify({"error": str(e)}), 500
     
 # Get jobs based on experience level requirement
-@app.route('/jobs/experience', methods=['GET'])
+@bp.route('/jobs/experience', methods=['GET'])
+@conditional.generation_etag(get_jobs_generation)
 def get_jobs_by_experience():
     """
-    Get jobs based on experience level derived from 'years_of_experience' field.
+    Get jobs based on experience level or an explicit range of years,
+    using the numeric 'years_min' / 'years_max' bounds parsed from 'years_of_experience'.
+    min_years / max_years keep jobs whose whole required range lies within the given years.
 
     Example:
         GET /jobs/experience?experience_level=Entry Level
         GET /jobs/experience?experience_level=Mid Level
         GET /jobs/experience?experience_level=Senior Level
+        GET /jobs/experience?min_years=3
+        GET /jobs/experience?min_years=2&max_years=5
     """
     try:
         # Parse query parameters
         query_params = utils.parse_query_params(request.query_string)
         experience_level = query_params.get('experience_level', '').strip().lower()
 
-        if not experience_level:
+        try:
+            min_years = int(query_params['min_years']) if query_params.get('min_years') else None
+            max_years = int(query_params['max_years']) if query_params.get('max_years') else None
+        except ValueError:
             return jsonify({
-                "error": "experience_level parameter is required",
+                "error": "Invalid min_years / max_years values. Please provide valid integers.",
+                "hint": "Example: /jobs/experience?min_years=2&max_years=5"
+            }), 400
+
+        if not experience_level and min_years is None and max_years is None:
+            return jsonify({
+                "error": "experience_level or min_years / max_years parameter is required",
                 "hint": "Example: /jobs/experience?experience_level=Entry Level"
             }), 400
 
-        # Fetch all jobs
-        jobs_cursor = jobs_collection.find({})
-        matched_jobs = []
+        if experience_level and experience_level not in EXPERIENCE_LEVELS:
+            return jsonify({
+                "error": f"Unknown experience level: {experience_level.title()}",
+                "allowed_levels": [level.title() for level in EXPERIENCE_LEVELS]
+            }), 400
+
+        # Build the range conditions on the indexed numeric bounds
+        conditions = []
+        if experience_level:
+            conditions.append({"years_min": EXPERIENCE_LEVELS[experience_level]})
+        if min_years is not None:
+            conditions.append({"years_min": {"$gte": min_years}})
+        if max_years is not None:
+            conditions.append({"years_max": {"$lte": max_years}})
+        query = conditions[0] if len(conditions) == 1 else {"$and": conditions}
 
-        for job in jobs_cursor:
-            exp_str = job.get("years_of_experience", "")
-            if '-' not in exp_str:
-                continue  # skip malformed entries
+        # Stream all matches as NDJSON when requested
+        if wants_stream():
+            return stream_jobs(query, EXPERIENCE_SORT)
 
-            try:
-                lower_bound = int(exp_str.split('-')[0])
-            except ValueError:
-                continue  # skip non-numeric entries
+        # Fetch one page of matching jobs, ordered by minimum years of experience
+        matched_jobs, page = fetch_jobs_page(query, EXPERIENCE_SORT)
 
-            # Match based on experience level
-            if experience_level == "entry level" and lower_bound in [1, 2]:
-                matched_jobs.append(serialize_doc(job))
-            elif experience_level == "mid level" and 2 < lower_bound < 5:
-                matched_jobs.append(serialize_doc(job))
-            elif experience_level == "senior level" and lower_bound >= 5:
-                matched_jobs.append(serialize_doc(job))
+        # Describe the requested experience in the response
+        experience = {
+            "experience_level": experience_level.title() or None,
+            "years_range": {
+                "min": min_years,
+                "max": max_years
+            }
+        }
 
-        if matched_jobs:
+        if matched_jobs or page["after"]:
             return jsonify({
-                "experience_level": experience_level.title(),
+                **experience,
                 "count": len(matched_jobs),
-                "jobs": matched_jobs
+                "jobs": matched_jobs,
+                "page": page
             }), 200
         else:
             return jsonify({
-                "error": f"No jobs found for experience level: {experience_level.title()}",
-                "experience_level": experience_level.title(),
+                "error": "No jobs found for the requested experience",
+                **experience,
                 "count": 0
             }), 404
 
+    except QUERY_PARAM_ERRORS as e:
+        return query_param_error(e)
+
     except Exception as e:
         return jsonify({"error": str(e)}), 500
 
     
 # Partially update a job posting by job_id
-@app.route('/job/<int:job_id>', methods=['PUT'])
+@bp.route('/job/<int:job_id>', methods=['PUT'])
 def update_job(job_id):
     """
     Partially update a job posting by job_id
@@ -652,50 +1325,23 @@ def update_job(job_id):
     try:
         # Get JSON data from request body
         body = request.get_json(force=True)
-        if not body:
-            return jsonify({"error": "No data provided or invalid JSON"}), 400
 
-        # Validate that body is not empty
-        if not body:
-            return jsonify({"error": "Request body cannot be empty"}), 400
+        # Validate the fields (job_id is ignored, unknown fields are rejected)
+        body, error = validate_job_update(body)
+        if error:
+            return jsonify(error), 400
         
-        # Remove job_id from body if present 
-        if 'job_id' in body:
-            body.pop('job_id')
-            
-        # If body is now empty after removing job_id, return error
-        if not body:
-            return jsonify({
-                "error": "No valid fields to update",
-                "hint": "job_id cannot be updated. Provide other fields."
-            }), 400
+        # Build the update operation using $set (derived fields kept in sync)
+        update_operation = build_job_update(body)
         
-        # Define allowed fields 
-        allowed_fields = [
-            'title', 'years_of_experience', 'description', 'responsibilities',
-            'company', 'education', 'skills', 'employment_type', 'average_salary',
-            'benefits', 'remote', 'job_posting_url', 'posting_date', 'closing_date'
-        ]
-        
-        # Check for unknown fields 
-        unknown_fields = [field for field in body.keys() if field not in allowed_fields]
-        if unknown_fields:
-            return jsonify({
-                "error": f"Unknown fields: {', '.join(unknown_fields)}",
-                "allowed_fields": allowed_fields
-            }), 400
-        
-        # Build the update operation using $set
-        update_operation = {"$set": body}
-        
-        # Update the job in MongoDB
+        # Update the job in MongoDB (only matches if a value actually changes)
         result = jobs_collection.update_one(
-            {"job_id": job_id},      
+            build_change_filter(job_id, body),
             update_operation         
         )
         
-        # Check if job was found and updated
-        if result.matched_count == 0:
+        # Check if job was found: nothing matched either because it does not exist or is unchanged
+        if result.matched_count == 0 and not jobs_collection.find_one({"job_id": job_id}, {"_id": 1}):
             # No job found with this job_id
             return jsonify({
                 "error": f"Job with ID {job_id} not found",
@@ -704,6 +1350,8 @@ def update_job(job_id):
         
         # Check if any modifications were actually made
         if result.modified_count > 0:
+            on_jobs_changed([job_id])
+
             # Job was updated successfully
             return jsonify({
                 "message": "Job updated successfully",
@@ -724,7 +1372,7 @@ def update_job(job_id):
         return jsonify({"error": f"Server error: {str(e)}"}), 500
     
 # Delete a job posting by job_id
-@app.route('/job/<int:job_id>', methods=['DELETE'])
+@bp.route('/job/<int:job_id>', methods=['DELETE'])
 def delete_job(job_id):
     """
     Delete a job posting by job_id
@@ -738,6 +1386,8 @@ def delete_job(job_id):
         
         # Check if a job was actually deleted
         if result.deleted_count > 0:
+            on_jobs_changed([job_id])
+
             # Job was found and deleted successfully
             return jsonify({
                 "message": "Job deleted successfully",
@@ -0,0 +1,183 @@
+"""This module implements keyset (cursor) pagination for the job list routes."""
+
+import base64
+import json
+
+# Page size used when the request does not pass 'limit', and the largest page allowed
+DEFAULT_LIMIT = 50
+MAX_LIMIT = 500
+
+
+class PaginationError(ValueError):
+    """Raised when the 'limit' or 'after' query parameters are invalid."""
+
+
+def encode_cursor(values):
+    """
+        Function to encode the sort key values of the last document of a page
+        into an opaque, URL-safe cursor token.
+        """
+    raw = json.dumps(values, separators=(',', ':')).encode('utf-8')
+    return base64.urlsafe_b64encode(raw).decode('ascii').rstrip('=')
+
+
+def decode_cursor(token, size=None):
+    """
+        Function to decode a cursor token back into the list of sort key values.
+        The token comes from the client and its values go into the query filter, so only
+        'size' (the number of sort keys) scalar values are accepted: an object such as
+        {"$regex": ...} would otherwise be read by MongoDB as an operator.
+        """
+    try:
+        padded = token + '=' * (-len(token) % 4)
+        values = json.loads(base64.urlsafe_b64decode(padded.encode('ascii')))
+    except (ValueError, TypeError):
+        raise PaginationError("Invalid 'after' cursor")
+    if not isinstance(values, list) or (size is not None and len(values) != size):
+        raise PaginationError("Invalid 'after' cursor")
+    if not all(value is None or isinstance(value, (str, int, float, bool)) for value in values):
+        raise PaginationError("Invalid 'after' cursor")
+    return values
+
+
+def parse_limit(value):
+    """
+        Function to validate a 'limit' query parameter (a positive integer).
+        """
+    try:
+        limit = int(value)
+    except ValueError:
+        raise PaginationError("Invalid 'limit'. Please provide a positive integer.")
+    if limit < 1:
+        raise PaginationError("Invalid 'limit'. Please provide a positive integer.")
+    return limit
+
+
+def parse_page_params(query_params, sort=None):
+    """
+        Function to read 'limit' and 'after' from the parsed query params
+        ('sort': the sort of the query, the cursor must hold one value per key).
+        Returns (limit, after) where after is None on the first page.
+        """
+    limit = parse_limit(query_params.get('limit', DEFAULT_LIMIT))
+
+    after = query_params.get('after')
+    after = decode_cursor(after, len(sort) if sort else None) if after else None
+
+    return min(limit, MAX_LIMIT), after
+
+
+def parse_stream_params(query_params, sort=None):
+    """
+        Function to read 'limit' and 'after' for a streamed response.
+        Streams are not capped: limit is None unless the request passes one.
+        """
+    limit = parse_limit(query_params['limit']) if 'limit' in query_params else None
+
+    after = query_params.get('after')
+    after = decode_cursor(after, len(sort) if sort else None) if after else None
+
+    return limit, after
+
+
+def get_field(doc, path):
+    """
+        Function to read a (possibly dotted) field from a document.
+        """
+    value = doc
+    for key in path.split('.'):
+        if not isinstance(value, dict):
+            return None
+        value = value.get(key)
+    return value
+
+
+def past_value(field, direction, value):
+    """
+        Function to match the documents whose 'field' sorts strictly after 'value'.
+        MongoDB sorts null (and missing) before any value, so ascending past null is any
+        non-null value, descending past a value includes null, and nothing is past null
+        in descending order (returns None). {field: {"$gt": None}} would match nothing.
+        """
+    if value is None:
+        return {field: {"$ne": None}} if direction == 1 else None
+    if direction == 1:
+        return {field: {"$gt": value}}
+    return {"$or": [{field: {"$lt": value}}, {field: None}]}
+
+
+def apply_cursor(query, sort, after):
+    """
+        Function to restrict a query to the documents strictly after the cursor position.
+        For a sort [(a, 1), (job_id, 1)] and cursor [x, y] this adds:
+            {"$or": [{a: {"$gt": x}}, {a: x, job_id: {"$gt": y}}]}
+        The sort must end with a unique field (job_id) so every position is unambiguous.
+        Sort keys may be null (e.g. a job posted without a salary), see past_value().
+        """
+    if after is None:
+        return query
+    if len(after) != len(sort):
+        raise PaginationError("Invalid 'after' cursor")
+
+    clauses = []
+    for i, (field, direction) in enumerate(sort):
+        # Equal on every previous sort key, past the cursor on this one
+        past = past_value(field, direction, after[i])
+        if past is None:
+            continue
+        clause = {sort[j][0]: after[j] for j in range(i)}
+        clause.update(past)
+        clauses.append(clause)
+
+    keyset = {"$or": clauses}
+    return {"$and": [query, keyset]} if query else keyset
+
+
+def take_page(docs, sort, limit):
+    """
+        Function to take up to 'limit' documents from an iterable of sorted documents.
+        Returns (page, next_cursor) where next_cursor is None on the last page.
+        Reads at most limit + 1 documents, so the iterable can be a live cursor.
+        """
+    page = []
+    for doc in docs:
+        if len(page) == limit:
+            # There is at least one more document: point the cursor at the last one returned
+            last = page[-1]
+            return page, encode_cursor([get_field(last, field) for field, _ in sort])
+        page.append(doc)
+    return page, None
+
+
+def fetch_page(collection, query, sort, limit, after=None, projection=None):
+    """
+        Function to fetch one page of documents with keyset pagination.
+        The cursor is limited to limit + 1 documents on the server.
+        """
+    cursor = collection.find(apply_cursor(query, sort, after), projection).sort(sort)
+    return take_page(cursor.limit(limit + 1), sort, limit)
+
+
+def build_pipeline(stages, sort, after=None, projection=None, limit=None):
+    """
+        Function to append the keyset stages to an aggregation pipeline:
+        cursor $match (on fields computed by 'stages'), $sort, optional $limit and $project.
+        """
+    pipeline = list(stages)
+    if after is not None:
+        pipeline.append({"$match": apply_cursor({}, sort, after)})
+    pipeline.append({"$sort": dict(sort)})
+    if limit:
+        pipeline.append({"$limit": limit})
+    if projection:
+        pipeline.append({"$project": projection})
+    return pipeline
+
+
+def aggregate_page(collection, stages, sort, limit, after=None, projection=None):
+    """
+        Function to fetch one page of an aggregation with keyset pagination,
+        for sort keys that are computed in the pipeline (e.g. a match count).
+        """
+    pipeline = build_pipeline(stages, sort, after, projection, limit + 1)
+    return take_page(collection.aggregate(pipeline), sort, limit)
@@ -0,0 +1,80 @@
+"""This module translates the 'fields' query parameter into MongoDB projections."""
+
+# Fields a client can ask for (top-level and embedded)
+JOB_FIELDS = [
+    '_id', 'job_id', 'title', 'years_of_experience', 'years_min', 'years_max',
+    'description', 'responsibilities',
+    'company', 'company.company_id', 'company.name', 'company.headquarters', 'company.size',
+    'company.type', 'company.website', 'company.description', 'company.industry_id',
+    'company.industry_name',
+    'education', 'education.education_id', 'education.level', 'education.field',
+    'skills', 'employment_type', 'average_salary', 'benefits', 'remote',
+    'job_posting_url', 'posting_date', 'closing_date', 'version', 'updated_at'
+]
+
+# Named field sets: 'full' is the whole document (minus internal fields)
+FIELD_PRESETS = {
+    'summary': [
+        'job_id', 'title', 'company.name', 'company.industry_name', 'company.headquarters',
+        'average_salary', 'employment_type', 'remote', 'posting_date'
+    ],
+    'full': None
+}
+
+# Projection used when the whole document is returned: hide the internal lookup fields
+FULL_PROJECTION = {"normalized": 0}
+
+
+class ProjectionError(ValueError):
+    """Raised when the 'fields' query parameter names an unknown field or preset."""
+
+
+def build_projection(fields_param, required=()):
+    """
+        Function to build a MongoDB projection from a 'fields' parameter such as
+        'summary', 'full' or 'title,company.name,average_salary' (presets and fields can be mixed).
+        'required' fields (e.g. the pagination sort keys) are always included.
+        """
+    if not fields_param:
+        return dict(FULL_PROJECTION)
+
+    fields = []
+    for name in fields_param.split(','):
+        name = name.strip()
+        if not name:
+            continue
+        if name in FIELD_PRESETS:
+            # 'full' wins over everything else
+            if FIELD_PRESETS[name] is None:
+                return dict(FULL_PROJECTION)
+            fields.extend(FIELD_PRESETS[name])
+        elif name in JOB_FIELDS:
+            fields.append(name)
+        else:
+            raise ProjectionError(f"Unknown field: {name}")
+
+    if not fields:
+        return dict(FULL_PROJECTION)
+
+    fields.extend(required)
+
+    # Drop embedded fields whose parent is already included (MongoDB rejects path collisions)
+    selected = dict.fromkeys(fields)
+    projection = {
+        field: 1 for field in selected
+        if '.' not in field or field.split('.')[0] not in selected
+    }
+
+    # _id is only returned when asked for
+    if '_id' not in projection:
+        projection['_id'] = 0
+
+    return projection
+
+
+def projection_key(projection):
+    """
+        Function to identify a projection independently of how 'fields' was written
+        (order, duplicates, presets), e.g. to key cached representations.
+        """
+    return repr(sorted(projection.items())).encode('utf-8')
@@ -0,0 +1,46 @@
+"""This module streams job query results as newline-delimited JSON (NDJSON)."""
+
+from flask import Response, current_app, stream_with_context
+
+NDJSON_MIMETYPE = 'application/x-ndjson'
+
+# Documents fetched from MongoDB per getMore while streaming:
+# large enough to keep round trips low, small enough to keep memory flat
+STREAM_BATCH_SIZE = 500
+
+
+def accepted_mimetype(request):
+    """
+        Function to negotiate the list representation from the Accept header
+        (JSON unless NDJSON is preferred).
+        """
+    return request.accept_mimetypes.best_match(['application/json', NDJSON_MIMETYPE]) or 'application/json'
+
+
+def wants_stream(request, query_params):
+    """
+        Function to check whether the client asked for an NDJSON stream,
+        either with ?stream=1 or with 'Accept: application/x-ndjson'.
+        """
+    if query_params.get('stream', '').lower() in ('1', 'true', 'yes'):
+        return True
+    return accepted_mimetype(request) == NDJSON_MIMETYPE
+
+
+def ndjson_response(docs, serialize):
+    """
+        Function to build a streaming response that writes one JSON document per line.
+        'docs' is consumed lazily (e.g. a live MongoDB cursor), so only the current
+        batch is held in memory and the first bytes go out as soon as they are ready.
+        """
+    def generate():
+        try:
+            for doc in docs:
+                yield current_app.json.dumps(serialize(doc)) + '\n'
+        finally:
+            # Release the server-side cursor if the client disconnects early
+            close = getattr(docs, 'close', None)
+            if close:
+                close()
+
+    return Response(stream_with_context(generate()), mimetype=NDJSON_MIMETYPE)
@@ -1,4 +1,4 @@
-"""This module will encode and parse the query string params."""
+"""This module will encode and parse the query string params and normalize lookup values."""
 
 from urllib.parse import parse_qs
 
@@ -11,4 +11,73 @@ def parse_query_params(query_string):
     query_params = dict(parse_qs(query_string))
     # Get the value from the list
     query_params = {k.decode(): v[0].decode() for k, v in query_params.items()}
-    return query_params
\ No newline at end of file
+    return query_params
+
+def normalize_lookup(value):
+    """
+        Function to normalize a lookup value (trimmed, lowercase)
+        so it can be matched exactly against the shadow fields.
+        """
+    if value is None:
+        return None
+    return str(value).strip().lower()
+
+
+def build_normalized_fields(job):
+    """
+        Function to build the lowercase shadow fields used by the
+        industry, location, company, skill and degree lookups.
+        Only the fields whose source is present in the job are returned,
+        so the result can also be used for partial updates.
+        """
+    normalized = {}
+
+    # Company fields: industry, location (headquarters) and name
+    company = job.get('company')
+    if isinstance(company, dict):
+        normalized['industry'] = normalize_lookup(company.get('industry_name'))
+        normalized['location'] = normalize_lookup(company.get('headquarters'))
+        normalized['company'] = normalize_lookup(company.get('name'))
+
+    # Education level
+    education = job.get('education')
+    if isinstance(education, dict):
+        normalized['degree'] = normalize_lookup(education.get('level'))
+
+    # Skills array (multikey)
+    if 'skills' in job:
+        normalized['skills'] = [normalize_lookup(skill) for skill in job['skills'] or []]
+
+    return normalized
+
+
+
+def parse_experience_range(value):
+    """
+        Function to parse a 'years_of_experience' string into (years_min, years_max).
+        '2-4' -> (2, 4), '5+' -> (5, None), '3' -> (3, 3); anything else -> (None, None).
+        """
+    if value is None:
+        return None, None
+    text = str(value).strip()
+
+    try:
+        if text.endswith('+'):
+            return int(text[:-1]), None
+        if '-' in text:
+            lower, upper = text.split('-', 1)
+            return int(lower), int(upper)
+        return int(text), int(text)
+    except ValueError:
+        return None, None
+
+
+def build_experience_fields(job):
+    """
+        Function to build the numeric experience bounds stored next to 'years_of_experience'.
+        Returns an empty dict when the job has no 'years_of_experience' (e.g. a partial update).
+        """
+    if 'years_of_experience' not in job:
+        return {}
+    years_min, years_max = parse_experience_range(job['years_of_experience'])
+    return {'years_min': years_min, 'years_max': years_max}
@@ -0,0 +1,164 @@
+"""
+Load comparison of the Flask app and the ASGI app (app/asgi.py).
+
+Sends GET requests over keep-alive connections to each target at increasing concurrency
+for a fixed duration, and reports requests per second and latency percentiles per target
+and concurrency level. Start both servers against the same database first, e.g.:
+
+    flask --app app run --port 5000 --with-threads
+    uvicorn app.asgi:asgi_app --port 5001
+
+Usage (from the repository root):
+    python benchmarks/async_load.py --target flask=http://localhost:5000 \\
+        --target asgi=http://localhost:5001 --concurrency 1,16,64,256 --duration 10
+"""
+
+import argparse
+import asyncio
+import itertools
+import json
+import time
+from urllib.parse import urlsplit
+
+import numpy as np
+
+# Paths requested in turn by every connection (the async read routes)
+DEFAULT_PATHS = [
+    '/jobs/0',
+    '/jobs/industry/Finance?limit=20',
+    '/jobs/skill/Python?limit=20',
+    '/jobs/salary?min_salary=80000&max_salary=120000&limit=20',
+    '/jobs/query?remote=true&min_salary=60000&limit=20',
+]
+
+
+# Send one GET over an open connection; returns the status code
+async def get(reader, writer, host, path):
+    writer.write(f"GET {path} HTTP/1.1\r\nHost: {host}\r\nConnection: keep-alive\r\n\r\n".encode('latin-1'))
+    await writer.drain()
+
+    status_line = await reader.readline()
+    if not status_line:
+        raise ConnectionError("connection closed by the server")
+    status = int(status_line.split()[1])
+
+    length, chunked, closing = 0, False, False
+    while True:
+        line = await reader.readline()
+        if line in (b'\r\n', b''):
+            break
+        name, _, value = line.decode('latin-1').partition(':')
+        name, value = name.strip().lower(), value.strip().lower()
+        if name == 'content-length':
+            length = int(value)
+        elif name == 'transfer-encoding' and 'chunked' in value:
+            chunked = True
+        elif name == 'connection' and value == 'close':
+            closing = True
+
+    if chunked:
+        while True:
+            size = int((await reader.readline()).split(b';')[0], 16)
+            await reader.readexactly(size + 2)
+            if size == 0:
+                break
+    elif length:
+        await reader.readexactly(length)
+    return status, closing
+
+
+# One client connection: request the paths in turn until 'deadline'
+async def client(base_url, paths, deadline, latencies, errors):
+    url = urlsplit(base_url)
+    host, port = url.hostname, url.port or 80
+    connection = None
+    for path in itertools.cycle(paths):
+        if time.perf_counter() >= deadline:
+            break
+        try:
+            if connection is None:
+                connection = await asyncio.open_connection(host, port)
+            started = time.perf_counter()
+            status, closing = await get(*connection, url.netloc, path)
+            latencies.append(time.perf_counter() - started)
+            if status >= 500:
+                errors.append(status)
+            if closing:
+                connection[1].close()
+                connection = None
+        except (OSError, ConnectionError, asyncio.IncompleteReadError, ValueError) as e:
+            errors.append(type(e).__name__)
+            if connection is not None:
+                connection[1].close()
+            connection = None
+    if connection is not None:
+        connection[1].close()
+
+
+# Run 'concurrency' connections against one target for 'duration' seconds
+async def run_level(base_url, paths, concurrency, duration):
+    latencies, errors = [], []
+    started = time.perf_counter()
+    deadline = started + duration
+    await asyncio.gather(*[
+        client(base_url, paths[i % len(paths):] + paths[:i % len(paths)], deadline, latencies, errors)
+        for i in range(concurrency)
+    ])
+    seconds = time.perf_counter() - started
+
+    result = {
+        'concurrency': concurrency,
+        'requests': len(latencies),
+        'errors': len(errors),
+        'requests_per_second': round(len(latencies) / seconds, 1)
+    }
+    if latencies:
+        p50, p95, p99 = np.percentile(np.array(latencies) * 1000, [50, 95, 99])
+        result.update({'p50_ms': round(p50, 2), 'p95_ms': round(p95, 2), 'p99_ms': round(p99, 2)})
+    return result
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument('--target', action='append', required=True,
+                        help="name=base_url of a server to load (repeat for each server)")
+    parser.add_argument('--concurrency', default='1,16,64,256',
+                        help="comma-separated numbers of concurrent connections (default: 1,16,64,256)")
+    parser.add_argument('--duration', type=float, default=10, help="seconds per concurrency level (default: 10)")
+    parser.add_argument('--path', action='append', default=None,
+                        help="path to request (repeat for several; default: the async read routes)")
+    parser.add_argument('--output', default=None, help="also write the results as JSON")
+    args = parser.parse_args()
+
+    targets = [target.split('=', 1) for target in args.target]
+    levels = [int(level) for level in args.concurrency.split(',')]
+    paths = args.path or DEFAULT_PATHS
+
+    results = {name: [] for name, _ in targets}
+    print(f"{'target':>10} {'conns':>6} {'requests':>9} {'errors':>7} {'req/s':>9} "
+          f"{'p50 ms':>8} {'p95 ms':>8} {'p99 ms':>8}")
+    for level in levels:
+        for name, base_url in targets:
+            result = asyncio.run(run_level(base_url, paths, level, args.duration))
+            results[name].append(result)
+            print(f"{name:>10} {level:>6} {result['requests']:>9} {result['errors']:>7} "
+                  f"{result['requests_per_second']:>9,.0f} {result.get('p50_ms', 0):>8.1f} "
+                  f"{result.get('p95_ms', 0):>8.1f} {result.get('p99_ms', 0):>8.1f}")
+
+    # Throughput of each target relative to the first one
+    if len(targets) > 1:
+        first = targets[0][0]
+        print()
+        for name, _ in targets[1:]:
+            for mine, theirs in zip(results[name], results[first]):
+                ratio = mine['requests_per_second'] / theirs['requests_per_second'] if theirs['requests_per_second'] else 0
+                print(f"{name} vs {first} at {mine['concurrency']:>4} connections: {ratio:.2f}x")
+
+    if args.output:
+        with open(args.output, 'w', encoding='utf-8') as f:
+            json.dump({'duration': args.duration, 'paths': paths, 'results': results}, f, indent=2)
+        print(f"\n✓ Saved results to {args.output}")
+
+
+if __name__ == '__main__':
+    main()
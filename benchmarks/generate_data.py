@@ -0,0 +1,200 @@
+"""
+Synthetic CareerHub feed generator.
+
+Writes the six CSV files transform.py reads (companies, industries, education, skills,
+jobs, jobs_detail) at any scale. Every id a row refers to exists in its dimension file,
+jobs and jobs_detail are sorted by job id (so `transform.py --stream` can read them), and
+the text values are sampled from the real files in data/ so documents have realistic sizes.
+Jobs are written in chunks, so memory use does not grow with --jobs.
+
+Usage (from the repository root):
+    python benchmarks/generate_data.py --jobs 1000000 --out-dir bench_data/1m
+"""
+
+import argparse
+import os
+import re
+import time
+
+import numpy as np
+import pandas as pd
+
+# The real feed, used as the vocabulary for the generated values
+SOURCE_DIR = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), 'data')
+
+# Jobs generated and written per chunk
+CHUNK_SIZE = 100000
+
+# Skills listed per job (inclusive range)
+MIN_SKILLS, MAX_SKILLS = 3, 7
+
+
+# Load the real CSV files to sample values from
+def load_vocabulary(source_dir=SOURCE_DIR):
+    return {
+        name: pd.read_csv(os.path.join(source_dir, f'{name}.csv'))
+        for name in ['companies', 'industries', 'education', 'skills', 'jobs', 'jobs_detail']
+    }
+
+
+# Pick n values of a column at random
+def sample(rng, values, n):
+    values = np.asarray(values, dtype=object)
+    return values[rng.integers(0, len(values), n)]
+
+
+# n distinct names built from a list of real ones ("Finance", ..., "Finance 2", ...)
+def unique_names(names, n):
+    names = list(names)
+    return [
+        names[i % len(names)] if i < len(names) else f"{names[i % len(names)]} {i // len(names) + 1}"
+        for i in range(n)
+    ]
+
+
+# industries.csv: names, skills, companies and trends from the real industries
+def generate_industries(rng, vocabulary, count):
+    source = vocabulary['industries']
+    return pd.DataFrame({
+        # The real file lists industries out of id order
+        'id': rng.permutation(count),
+        'industry_name': unique_names(source['industry_name'], count),
+        'industry_skills': sample(rng, source['industry_skills'], count),
+        'top_companies': sample(rng, source['top_companies'], count),
+        'trends': sample(rng, source['trends'], count)
+    })
+
+
+# companies.csv: each company belongs to one of the generated industries
+def generate_companies(rng, vocabulary, count, industry_ids):
+    source = vocabulary['companies']
+    names = unique_names(source['company_name'], count)
+    return pd.DataFrame({
+        'id': np.arange(count),
+        'industry_id': sample(rng, industry_ids, count),
+        'company_name': names,
+        'company_size': sample(rng, source['company_size'], count),
+        'company_type': sample(rng, source['company_type'], count),
+        'company_headquarters': sample(rng, source['company_headquarters'], count),
+        'company_website': [f"https://{re.sub('[^a-z0-9]', '', name.lower())}.com" for name in names],
+        'company_description': sample(rng, source['company_description'], count)
+    })
+
+
+# education.csv: (level, field) pairs from the real rows
+def generate_education(rng, vocabulary, count):
+    source = vocabulary['education'].iloc[rng.integers(0, len(vocabulary['education']), count)]
+    return pd.DataFrame({
+        'id': np.arange(count),
+        'level': source['level'].to_numpy(),
+        'field': source['field'].to_numpy()
+    })
+
+
+# skills.csv: real skill names, made unique past the real count
+def generate_skills(rng, vocabulary, count):
+    return pd.DataFrame({
+        'id': rng.permutation(count),
+        'skill': unique_names(vocabulary['skills']['skill'], count)
+    })
+
+
+# One chunk of jobs.csv and the matching jobs_detail.csv rows, for job ids [start, start + count)
+def generate_job_chunk(rng, vocabulary, start, count, company_count, education_count, skill_ids):
+    # Title, description and responsibilities come from the same real job
+    source = vocabulary['jobs'].iloc[rng.integers(0, len(vocabulary['jobs']), count)]
+    job_ids = np.arange(start, start + count)
+
+    skill_counts = rng.integers(MIN_SKILLS, MAX_SKILLS + 1, count)
+    skill_matrix = sample(rng, skill_ids, count * MAX_SKILLS).astype(str).reshape(count, MAX_SKILLS)
+    skills = [
+        '[' + ', '.join(row[:skill_count]) + ']'
+        for row, skill_count in zip(skill_matrix.tolist(), skill_counts.tolist())
+    ]
+
+    jobs = pd.DataFrame({
+        'id': job_ids,
+        'company_id': rng.integers(0, company_count, count),
+        'title': source['title'].to_numpy(),
+        'years_of_experience': sample(rng, vocabulary['jobs']['years_of_experience'], count),
+        'description': source['description'].to_numpy(),
+        'responsibilities': source['responsibilities'].to_numpy(),
+        'education_id': rng.integers(0, education_count, count),
+        'skills_requirement': skills
+    })
+
+    details_source = vocabulary['jobs_detail']
+    posting = pd.Timestamp('2024-01-01') + pd.to_timedelta(rng.integers(0, 730, count), unit='D')
+    closing = posting + pd.to_timedelta(rng.integers(1, 61, count), unit='D')
+    details = pd.DataFrame({
+        'job_id': job_ids,
+        'employment_type': sample(rng, details_source['employment_type'], count),
+        'average_salary': rng.integers(40000, 150000, count),
+        'benefits': sample(rng, details_source['benefits'], count),
+        'remote': rng.random(count) < 0.5,
+        'job_posting_url': sample(rng, details_source['job_posting_url'], count),
+        'posting_date': posting.strftime('%m/%d/%Y'),
+        'closing_date': closing.strftime('%m/%d/%Y')
+    })
+
+    return jobs, details
+
+
+# Write a full feed into out_dir; returns the number of rows written per file
+def generate_feed(out_dir, jobs, companies=None, industries=20, education=110, skills=250, seed=42):
+    rng = np.random.default_rng(seed)
+    vocabulary = load_vocabulary()
+    # About one company per thousand jobs, and at least as many as the real feed
+    companies = companies or max(100, jobs // 1000)
+    os.makedirs(out_dir, exist_ok=True)
+
+    industries_df = generate_industries(rng, vocabulary, industries)
+    companies_df = generate_companies(rng, vocabulary, companies, industries_df['id'])
+    education_df = generate_education(rng, vocabulary, education)
+    skills_df = generate_skills(rng, vocabulary, skills)
+    for name, df in [('industries', industries_df), ('companies', companies_df),
+                     ('education', education_df), ('skills', skills_df)]:
+        df.to_csv(os.path.join(out_dir, f'{name}.csv'), index=False)
+
+    jobs_file = os.path.join(out_dir, 'jobs.csv')
+    details_file = os.path.join(out_dir, 'jobs_detail.csv')
+    for start in range(0, max(jobs, 1), CHUNK_SIZE):
+        count = min(CHUNK_SIZE, jobs - start)
+        jobs_df, details_df = generate_job_chunk(
+            rng, vocabulary, start, count, companies, education, skills_df['id']
+        )
+        # The first chunk creates the files (with the header), the others append
+        mode, header = ('w', True) if start == 0 else ('a', False)
+        jobs_df.to_csv(jobs_file, mode=mode, header=header, index=False)
+        details_df.to_csv(details_file, mode=mode, header=header, index=False)
+
+    return {
+        'jobs': jobs, 'jobs_detail': jobs, 'companies': companies,
+        'industries': industries, 'education': education, 'skills': skills
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument('--jobs', type=int, default=100000, help="number of jobs (default: 100000)")
+    parser.add_argument('--out-dir', default=None, help="output folder (default: bench_data/<jobs>)")
+    parser.add_argument('--companies', type=int, default=None,
+                        help="number of companies (default: jobs / 1000, at least 100)")
+    parser.add_argument('--industries', type=int, default=20)
+    parser.add_argument('--education', type=int, default=110)
+    parser.add_argument('--skills', type=int, default=250)
+    parser.add_argument('--seed', type=int, default=42, help="random seed; the same seed gives the same files")
+    args = parser.parse_args()
+
+    out_dir = args.out_dir or os.path.join('bench_data', str(args.jobs))
+    started = time.perf_counter()
+    counts = generate_feed(
+        out_dir, args.jobs, args.companies, args.industries, args.education, args.skills, args.seed
+    )
+    seconds = time.perf_counter() - started
+    print(f"✓ Generated {', '.join(f'{count} {name}' for name, count in counts.items())} "
+          f"in {out_dir} ({seconds:.1f}s)")
+
+
+if __name__ == '__main__':
+    main()
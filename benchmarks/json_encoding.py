@@ -0,0 +1,83 @@
+"""
+Microbenchmark of the JSON encoding of list responses.
+
+Builds pages of job documents from jobs.json, shaped like MongoDB returns them (an
+ObjectId _id and a datetime updated_at), and times rendering one list response
+({"count", "jobs", "page"}) per page size with each JSON_PROVIDER:
+    default  Flask's provider (stdlib json), after serialize_doc copies each _id to a string
+    orjson   the orjson provider, which encodes the documents as they are
+Times include everything a route does after the query (serialize_jobs and the encoding).
+
+Usage (from the repository root):
+    python benchmarks/json_encoding.py --sizes 10,50,500 --repeat 200
+"""
+
+import argparse
+import json
+import os
+import sys
+import time
+from datetime import datetime, timezone
+
+from bson.objectid import ObjectId
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, ROOT)
+from app import create_app, jobs
+
+
+# Jobs from jobs.json as MongoDB returns them, repeated up to 'count' documents
+def load_documents(count, path=os.path.join(ROOT, 'jobs.json')):
+    with open(path, 'r', encoding='utf-8') as f:
+        corpus = json.load(f)
+    updated_at = datetime(2025, 1, 1, tzinfo=timezone.utc)
+    return [
+        {**corpus[i % len(corpus)], "_id": ObjectId(), "version": 1, "updated_at": updated_at}
+        for i in range(count)
+    ]
+
+
+# Render one list response the way the routes do; returns the body size
+def render(app, docs):
+    with app.test_request_context('/jobs/salary'):
+        # The routes get fresh documents from MongoDB for every request
+        jobs_list = jobs.serialize_jobs([dict(doc) for doc in docs])
+        response = app.json.response({
+            "count": len(jobs_list),
+            "jobs": jobs_list,
+            "page": {"limit": len(jobs_list), "after": None, "next": "WzEyMzQ1LDY3OF0"}
+        })
+        return len(response.get_data())
+
+
+# Best time per response over 'repeat' runs (the document copy is included, the same in every mode)
+def measure(app, docs, repeat):
+    best = float('inf')
+    for _ in range(repeat):
+        started = time.perf_counter()
+        size = render(app, docs)
+        best = min(best, time.perf_counter() - started)
+    return best, size
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument('--sizes', default='10,50,500', help="comma-separated page sizes (default: 10,50,500)")
+    parser.add_argument('--repeat', type=int, default=200, help="runs per case, the best is kept (default: 200)")
+    args = parser.parse_args()
+
+    apps = {provider: create_app({"JSON_PROVIDER": provider}) for provider in ('default', 'orjson')}
+
+    print(f"{'jobs':>6} {'encoder':>12} {'ms':>9} {'MB/s':>9} {'speedup':>8}")
+    for size in [int(size) for size in args.sizes.split(',')]:
+        docs = load_documents(size)
+        baseline = None
+        for provider, app in apps.items():
+            seconds, body = measure(app, docs, args.repeat)
+            baseline = baseline or seconds
+            print(f"{size:>6} {provider:>12} {seconds * 1000:>9.3f} {body / seconds / 2 ** 20:>9.1f} "
+                  f"{baseline / seconds:>7.2f}x")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,174 @@
+"""
+Benchmark harness for the transform pipeline.
+
+Runs the stages of transform.py (load_data, create_lookups, transform_jobs,
+transform_industries, save_json) on a generated feed and records, per stage, the wall
+time, rows per second, resident memory after the stage and the peak RSS so far.
+Results are written as JSON; with --baseline a previous results file is compared
+stage by stage and the exit status is 1 when a stage got slower than --tolerance allows.
+
+Usage (from the repository root):
+    python benchmarks/transform_pipeline.py --jobs 1000000 --output results-1m.json
+    python benchmarks/transform_pipeline.py --jobs 1000000 --baseline results-1m.json
+"""
+
+import argparse
+import contextlib
+import io
+import json
+import os
+import platform
+import resource
+import subprocess
+import sys
+import tempfile
+import time
+from datetime import datetime, timezone
+
+import pandas as pd
+
+# transform.py loads the app modules with paths relative to the repository root
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+os.chdir(ROOT)
+sys.path.insert(0, ROOT)
+import transform
+
+# Stages this short are reported but not compared: their timings are mostly noise
+MIN_COMPARED_SECONDS = 0.05
+
+
+# Current and peak resident memory of this process, in MB
+def memory_mb():
+    with open('/proc/self/statm') as f:
+        rss_pages = int(f.read().split()[1])
+    current = rss_pages * os.sysconf('SC_PAGE_SIZE') / 2 ** 20
+    # ru_maxrss is in KB on Linux
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss / 1024
+    return current, peak
+
+
+# Run one stage and record its measurements; returns the stage's result
+def measure(results, stage, rows, function, *args):
+    started = time.perf_counter()
+    # Stages print progress (and a warning per job without an industry)
+    with contextlib.redirect_stdout(io.StringIO()):
+        value = function(*args)
+    seconds = time.perf_counter() - started
+    current, peak = memory_mb()
+
+    rows = rows(value) if callable(rows) else rows
+    results.append({
+        'stage': stage,
+        'rows': rows,
+        'seconds': round(seconds, 4),
+        'rows_per_second': round(rows / seconds, 1) if seconds else None,
+        'rss_mb': round(current, 1),
+        'peak_rss_mb': round(peak, 1)
+    })
+    print(f"{stage:>20} {rows:>10} {seconds:>9.2f} {results[-1]['rows_per_second'] or 0:>12,.0f} "
+          f"{current:>9.0f} {peak:>9.0f}")
+    return value
+
+
+# Run every stage on the feed in data_dir
+def run_pipeline(data_dir):
+    results = []
+    print(f"{'stage':>20} {'rows':>10} {'seconds':>9} {'rows/s':>12} {'rss MB':>9} {'peak MB':>9}")
+
+    frames = measure(results, 'load_data', lambda frames: sum(len(df) for df in frames),
+                     transform.load_data, data_dir)
+    jobs_df, jobs_detail_df, companies_df, industries_df, education_df, skills_df = frames
+    lookups = measure(results, 'create_lookups', len(companies_df) + len(industries_df)
+                      + len(education_df) + len(skills_df),
+                      transform.create_lookups, companies_df, industries_df, education_df, skills_df)
+    jobs = measure(results, 'transform_jobs', len(jobs_df),
+                   transform.transform_jobs, jobs_df, jobs_detail_df, lookups)
+    industries = measure(results, 'transform_industries', len(industries_df),
+                         transform.transform_industries, industries_df)
+
+    with tempfile.TemporaryDirectory() as out_dir:
+        measure(results, 'save_json', len(jobs), transform.save_json, jobs, os.path.join(out_dir, 'jobs.json'))
+        measure(results, 'save_json (industries)', len(industries),
+                transform.save_json, industries, os.path.join(out_dir, 'industries.json'))
+
+    return results
+
+
+# Compare with a previous results file; returns the stages slower than 'tolerance' allows
+def compare(results, baseline, tolerance):
+    previous = {stage['stage']: stage for stage in baseline['stages']}
+    regressions = []
+    print(f"\n{'stage':>20} {'baseline s':>11} {'now s':>9} {'ratio':>7}")
+    for stage in results:
+        before = previous.get(stage['stage'])
+        if not before or max(before['seconds'], stage['seconds']) < MIN_COMPARED_SECONDS:
+            continue
+        ratio = stage['seconds'] / before['seconds']
+        slower = ratio > 1 + tolerance
+        print(f"{stage['stage']:>20} {before['seconds']:>11.2f} {stage['seconds']:>9.2f} {ratio:>6.2f}x"
+              f"{'  REGRESSION' if slower else ''}")
+        if slower:
+            regressions.append(stage['stage'])
+    return regressions
+
+
+# Commit the benchmark ran on, when run from a git checkout
+def git_commit():
+    try:
+        return subprocess.run(['git', 'rev-parse', '--short', 'HEAD'], capture_output=True,
+                              text=True, check=True).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        return None
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument('--jobs', type=int, default=100000,
+                        help="generate a feed of this many jobs (default: 100000)")
+    parser.add_argument('--data-dir', default=None,
+                        help="feed folder; generated when it has no jobs.csv (default: bench_data/<jobs>)")
+    parser.add_argument('--seed', type=int, default=42)
+    parser.add_argument('--output', default='transform_benchmark.json',
+                        help="results file (default: transform_benchmark.json)")
+    parser.add_argument('--baseline', default=None, help="previous results file to compare with")
+    parser.add_argument('--tolerance', type=float, default=0.2,
+                        help="allowed slowdown per stage against the baseline (default: 0.2 = 20%%)")
+    args = parser.parse_args()
+
+    data_dir = args.data_dir or os.path.join('bench_data', str(args.jobs))
+    if not os.path.exists(os.path.join(data_dir, 'jobs.csv')):
+        # In a separate process, so the generator's memory does not count towards the peak RSS
+        subprocess.run([
+            sys.executable, os.path.join(ROOT, 'benchmarks', 'generate_data.py'),
+            '--jobs', str(args.jobs), '--out-dir', data_dir, '--seed', str(args.seed)
+        ], check=True)
+        print()
+
+    stages = run_pipeline(data_dir)
+    report = {
+        'benchmark': 'transform_pipeline',
+        'created_at': datetime.now(timezone.utc).isoformat(),
+        'commit': git_commit(),
+        'jobs': stages[2]['rows'],
+        'data_dir': data_dir,
+        'python': platform.python_version(),
+        'pandas': pd.__version__,
+        'cpus': os.cpu_count(),
+        'total_seconds': round(sum(stage['seconds'] for stage in stages), 4),
+        'peak_rss_mb': max(stage['peak_rss_mb'] for stage in stages),
+        'stages': stages
+    }
+    with open(args.output, 'w', encoding='utf-8') as f:
+        json.dump(report, f, indent=2)
+    print(f"\n✓ Saved results to {args.output}")
+
+    if args.baseline:
+        with open(args.baseline, 'r', encoding='utf-8') as f:
+            regressions = compare(stages, json.load(f), args.tolerance)
+        if regressions:
+            print(f"\n✗ Slower than the baseline: {', '.join(regressions)}")
+            sys.exit(1)
+
+
+if __name__ == '__main__':
+    main()
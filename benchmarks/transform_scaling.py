@@ -0,0 +1,90 @@
+"""
+Scaling benchmark for `transform.py --workers`.
+
+Replicates the CSV feed in data/ to a larger catalogue (new job ids, same companies,
+industries, education and skills), then times transform + JSON encoding of every job
+with 1 process (the serial transform_jobs) and with each pool size.
+
+Usage (from the repository root):
+    python benchmarks/transform_scaling.py --copies 200 --workers 1,2,4,8
+"""
+
+import argparse
+import contextlib
+import io
+import os
+import sys
+import time
+
+import numpy as np
+import pandas as pd
+
+# transform.py loads the app modules with paths relative to the repository root
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+os.chdir(ROOT)
+sys.path.insert(0, ROOT)
+import transform
+
+
+# Repeat the jobs feed 'copies' times with fresh job ids
+def replicate_feed(jobs_df, jobs_detail_df, copies):
+    jobs_df = pd.concat([jobs_df] * copies, ignore_index=True)
+    jobs_detail_df = pd.concat([jobs_detail_df] * copies, ignore_index=True)
+    jobs_df['id'] = np.arange(len(jobs_df))
+    jobs_detail_df['job_id'] = np.arange(len(jobs_detail_df))
+    return jobs_df, jobs_detail_df
+
+
+# Time one transform of the whole feed; returns (seconds, jobs)
+def run(jobs_df, jobs_detail_df, lookups, workers):
+    started = time.perf_counter()
+    count = 0
+    # The transform prints a warning per job without an industry
+    with contextlib.redirect_stdout(io.StringIO()):
+        if workers == 1:
+            chunks = [transform_serial(jobs_df, jobs_detail_df, lookups)]
+        else:
+            shards = transform.shard_jobs(jobs_df, jobs_detail_df, workers * 4)
+            chunks = transform.transform_jobs_parallel(shards, lookups, workers, 'json')
+        for documents in chunks:
+            count += len(documents)
+    return time.perf_counter() - started, count
+
+
+# The serial path: transform_jobs in this process, encoded like the workers do
+def transform_serial(jobs_df, jobs_detail_df, lookups):
+    jobs = transform.transform_jobs(jobs_df, jobs_detail_df, lookups)
+    return [transform.encode_document(job, 'json') for job in jobs]
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument('--copies', type=int, default=200, help="times the 380-job feed is repeated")
+    parser.add_argument('--workers', default=None,
+                        help="comma-separated pool sizes (default: 1, 2, 4, ... up to the CPU count)")
+    parser.add_argument('--repeat', type=int, default=1, help="runs per pool size (the best is kept)")
+    args = parser.parse_args()
+
+    cpus = os.cpu_count() or 1
+    if args.workers:
+        pool_sizes = [int(w) for w in args.workers.split(',')]
+    else:
+        pool_sizes = [1]
+        while pool_sizes[-1] * 2 <= cpus:
+            pool_sizes.append(pool_sizes[-1] * 2)
+
+    jobs_df, jobs_detail_df, companies_df, industries_df, education_df, skills_df = transform.load_data()
+    lookups = transform.create_lookups(companies_df, industries_df, education_df, skills_df)
+    jobs_df, jobs_detail_df = replicate_feed(jobs_df, jobs_detail_df, args.copies)
+
+    print(f"{len(jobs_df)} jobs, {cpus} CPUs")
+    print(f"{'workers':>8} {'seconds':>9} {'jobs/s':>10} {'speedup':>8}")
+    baseline = None
+    for workers in pool_sizes:
+        seconds, count = min(run(jobs_df, jobs_detail_df, lookups, workers) for _ in range(args.repeat))
+        baseline = baseline or seconds
+        print(f"{workers:>8} {seconds:>9.2f} {count / seconds:>10,.0f} {baseline / seconds:>7.2f}x")
+
+
+if __name__ == '__main__':
+    main()
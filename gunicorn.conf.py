@@ -0,0 +1,69 @@
+"""
+Gunicorn settings for serving the app in production, read from environment variables.
+
+    gunicorn                      # picks up this file from the working directory
+    GUNICORN_WORKERS=8 GUNICORN_THREADS=4 gunicorn
+    kill -HUP <master pid>        # graceful restart: new workers start, old ones finish their requests
+
+run-app.py (Werkzeug debug server with the reloader) stays the launcher for local development.
+"""
+
+import multiprocessing
+import os
+
+
+def env_int(name, default):
+    value = os.environ.get(name)
+    return int(value) if value else default
+
+
+def env_flag(name, default):
+    return os.environ.get(name, '1' if default else '0').lower() in ('1', 'true', 'yes')
+
+
+# What to serve: the Flask app, or 'app.asgi:asgi_app' with GUNICORN_WORKER_CLASS=uvicorn.workers.UvicornWorker
+wsgi_app = os.environ.get('GUNICORN_APP', 'wsgi:app')
+bind = os.environ.get('GUNICORN_BIND', f"0.0.0.0:{os.environ.get('PORT', '5000')}")
+
+# Worker processes (default: 2 per CPU + 1) and threads per worker; with threads > 1 the
+# threaded worker is used, so a worker keeps serving while its other requests wait on MongoDB
+workers = env_int('GUNICORN_WORKERS', env_int('WEB_CONCURRENCY', multiprocessing.cpu_count() * 2 + 1))
+threads = env_int('GUNICORN_THREADS', 4)
+worker_class = os.environ.get('GUNICORN_WORKER_CLASS', 'gthread' if threads > 1 else 'sync')
+
+# Load the app in the master before forking: faster worker starts and shared memory pages,
+# but a HUP then restarts the workers on the code the master loaded (restart the master to deploy)
+preload_app = env_flag('GUNICORN_PRELOAD', False)
+
+# Recycle each worker after about this many requests (0: never); the jitter spreads the
+# restarts so the workers do not all recycle at once
+max_requests = env_int('GUNICORN_MAX_REQUESTS', 10000)
+max_requests_jitter = env_int('GUNICORN_MAX_REQUESTS_JITTER', max_requests // 10)
+
+# A worker silent for 'timeout' seconds is killed and replaced; on restart or shutdown,
+# workers get 'graceful_timeout' seconds to finish the requests they are serving
+timeout = env_int('GUNICORN_TIMEOUT', 30)
+graceful_timeout = env_int('GUNICORN_GRACEFUL_TIMEOUT', 30)
+keepalive = env_int('GUNICORN_KEEPALIVE', 5)
+
+accesslog = os.environ.get('GUNICORN_ACCESS_LOG', '-')
+errorlog = os.environ.get('GUNICORN_ERROR_LOG', '-')
+loglevel = os.environ.get('GUNICORN_LOG_LEVEL', 'info')
+
+
+def on_starting(server):
+    # Backfill the derived fields and create the indexes once, in the master (INIT_DB=0 to skip)
+    if not env_flag('INIT_DB', True):
+        return
+    from app import create_app
+    from app.jobs import init_db
+
+    app = create_app()
+    try:
+        with app.app_context():
+            init_db()
+    except Exception as e:
+        server.log.warning(f"Could not prepare the database: {e}")
+    finally:
+        # The workers open their own clients after fork
+        app.extensions['mongo'].reset()
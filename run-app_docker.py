@@ -1,11 +1,23 @@
-from app import app
+from app import create_app
+from app.jobs import init_db
+
+# Settings come from the environment (see app/config.py)
+app = create_app()
 
 if __name__ == '__main__':
     ''' 
         Running app in debug mode
         It will trace errors if produced and display them
         Each time a change is made in code, the changes will reflect instantaneously. 
+        For local development only: in production run gunicorn (see gunicorn.conf.py)
     '''
+    # Backfill the derived fields and create the indexes (safe to run on every startup)
+    try:
+        with app.app_context():
+            init_db()
+    except Exception as e:
+        print(f"Warning: could not prepare the database: {e}")
+
     # To access the app from our host machine, we bind 0.0.0.0 to the host of the server.
     # otherwise, localhost:5000 is only accessible from within the Docker container
     app.run(debug=True, host='0.0.0.0')
\ No newline at end of file
@@ -1,19 +1,39 @@
 import pandas as pd          
+import numpy as np
 import json                  
-from datetime import datetime 
 import ast                   
+import argparse
+import multiprocessing
+import os
+import time
+from collections import deque
+from datetime import datetime, timezone
+from pymongo import MongoClient, UpdateOne
+from pymongo.errors import BulkWriteError
+
+# Import the utils module (shared with the Flask app; the app package only defines the
+# app factory, so this imports neither the routes nor a MongoDB client)
+from app import utils
+# Index definitions and the job_id counter, used by --load
+from app import ids, indexes
 
 # Load all CSV files 
-def load_data():
-    jobs_df = pd.read_csv('data/jobs.csv')
-    jobs_detail_df = pd.read_csv('data/jobs_detail.csv')
-    companies_df = pd.read_csv('data/companies.csv')
-    industries_df = pd.read_csv('data/industries.csv')
-    education_df = pd.read_csv('data/education.csv')
-    skills_df = pd.read_csv('data/skills.csv')
+def load_data(data_dir='data'):
+    jobs_df = pd.read_csv(os.path.join(data_dir, 'jobs.csv'))
+    jobs_detail_df = pd.read_csv(os.path.join(data_dir, 'jobs_detail.csv'))
+    companies_df, industries_df, education_df, skills_df = load_dimensions(data_dir)
 
     return jobs_df, jobs_detail_df, companies_df, industries_df, education_df, skills_df
 
+# Load only the small dimension tables (the streaming mode reads the job files in chunks)
+def load_dimensions(data_dir='data'):
+    companies_df = pd.read_csv(os.path.join(data_dir, 'companies.csv'))
+    industries_df = pd.read_csv(os.path.join(data_dir, 'industries.csv'))
+    education_df = pd.read_csv(os.path.join(data_dir, 'education.csv'))
+    skills_df = pd.read_csv(os.path.join(data_dir, 'skills.csv'))
+
+    return companies_df, industries_df, education_df, skills_df
+
 # Create lookup dictionaries
 def create_lookups(companies_df, industries_df, education_df, skills_df):
     # Create lookup dictionaries
@@ -32,33 +52,61 @@ def create_lookups(companies_df, industries_df, education_df, skills_df):
 
     return lookups
 
-# Convert skill IDs to skill names
-def parse_skills(skills_string, skills_dict):
-    # Handle missing or NaN skill fields
-    if not skills_string or pd.isna(skills_string):
-        return []
-    
-    # Parse JSON-formatted skill IDs
-    skill_ids = json.loads(skills_string)
+# One row per (job, skill ID) from a column of skill ID lists, keeping the job's index and the skill order
+def explode_skill_ids(skills_series):
+    skill_ids = (
+        skills_series.dropna().astype(str)
+        .str.strip('[]').str.split(',')
+        .explode().str.strip()
+    )
+    return skill_ids[skill_ids != ''].astype(int)
 
-    # Convert each skill ID to its corresponding name
-    skill_names = []
-    for skill_id in skill_ids:
-        if skill_id in skills_dict:
-            skill_names.append(skills_dict[skill_id])
+# Convert a column of skill ID lists ("[14, 1, 2]") to lists of skill names
+def parse_skills(skills_series, skills_dict):
+    skills_series = skills_series.reset_index(drop=True)
+    skill_ids = explode_skill_ids(skills_series)
 
-    return skill_names
+    # Unknown skill IDs are skipped
+    skill_ids = skill_ids[skill_ids.isin(skills_dict.keys())]
+    skill_names = skill_ids.map(skills_dict).tolist()
 
-# Convert date strings to ISO format
-def convert_date(date_string):
-    # Handle missing or invalid date values
-    if not date_string or pd.isna(date_string):
-        return None
+    # Back to one list per job: the exploded rows of a job are contiguous,
+    # so each job's skills are a slice between two positions (missing or empty fields give [])
+    positions = skill_ids.index.to_numpy()
+    rows = np.arange(len(skills_series))
+    starts = np.searchsorted(positions, rows, side='left')
+    ends = np.searchsorted(positions, rows, side='right')
+    return [skill_names[start:end] for start, end in zip(starts, ends)]
 
-    # Parse date and convert to ISO (YYYY-MM-DD) format
-    date_obj = datetime.strptime(date_string, "%m/%d/%Y")
+# Convert a column of date strings (MM/DD/YYYY) to ISO format, None for missing values
+def convert_dates(date_series):
+    # Dates repeat a lot: parse and format each distinct value once
+    codes, unique_dates = pd.factorize(date_series)
+    iso_dates = pd.to_datetime(pd.Series(unique_dates), format="%m/%d/%Y")
+    iso_dates = iso_dates.dt.strftime("%Y-%m-%dT%H:%M:%S").tolist()
+    # factorize gives missing values the code -1
+    return [iso_dates[code] if code >= 0 else None for code in codes]
 
-    return date_obj.isoformat()
+# Rebuild the company, industry and education lookups as frames to merge against
+def lookup_frames(lookups):
+    companies = pd.DataFrame.from_dict(lookups['companies'], orient='index')
+    companies = companies.rename_axis('company_id').reset_index()
+
+    industries = pd.DataFrame.from_dict(lookups['industries'], orient='index')
+    industries = industries.rename_axis('industry_id').reset_index()[['industry_id', 'industry_name']]
+
+    education = pd.DataFrame.from_dict(lookups['education'], orient='index')
+    education = education.rename_axis('education_id').reset_index()
+
+    return companies, industries, education
+
+# Merge a dimension frame into the jobs frame; a missing key raises KeyError like a dict lookup
+def merge_dimension(merged_df, dimension_df, key):
+    merged_df = pd.merge(merged_df, dimension_df, on=key, how='left', indicator=True)
+    missing = merged_df.loc[merged_df['_merge'] == 'left_only', key]
+    if len(missing):
+        raise KeyError(missing.iloc[0])
+    return merged_df.drop(columns='_merge')
 
 # Merge and transform job + detail data
 def transform_jobs(jobs_df, jobs_detail_df, lookups):
@@ -70,85 +118,312 @@ def transform_jobs(jobs_df, jobs_detail_df, lookups):
         how='inner'        
     )
 
-    jobs_list = []
+    companies_df, industries_df, education_df = lookup_frames(lookups)
 
-    # Iterate through merged rows to construct job documents
-    for index, row in merged_df.iterrows():
-    
-        # Get company_id from the row
-        company_id = row['company_id']
+    # Attach company, then industry (via the company, may be missing), then education details
+    merged_df = merge_dimension(merged_df, companies_df, 'company_id')
+    merged_df = pd.merge(merged_df, industries_df, on='industry_id', how='left', indicator='_industry')
+    merged_df = merge_dimension(merged_df, education_df, 'education_id')
 
-        # Look up company details
-        company_info = lookups['companies'][company_id]
+    # Handle missing industry_id
+    industry_found = merged_df['_industry'] == 'both'
+    for company_id, industry_id in merged_df.loc[
+        ~industry_found, ['company_id', 'industry_id']
+    ].itertuples(index=False):
+        print(f"Warning: Industry ID {industry_id} not found for company {company_id}")
+    industry_names = merged_df['industry_name'].where(industry_found, "Unknown")
 
-        # Get industry_id from company
-        industry_id = company_info['industry_id']
+    # Column-wise conversions
+    skills = parse_skills(merged_df['skills_requirement'], lookups['skills'])
+    posting_dates = convert_dates(merged_df['posting_date'])
+    closing_dates = convert_dates(merged_df['closing_date'])
+    remote = (merged_df['remote'] == True).tolist()
 
-        # Look up industry name with error handling
-        if industry_id in lookups['industries']:
-            industry_name = lookups['industries'][industry_id]['industry_name']
-        else:
-            # Handle missing industry_id
-            industry_name = "Unknown"
-            print(f"Warning: Industry ID {industry_id} not found for company {company_id}")
-
-        # Build company object
-        company = {
-            'company_id': company_id,
-            'name': company_info['company_name'],
-            'headquarters': company_info['company_headquarters'],
-            'size': company_info['company_size'],
-            'type': company_info['company_type'],
-            'website': company_info['company_website'],
-            'description': company_info['company_description'],
-            'industry_id': industry_id,
-            'industry_name': industry_name
-        }
+    # Numeric experience bounds ("2-4" -> 2, 4), parsed once per distinct value
+    experience_bounds = {
+        value: utils.parse_experience_range(value)
+        for value in merged_df['years_of_experience'].unique()
+    }
+    years = merged_df['years_of_experience'].map(experience_bounds).tolist()
 
-        # Get education_id from the row
-        education_id = row['education_id']
+    # Plain Python values for the document assembly
+    columns = {
+        name: merged_df[name].tolist() for name in [
+            'id', 'title', 'years_of_experience', 'description', 'responsibilities',
+            'company_id', 'company_name', 'company_headquarters', 'company_size',
+            'company_type', 'company_website', 'company_description', 'industry_id',
+            'education_id', 'level', 'field', 'employment_type', 'average_salary',
+            'benefits', 'job_posting_url'
+        ]
+    }
+    columns['industry_name'] = industry_names.tolist()
 
-        # Look up education details
-        education_info = lookups['education'][education_id]
+    jobs_list = []
 
-        # Build education object
-        education = {
-            'education_id': education_id,
-            'level': education_info['level'],
-            'field': education_info['field']
+    # Construct one job document per merged row
+    for i in range(len(merged_df)):
+        years_min, years_max = years[i]
+
+        job_doc = {
+            'job_id': int(columns['id'][i]),
+            'title': columns['title'][i],
+            'years_of_experience': columns['years_of_experience'][i],
+            'years_min': years_min,
+            'years_max': years_max,
+            'description': columns['description'][i],
+            'responsibilities': columns['responsibilities'][i],
+            'company': {
+                'company_id': columns['company_id'][i],
+                'name': columns['company_name'][i],
+                'headquarters': columns['company_headquarters'][i],
+                'size': columns['company_size'][i],
+                'type': columns['company_type'][i],
+                'website': columns['company_website'][i],
+                'description': columns['company_description'][i],
+                'industry_id': columns['industry_id'][i],
+                'industry_name': columns['industry_name'][i]
+            },
+            'education': {
+                'education_id': columns['education_id'][i],
+                'level': columns['level'][i],
+                'field': columns['field'][i]
+            },
+            'skills': skills[i],
+            'employment_type': columns['employment_type'][i],
+            'average_salary': int(columns['average_salary'][i]),
+            'benefits': columns['benefits'][i],
+            'remote': remote[i],
+            'job_posting_url': columns['job_posting_url'][i],
+            'posting_date': posting_dates[i],
+            'closing_date': closing_dates[i]
         }
 
-        # Use the parse_skills function
-        skills = parse_skills(row['skills_requirement'], lookups['skills'])
+        # Lowercase lookup fields used by the indexed API routes
+        job_doc['normalized'] = utils.build_normalized_fields(job_doc)
 
-        # Use the convert_date function
-        posting_date = convert_date(row['posting_date'])
-        closing_date = convert_date(row['closing_date'])
+        jobs_list.append(job_doc)
 
-        # Convert to boolean
-        remote = row['remote'] == True
+    return jobs_list
 
-        job_doc = {
-            'job_id': int(row['id']),  
-            'title': row['title'],
-            'years_of_experience': row['years_of_experience'],
-            'description': row['description'],
-            'responsibilities': row['responsibilities'],
-            'company': company,
-            'education': education,
-            'skills': skills,
-            'employment_type': row['employment_type'],
-            'average_salary': int(row['average_salary']),
-            'benefits': row['benefits'],
-            'remote': remote,
-            'job_posting_url': row['job_posting_url'],
-            'posting_date': posting_date,
-            'closing_date': closing_date
+# Read the next chunk of a job file into its side's buffer (done when the file is exhausted)
+def read_next_chunk(side):
+    chunk = next(side['reader'], None)
+    if chunk is None or chunk.empty:
+        side['done'] = True
+        return
+
+    ids = chunk[side['key']]
+    if not ids.is_monotonic_increasing or not ids.is_unique or (
+        side['last_id'] is not None and ids.iloc[0] <= side['last_id']
+    ):
+        raise ValueError(f"Streaming mode needs the rows sorted by a unique '{side['key']}'")
+
+    side['buffer'] = chunk if side['buffer'] is None else pd.concat([side['buffer'], chunk])
+    side['last_id'] = ids.iloc[-1]
+
+# Take the buffered rows with an id up to 'boundary' (all of them when boundary is None)
+def release_rows(side, boundary):
+    buffer = side['buffer']
+    if buffer is None or boundary is None:
+        side['buffer'] = None
+        return buffer
+
+    complete = buffer[side['key']] <= boundary
+    side['buffer'] = buffer[~complete]
+    return buffer[complete]
+
+# Read jobs.csv and jobs_detail.csv in chunks and yield (jobs, details) frames to merge
+# Both files are sorted by job id, so this is a merge join: ids up to the smaller
+# "last id read" of the two files are complete on both sides and can be released
+def read_job_chunks(chunksize, data_dir='data'):
+    jobs_side = {'reader': pd.read_csv(os.path.join(data_dir, 'jobs.csv'), chunksize=chunksize), 'key': 'id'}
+    details_side = {
+        'reader': pd.read_csv(os.path.join(data_dir, 'jobs_detail.csv'), chunksize=chunksize),
+        'key': 'job_id'
+    }
+    sides = [jobs_side, details_side]
+    for side in sides:
+        side.update({'buffer': None, 'last_id': None, 'done': False})
+
+    while True:
+        # Only read from the file(s) that are behind, so neither buffer runs ahead
+        pending = [side for side in sides if not side['done']]
+        last_ids = [side['last_id'] for side in pending]
+        behind = None if None in last_ids else min(last_ids, default=None)
+        for side in pending:
+            if side['last_id'] is None or side['last_id'] == behind:
+                read_next_chunk(side)
+
+        # An exhausted file puts no limit on the ids that are complete
+        pending = [side for side in sides if not side['done']]
+        boundary = min((side['last_id'] for side in pending), default=None)
+
+        jobs_rows = release_rows(jobs_side, boundary)
+        details_rows = release_rows(details_side, boundary)
+        if jobs_rows is not None and details_rows is not None and len(jobs_rows) and len(details_rows):
+            yield jobs_rows, details_rows
+
+        if not pending:
+            break
+
+# Transform the jobs chunk by chunk; yields one list of job documents per chunk
+def transform_jobs_chunked(lookups, chunksize, data_dir='data'):
+    for jobs_chunk, details_chunk in read_job_chunks(chunksize, data_dir):
+        yield transform_jobs(jobs_chunk, details_chunk, lookups)
+
+# Split the jobs into 'shards' ranges of consecutive job_ids; yields (jobs, details) frames
+def shard_jobs(jobs_df, jobs_detail_df, shards):
+    jobs_df = jobs_df.sort_values('id', kind='stable')
+    jobs_detail_df = jobs_detail_df.sort_values('job_id', kind='stable')
+    job_ids = jobs_df['id'].to_numpy()
+    detail_ids = jobs_detail_df['job_id'].to_numpy()
+
+    for shard_ids in np.array_split(np.unique(job_ids), shards):
+        if len(shard_ids) == 0:
+            continue
+        low, high = shard_ids[0], shard_ids[-1]
+        yield (
+            jobs_df.iloc[np.searchsorted(job_ids, low, 'left'):np.searchsorted(job_ids, high, 'right')],
+            jobs_detail_df.iloc[np.searchsorted(detail_ids, low, 'left'):np.searchsorted(detail_ids, high, 'right')]
+        )
+
+# State of a worker process, set once by the pool initializer instead of being sent with every shard
+worker_state = {}
+
+def init_worker(lookups, output_format=None):
+    worker_state['lookups'] = lookups
+    worker_state['output_format'] = output_format
+
+# Transform one shard in a worker; with an output format the documents are also encoded there
+def transform_shard(shard):
+    jobs_shard, details_shard = shard
+    jobs = transform_jobs(jobs_shard, details_shard, worker_state['lookups'])
+    if worker_state['output_format'] is None:
+        return jobs
+    return [encode_document(job, worker_state['output_format']) for job in jobs]
+
+# Transform (jobs, details) shards on a pool of 'workers' processes
+# Yields one list of documents per shard, in shard order; only a few shards are in flight
+# at a time, so a streamed input is not read ahead of the output
+def transform_jobs_parallel(job_pairs, lookups, workers, output_format=None):
+    with multiprocessing.Pool(workers, initializer=init_worker, initargs=(lookups, output_format)) as pool:
+        pending = deque()
+        for shard in job_pairs:
+            pending.append(pool.apply_async(transform_shard, (shard,)))
+            if len(pending) >= workers * 2:
+                yield pending.popleft().get()
+        while pending:
+            yield pending.popleft().get()
+
+# Manifest of the previous incremental run; bump MANIFEST_VERSION when the job document
+# layout changes, so the next run rebuilds everything
+MANIFEST_VERSION = 1
+DEFAULT_MANIFEST = 'transform_manifest.json'
+
+# Dimension columns that end up inside job documents (other columns do not affect jobs)
+DIMENSION_COLUMNS = {
+    'companies': None,  # every column
+    'industries': ['industry_name'],
+    'education': None,
+    'skills': None
+}
+
+# Content hash of every row, keyed by the row's id (as a string, like JSON object keys)
+def row_hashes(df, key, columns=None):
+    hashes = pd.util.hash_pandas_object(df if columns is None else df[columns], index=False)
+    return dict(zip(df[key].astype(str).tolist(), (f"{h:016x}" for h in hashes.tolist())))
+
+# Ids that were added, changed or removed between two sets of row hashes
+def changed_keys(previous, current):
+    changed = {key for key, row_hash in current.items() if previous.get(key) != row_hash}
+    return changed | (previous.keys() - current.keys())
+
+# Read the manifest of the previous run (None on the first run)
+def load_manifest(filename):
+    try:
+        with open(filename, 'r', encoding='utf-8') as f:
+            return json.load(f)
+    except FileNotFoundError:
+        return None
+
+# Replace the manifest atomically, so an interrupted run leaves the previous one intact
+def save_manifest(manifest, filename):
+    temp_file = filename + '.tmp'
+    with open(temp_file, 'w', encoding='utf-8') as f:
+        json.dump(manifest, f)
+    os.replace(temp_file, filename)
+    print(f"✓ Saved manifest of {len(manifest['jobs'])} jobs to {filename}")
+
+# Rebuild only the jobs that changed since the manifest was written
+# A job is rebuilt when its own jobs.csv / jobs_detail.csv row changed, or when a company,
+# industry (through the company), education or skill row it embeds changed.
+# Returns {'inserted': [...], 'updated': [...], 'deleted': [job_id, ...], 'manifest': {...}}
+def transform_jobs_incremental(jobs_df, jobs_detail_df, dimensions, lookups, manifest):
+    # The rows a job document is built from: its jobs.csv row joined with its details
+    merged_df = pd.merge(jobs_df, jobs_detail_df, left_on='id', right_on='job_id', how='inner')
+    job_keys = merged_df['id'].astype(str)
+
+    current = {
+        'version': MANIFEST_VERSION,
+        'jobs': row_hashes(merged_df, 'id'),
+        **{
+            name: row_hashes(df, 'id', DIMENSION_COLUMNS[name])
+            for name, df in dimensions.items()
         }
+    }
 
-        jobs_list.append(job_doc)
+    if manifest is None or manifest.get('version') != MANIFEST_VERSION:
+        previous = {'jobs': {}}
+        rebuild = pd.Series(True, index=merged_df.index)
+    else:
+        previous = manifest
+        changed = {name: changed_keys(previous.get(name, {}), current[name]) for name in dimensions}
 
-    return jobs_list
+        # Jobs whose own row is new or different
+        rebuild = job_keys.map(previous['jobs']) != job_keys.map(current['jobs'])
+
+        # Fan out dimension changes to the jobs that embed them; a company also changes with its industry
+        companies_df = dimensions['companies']
+        company_industries = companies_df['industry_id'].astype(str)
+        changed_companies = changed['companies'] | set(
+            companies_df.loc[company_industries.isin(changed['industries']), 'id'].astype(str)
+        )
+        rebuild |= merged_df['company_id'].astype(str).isin(changed_companies)
+        rebuild |= merged_df['education_id'].astype(str).isin(changed['education'])
+        if changed['skills']:
+            skill_ids = explode_skill_ids(merged_df['skills_requirement']).astype(str)
+            uses_changed_skill = skill_ids.isin(changed['skills']).groupby(level=0).any()
+            rebuild |= uses_changed_skill.reindex(merged_df.index, fill_value=False)
+
+    rebuild_ids = merged_df.loc[rebuild, 'id']
+    jobs = transform_jobs(
+        jobs_df[jobs_df['id'].isin(rebuild_ids)],
+        jobs_detail_df[jobs_detail_df['job_id'].isin(rebuild_ids)],
+        lookups
+    )
+
+    delta = {'inserted': [], 'updated': [], 'deleted': [], 'manifest': current}
+    for job in jobs:
+        delta['updated' if str(job['job_id']) in previous['jobs'] else 'inserted'].append(job)
+    delta['deleted'] = sorted(int(key) for key in previous['jobs'].keys() - current['jobs'].keys())
+
+    print(f"✓ {len(delta['inserted'])} inserted, {len(delta['updated'])} changed, "
+          f"{len(delta['deleted'])} deleted, {len(merged_df) - len(jobs)} unchanged jobs")
+    return delta
+
+# Save the changes of an incremental run as NDJSON: one {"op", "job_id", "document"} per line
+def save_delta(delta, filename):
+    print(f"Saving changes to {filename}...")
+
+    with open(filename, 'w', encoding='utf-8') as f:
+        for change, op in [('inserted', 'insert'), ('updated', 'update')]:
+            for job in delta[change]:
+                line = {"op": op, "job_id": job['job_id'], "document": job}
+                f.write(json.dumps(line, ensure_ascii=False) + '\n')
+        for job_id in delta['deleted']:
+            f.write(json.dumps({"op": "delete", "job_id": job_id}) + '\n')
+
+    print(f"✓ Successfully saved {filename}")
 
 # Transform industries data
 def transform_industries(industries_df):   
@@ -171,46 +446,265 @@ def save_json(data, filename):
     
     print(f"✓ Successfully saved {filename}")
 
-def main():
+# Encode one job for save_json_stream: 'json' indents it as an element of the jobs.json array
+def encode_document(document, output_format='json'):
+    if output_format == 'ndjson':
+        return json.dumps(document, ensure_ascii=False)
+    # Same layout as json.dump(list, indent=2): each element indented one level
+    return json.dumps(document, indent=2, ensure_ascii=False).replace('\n', '\n  ')
+
+# Save job documents as they are produced, without holding them all in memory
+# 'json' writes the same array (and formatting) as save_json, 'ndjson' one document per line
+# Documents may already be encoded with encode_document (e.g. by the worker processes)
+def save_json_stream(chunks, filename, output_format='json'):
+    print(f"Streaming data to {filename}...")
+    count = 0
+
+    with open(filename, 'w', encoding='utf-8') as f:
+        if output_format == 'json':
+            f.write('[')
+        for documents in chunks:
+            for document in documents:
+                if not isinstance(document, str):
+                    document = encode_document(document, output_format)
+                if output_format == 'ndjson':
+                    f.write(document + '\n')
+                else:
+                    f.write((',\n  ' if count else '\n  ') + document)
+                count += 1
+        if output_format == 'json':
+            f.write('\n]' if count else ']')
+
+    print(f"✓ Successfully saved {count} documents to {filename}")
+    return count
+
+# Fields of a stored job that the transform does not produce (ignored when comparing)
+STORED_ONLY_FIELDS = {'_id': 0, 'version': 0, 'updated_at': 0}
+
+# Regroup chunks of documents into batches of 'batch_size'
+def iter_batches(chunks, batch_size):
+    batch = []
+    for documents in chunks:
+        for document in documents:
+            batch.append(document)
+            if len(batch) >= batch_size:
+                yield batch
+                batch = []
+    if batch:
+        yield batch
+
+# Write documents into a collection with batched, unordered upserts keyed on 'key'
+# Documents equal to the stored ones are skipped, so loading the same feed twice writes nothing
+# With 'versioned', written documents get version + 1 and a new updated_at (the API's ETags use them)
+def upsert_documents(collection, chunks, key, batch_size=1000, versioned=False):
+    stats = {'documents': 0, 'inserted': 0, 'updated': 0, 'unchanged': 0, 'failed': 0}
+    started = time.perf_counter()
+
+    for batch in iter_batches(chunks, batch_size):
+        # One read per batch to find the documents that are new or changed
+        keys = [document[key] for document in batch]
+        stored = {
+            document[key]: document
+            for document in collection.find({key: {"$in": keys}}, STORED_ONLY_FIELDS)
+        }
+
+        operations = []
+        now = datetime.now(timezone.utc)
+        for document in batch:
+            if stored.get(document[key]) == document:
+                continue
+            update = {"$set": dict(document)}
+            if versioned:
+                update["$set"]["updated_at"] = now
+                update["$inc"] = {"version": 1}
+            operations.append(UpdateOne({key: document[key]}, update, upsert=True))
+
+        stats['documents'] += len(batch)
+        stats['unchanged'] += len(batch) - len(operations)
+        if not operations:
+            continue
+
+        try:
+            result = collection.bulk_write(operations, ordered=False).bulk_api_result
+        except BulkWriteError as e:
+            # Unordered: the other operations of the batch were still applied
+            result = e.details
+            stats['failed'] += len(result.get('writeErrors', []))
+        stats['inserted'] += result.get('nUpserted', 0)
+        stats['updated'] += result.get('nModified', 0)
+
+    stats['seconds'] = time.perf_counter() - started
+    return stats
+
+# Print what a load wrote and how fast
+def report_load(name, stats):
+    rate = stats['documents'] / stats['seconds'] if stats['seconds'] else 0.0
+    print(f"✓ {name}: {stats['documents']} documents in {stats['seconds']:.2f}s ({rate:,.0f} docs/s) - "
+          f"{stats['inserted']} inserted, {stats['updated']} updated, "
+          f"{stats['unchanged']} unchanged, {stats['failed']} failed")
+
+# Load the transformed documents straight into MongoDB (instead of JSON files + mongoimport)
+# 'db' is a pymongo Database (or a compatible mock), 'job_chunks' an iterable of job lists,
+# 'deleted_job_ids' jobs to remove (from an incremental run)
+def load_to_mongo(db, job_chunks, industries, batch_size=1000, deleted_job_ids=()):
+    # The unique job_id index makes every upsert an index lookup
+    indexes.ensure_indexes(db.jobs)
+    db.industries.create_index("industry_id", name="industry_id_unique", unique=True)
+
+    job_stats = upsert_documents(db.jobs, job_chunks, 'job_id', batch_size, versioned=True)
+    report_load("jobs", job_stats)
+    deleted = 0
+    for start in range(0, len(deleted_job_ids), batch_size):
+        batch = list(deleted_job_ids[start:start + batch_size])
+        deleted += db.jobs.delete_many({"job_id": {"$in": batch}}).deleted_count
+    if deleted_job_ids:
+        print(f"✓ jobs: {deleted} deleted")
+    industry_stats = upsert_documents(db.industries, [industries], 'industry_id', batch_size)
+    report_load("industries", industry_stats)
+
+    # Keep the API consistent: new job_ids start after the loaded ones,
+    # and the list ETags change when jobs did
+    ids.JobIdAllocator(db.counters, db.jobs).seed()
+    if job_stats['inserted'] or job_stats['updated'] or deleted:
+        db.counters.update_one({"_id": "jobs_generation"}, {"$inc": {"seq": 1}}, upsert=True)
+
+    return job_stats, industry_stats
+
+# Command line options
+def parse_args(argv=None):
+    parser = argparse.ArgumentParser(description="Transform the CareerHub CSV files into JSON collections.")
+    parser.add_argument('--data-dir', default='data',
+                        help="folder with the six CSV files (default: data)")
+    parser.add_argument('--stream', action='store_true',
+                        help="read the job files in chunks and write jobs incrementally (flat memory use)")
+    parser.add_argument('--chunksize', type=int, default=50000,
+                        help="rows read per chunk in streaming mode (default: 50000)")
+    parser.add_argument('--format', choices=['json', 'ndjson'], default='json', dest='output_format',
+                        help="jobs output: a JSON array or NDJSON, one job per line (default: json)")
+    parser.add_argument('--output', default=None,
+                        help="jobs output file (default: jobs.json, or jobs.ndjson for --format ndjson)")
+    parser.add_argument('--workers', type=int, default=1,
+                        help="transform the jobs on this many processes, in job_id ranges (default: 1)")
+    parser.add_argument('--incremental', action='store_true',
+                        help="only rebuild the jobs that changed since the last run and output the changes")
+    parser.add_argument('--manifest', default=DEFAULT_MANIFEST,
+                        help=f"row hashes of the last incremental run (default: {DEFAULT_MANIFEST})")
+    parser.add_argument('--load', action='store_true',
+                        help="upsert the documents straight into MongoDB instead of writing JSON files")
+    parser.add_argument('--mongo-uri', default='mongodb://localhost:27017',
+                        help="MongoDB connection string for --load (default: mongodb://localhost:27017)")
+    parser.add_argument('--db', default='careerhub',
+                        help="database for --load (default: careerhub)")
+    parser.add_argument('--batch-size', type=int, default=1000,
+                        help="documents per bulk write for --load (default: 1000)")
+    args = parser.parse_args(argv)
+    if args.incremental and (args.stream or args.workers > 1):
+        parser.error("--incremental cannot be combined with --stream or --workers")
+    return args
+
+def main(argv=None, db=None):
     """
     Main execution function.
     Orchestrates the entire transformation process.
+    'db' replaces the --mongo-uri connection for --load (e.g. a test database).
     """
+    args = parse_args(argv)
+
     print("="*60)
     print("CareerHub Data Transformation Script")
     print("="*60)
     
-    # Step 1: Load all CSV files
+    # Step 1: Load all CSV files (only the dimension tables when streaming)
     print("\n[1/5] Loading CSV files...")
-    jobs_df, jobs_detail_df, companies_df, industries_df, education_df, skills_df = load_data()
+    if args.stream:
+        companies_df, industries_df, education_df, skills_df = load_dimensions(args.data_dir)
+    else:
+        jobs_df, jobs_detail_df, companies_df, industries_df, education_df, skills_df = load_data(args.data_dir)
     
     # Step 2: Create lookup dictionaries
     print("\n[2/5] Creating lookup dictionaries...")
     lookups = create_lookups(companies_df, industries_df, education_df, skills_df)
     
-    # Step 3: Transform jobs data
+    # Step 3: Transform jobs data (streaming or parallel: lazily, chunk by chunk, while saving in step 5)
     print("\n[3/5] Transforming jobs data...")
-    jobs = transform_jobs(jobs_df, jobs_detail_df, lookups)
+    chunked = args.stream or args.workers > 1
+    if args.workers > 1:
+        if args.stream:
+            job_pairs = read_job_chunks(args.chunksize, args.data_dir)
+        else:
+            # A few shards per worker keeps the processes evenly busy
+            job_pairs = shard_jobs(jobs_df, jobs_detail_df, args.workers * 4)
+        # Workers also encode the documents when they are written to a file
+        output_format = None if args.load else args.output_format
+        jobs = transform_jobs_parallel(job_pairs, lookups, args.workers, output_format)
+    elif args.stream:
+        jobs = transform_jobs_chunked(lookups, args.chunksize, args.data_dir)
+    elif args.incremental:
+        dimensions = {
+            'companies': companies_df, 'industries': industries_df,
+            'education': education_df, 'skills': skills_df
+        }
+        delta = transform_jobs_incremental(
+            jobs_df, jobs_detail_df, dimensions, lookups, load_manifest(args.manifest)
+        )
+        jobs = delta['inserted'] + delta['updated']
+    else:
+        jobs = transform_jobs(jobs_df, jobs_detail_df, lookups)
     
     # Step 4: Transform industries data
     print("\n[4/5] Transforming industries data...")
     industries = transform_industries(industries_df)
     
-    # Step 5: Save to JSON files
+    # Step 5: Save to JSON files, or load into MongoDB
+    if args.load:
+        print("\n[5/5] Loading into MongoDB...")
+        if db is None:
+            db = MongoClient(args.mongo_uri)[args.db]
+        job_chunks = jobs if chunked else [jobs]
+        deleted_job_ids = delta['deleted'] if args.incremental else []
+        job_stats, industry_stats = load_to_mongo(db, job_chunks, industries, args.batch_size, deleted_job_ids)
+        if args.incremental:
+            save_manifest(delta['manifest'], args.manifest)
+
+        print("\n" + "="*60)
+        print("✓ Load Complete!")
+        print("="*60)
+        print(f"  - {job_stats['documents']} jobs loaded into {db.name}.jobs")
+        print(f"  - {industry_stats['documents']} industries loaded into {db.name}.industries")
+        return args, None
+
     print("\n[5/5] Saving to JSON files...")
-    save_json(jobs, 'jobs.json')
+    jobs_file = args.output or ('jobs.ndjson' if args.output_format == 'ndjson' else 'jobs.json')
+    if args.incremental:
+        jobs_file = args.output or 'jobs.delta.ndjson'
+        jobs_count = len(jobs) + len(delta['deleted'])
+        save_delta(delta, jobs_file)
+        save_manifest(delta['manifest'], args.manifest)
+    elif chunked:
+        jobs_count = save_json_stream(jobs, jobs_file, args.output_format)
+    elif args.output_format == 'ndjson':
+        jobs_count = save_json_stream([jobs], jobs_file, 'ndjson')
+    else:
+        jobs_count = len(jobs)
+        save_json(jobs, jobs_file)
     save_json(industries, 'industries.json')
     
     print("\n" + "="*60)
     print("✓ Transformation Complete!")
     print("="*60)
-    print(f"  - {len(jobs)} jobs saved to jobs.json")
+    print(f"  - {jobs_count} {'job changes' if args.incremental else 'jobs'} saved to {jobs_file}")
     print(f"  - {len(industries)} industries saved to industries.json")
     print("\nNext step: Import into MongoDB")
 
+    return args, jobs_file
+
 if __name__ == "__main__":
     # Run the main transformation
-    main()
+    args, jobs_file = main()
+
+    # Nothing to read back after --load; a streamed, NDJSON or delta output can be larger than memory
+    if args.load or args.incremental or args.stream or args.output_format == 'ndjson':
+        raise SystemExit(0)
     
     # Optional: Verify the output
     print("\n" + "="*60)
@@ -218,12 +712,12 @@ if __name__ == "__main__":
     print("="*60)
     
     # Load and check the saved files
-    with open('jobs.json', 'r') as f:
+    with open(jobs_file, 'r') as f:
         jobs_data = json.load(f)
-        print(f"✓ jobs.json contains {len(jobs_data)} documents")
+        print(f"✓ {jobs_file} contains {len(jobs_data)} documents")
         print(f"  First job: {jobs_data[0]['title']} at {jobs_data[0]['company']['name']}")
     
     with open('industries.json', 'r') as f:
         industries_data = json.load(f)
         print(f"✓ industries.json contains {len(industries_data)} documents")
-        print(f"  First industry: {industries_data[0]['industry_name']}")
\ No newline at end of file
+        print(f"  First industry: {industries_data[0]['industry_name']}")
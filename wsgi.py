@@ -0,0 +1,5 @@
+from app import create_app
+
+# Production entry point: gunicorn loads this module (see gunicorn.conf.py for the server settings)
+# Settings come from the environment (see app/config.py)
+app = create_app()